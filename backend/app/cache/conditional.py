@@ -0,0 +1,69 @@
+import hashlib
+from datetime import timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request
+from fastapi.responses import Response
+
+# ✅ 조건부 GET (ETag / Last-Modified → 304 Not Modified)
+# 본문을 만들기 전에 id·updated_at 같은 가벼운 값만 조회해서 검증자를 만들고,
+# 클라이언트가 가진 것과 같으면 본문 조회/직렬화 없이 304로 응답
+# updated_at은 timezone 없는 컬럼이라 UTC로 간주 (같은 규칙으로만 비교하므로 일관성만 있으면 됨)
+
+
+def make_etag(*parts):
+    # 강한 ETag: 응답을 결정하는 값(경로+쿼리, id, updated_at 등)의 해시
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def latest(*stamps):
+    stamps = [stamp for stamp in stamps if stamp is not None]
+    return max(stamps) if stamps else None
+
+
+def http_date(value):
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def _etag_matches(header, etag):
+    # If-None-Match는 약한 비교 (W/ 접두어 무시)
+    if header.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+
+def _not_modified_since(header, last_modified):
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+    # HTTP 날짜는 초 단위까지만 표현됨
+    return last_modified.replace(microsecond=0) <= since
+
+
+def set_validators(response, etag, last_modified=None):
+    response.headers["ETag"] = etag
+    if last_modified is not None:
+        response.headers["Last-Modified"] = http_date(last_modified)
+    # 저장은 하되 매번 재검증 (변경 없으면 304라 비용이 작음)
+    response.headers["Cache-Control"] = "no-cache"
+    return response
+
+
+def not_modified(request: Request, etag, last_modified=None):
+    # 클라이언트 사본이 최신이면 304 응답, 아니면 None
+    # If-None-Match가 있으면 If-Modified-Since보다 우선 (RFC 9110)
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        fresh = _etag_matches(if_none_match, etag)
+    else:
+        if_modified_since = request.headers.get("if-modified-since")
+        fresh = bool(if_modified_since and last_modified and _not_modified_since(if_modified_since, last_modified))
+    if not fresh:
+        return None
+    return set_validators(Response(status_code=304), etag, last_modified)
@@ -0,0 +1,114 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from dotenv import load_dotenv
+from pydantic import BaseModel
+
+load_dotenv()  # .env 파일 자동 로드
+
+# ✅ 로그인 유저 정보 캐시 (get_current_user용, user_id → 필요한 필드만, TTL + LRU)
+# - 인증이 필요한 요청마다 users 테이블을 조회하던 것을 TTL 동안 메모리에서 처리
+# - 유저 정보를 바꾸는 핸들러(patch_info, delete_info, additional_info)가 해당 id를 무효화
+# - 워커 프로세스마다 따로 가지므로 다른 워커에는 최대 TTL만큼 늦게 반영됨 → TTL은 짧게
+
+IDENTITY_CACHE_ENABLED = os.getenv("IDENTITY_CACHE_ENABLED", "true").lower() == "true"
+IDENTITY_CACHE_TTL = float(os.getenv("IDENTITY_CACHE_TTL", "60"))
+IDENTITY_CACHE_MAX_ENTRIES = int(os.getenv("IDENTITY_CACHE_MAX_ENTRIES", "10000"))
+
+
+class CurrentUser(BaseModel):
+    # profile_data / 권한 확인에 필요한 필드만
+    id: int
+    email: Optional[str]
+    name: Optional[str]
+    nickname: Optional[str]
+    role: Optional[str]
+
+    class Config:
+        from_attributes = True
+
+
+class IdentityCache:
+    def __init__(self, ttl=IDENTITY_CACHE_TTL, max_entries=IDENTITY_CACHE_MAX_ENTRIES, enabled=IDENTITY_CACHE_ENABLED):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # user_id → (만료시각, CurrentUser)
+        # 무효화할 때마다 증가. DB 조회 도중 무효화가 끼어들면 조회 결과(옛 값)를 저장하지 않음
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self.skipped_sets = 0
+
+    def get(self, user_id):
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and entry[0] < time.monotonic():
+                del self._entries[user_id]
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return entry[1]
+
+    def generation(self):
+        # DB 조회 전에 받아 두었다가 set()에 넘김
+        with self._lock:
+            return self._generation
+
+    def set(self, user_id, user: CurrentUser, generation):
+        if not self.enabled:
+            return
+        with self._lock:
+            if generation != self._generation:
+                self.skipped_sets += 1
+                return
+            self._entries[user_id] = (time.monotonic() + self.ttl, user)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, *user_ids):
+        with self._lock:
+            self._generation += 1
+            self.invalidations += 1
+            for user_id in user_ids:
+                self._entries.pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "ttl": self.ttl,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+                "skipped_sets": self.skipped_sets,
+            }
+
+
+identity_cache = IdentityCache()
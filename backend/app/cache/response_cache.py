@@ -0,0 +1,209 @@
+import importlib
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+from dotenv import load_dotenv
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse, Response
+
+from data.postgresDB import ASYNC_REPLICA_DATABASE_URL, READ_YOUR_WRITES_SECONDS
+
+load_dotenv()  # .env 파일 자동 로드
+
+# ✅ GET 응답 캐시 (라우트 + 쿼리 파라미터 단위, TTL + LRU)
+# - 응답은 직렬화된 JSON 바이트로 저장 → 히트 시 검증/직렬화 없이 바로 반환
+# - 각 항목에 태그(예: "parent_forum:post:3")를 달고, 쓰기 핸들러가 바뀐 행의 태그만 무효화
+# - 기본 백엔드는 워커 프로세스 메모리. 멀티 워커에서 무효화를 공유하려면
+#   RESPONSE_CACHE_BACKEND="모듈경로:클래스명" 으로 CacheBackend 구현(예: Redis)을 지정
+
+RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() == "true"
+RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "30"))
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "1024"))
+RESPONSE_CACHE_BACKEND = os.getenv("RESPONSE_CACHE_BACKEND")
+# 복제본을 쓰는 경우, 무효화 직후 이 시간(초) 동안은 같은 태그를 다시 저장하지 않음
+# (복제본이 아직 옛 데이터를 주는 동안 그걸 캐시에 다시 채워 넣는 것 방지)
+RESPONSE_CACHE_SETTLE_SECONDS = READ_YOUR_WRITES_SECONDS if ASYNC_REPLICA_DATABASE_URL else 0
+
+
+class CacheBackend(ABC):
+    # 백엔드 인터페이스: 값은 bytes, 태그 단위 무효화를 지원해야 함 (빠진 메서드가 있으면 생성 시점에 TypeError)
+    @abstractmethod
+    def get(self, key):
+        ...
+
+    @abstractmethod
+    def set(self, key, value, ttl, tags):
+        ...
+
+    @abstractmethod
+    def invalidate_tags(self, tags):
+        ...
+
+    @abstractmethod
+    def clear(self):
+        ...
+
+    def stats(self):
+        return {}
+
+
+class MemoryBackend(CacheBackend):
+    def __init__(self, max_entries=RESPONSE_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key → (만료시각, 값, 태그)
+        self._tags = {}                # 태그 → {key}
+        self.evictions = 0
+        self.expirations = 0
+
+    def _remove(self, key):
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, value, ttl, tags):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + ttl, value, tuple(tags))
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate_tags(self, tags):
+        removed = 0
+        with self._lock:
+            for tag in tags:
+                for key in list(self._tags.get(tag, ())):
+                    self._remove(key)
+                    removed += 1
+        return removed
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "tags": len(self._tags),
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+def load_backend(path):
+    if not path:
+        return MemoryBackend()
+    module_name, _, class_name = path.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)()
+
+
+class ResponseCache:
+    def __init__(self, backend, ttl=RESPONSE_CACHE_TTL, enabled=RESPONSE_CACHE_ENABLED):
+        self.backend = backend
+        self.ttl = ttl
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._invalidated_at = {}
+        self.hits = 0
+        self.misses = 0
+        self.skipped_sets = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def key(request: Request):
+        # 라우트 경로 + 정렬된 쿼리 파라미터 (파라미터 순서가 달라도 같은 키)
+        params = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+        return f"{request.url.path}?{params}"
+
+    @staticmethod
+    def _versioned(key, version):
+        # version(예: ETag)을 키에 포함 → 다른 워커에서 바뀌어 이 워커 캐시가 무효화되지 않았더라도
+        # 방금 계산한 버전과 다른 옛 본문은 꺼내지 않음 (옛 버전 항목은 TTL/LRU로 정리)
+        return key if version is None else f"{key}#{version}"
+
+    def get(self, key, version=None):
+        if not self.enabled:
+            return None
+        body = self.backend.get(self._versioned(key, version))
+        with self._lock:
+            if body is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return Response(content=body, media_type="application/json", headers={"X-Cache": "HIT"})
+
+    def set(self, key, content, tags, ttl=None, raw=False, version=None):
+        # content를 JSON(orjson)으로 직렬화해서 저장하고, 그대로 응답으로 돌려줌
+        # raw=True: 이미 dict/list 원시 값이면 jsonable_encoder 변환 없이 바로 직렬화
+        body = ORJSONResponse(content if raw else jsonable_encoder(content)).body
+        if self.enabled:
+            if self._recently_invalidated(tags):
+                with self._lock:
+                    self.skipped_sets += 1
+            else:
+                self.backend.set(self._versioned(key, version), body, ttl or self.ttl, tags)
+        return Response(content=body, media_type="application/json", headers={"X-Cache": "MISS"})
+
+    def invalidate(self, *tags):
+        if not self.enabled or not tags:
+            return
+        now = time.monotonic()
+        with self._lock:
+            self.invalidations += 1
+            for tag in tags:
+                self._invalidated_at[tag] = now
+            if len(self._invalidated_at) > RESPONSE_CACHE_MAX_ENTRIES:
+                cutoff = now - RESPONSE_CACHE_SETTLE_SECONDS
+                self._invalidated_at = {t: at for t, at in self._invalidated_at.items() if at >= cutoff}
+        self.backend.invalidate_tags(tags)
+
+    def _recently_invalidated(self, tags):
+        cutoff = time.monotonic() - RESPONSE_CACHE_SETTLE_SECONDS
+        with self._lock:
+            return any(self._invalidated_at.get(tag, 0) >= cutoff for tag in tags)
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            data = {
+                "enabled": self.enabled,
+                "backend": type(self.backend).__name__,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "skipped_sets": self.skipped_sets,
+                "invalidations": self.invalidations,
+            }
+        data.update(self.backend.stats())
+        return data
+
+
+response_cache = ResponseCache(load_backend(RESPONSE_CACHE_BACKEND))
@@ -1,21 +1,33 @@
-from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import datetime
+from typing import List, Literal, Optional, get_args
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import RedirectResponse
-from sqlalchemy.orm import Session
-from data.postgresDB import SessionLocal
+from sqlalchemy import delete, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from data.postgresDB import get_db, get_read_db
 from app.models import CustomerSupport
+from app.cache.response_cache import response_cache
+from app.cache.conditional import latest, make_etag, not_modified, set_validators
+from app.forum.pagination import encode_cursor, paginate
+from app.forum.thread import fetch_thread, thread_ids
+from app.forum.validators import thread_validators
 from pydantic import BaseModel
 from dotenv import load_dotenv
 load_dotenv()  # .env 파일 자동 로드
 
 router = APIRouter()
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+# 응답 캐시 무효화 태그
+LIST_TAG = "customer_support:list"
+
+def item_tag(list_id):
+    return f"customer_support:item:{list_id}"
+
+SupportStatus = Literal["open", "in_progress", "resolved", "closed"]
+ACTIVE_STATUSES = {"open", "in_progress"}
+# 처리 대기 큐 부분 인덱스(ix_customer_support_active_created_id)의 조건과 글자 그대로 같은 식
+# 바인드 파라미터만 있으면 prepared statement의 generic plan에서 부분 인덱스를 못 쓰므로 같이 붙임
+ACTIVE_QUEUE = text("customer_support.status IN ('open', 'in_progress')")
 
 class CustomerSupportCreate(BaseModel):
     user_id: int
@@ -25,6 +37,13 @@ class CustomerSupportCreate(BaseModel):
     content: str
     status: Optional[str] = "open"
 
+# ✅ 상태 변경 요청용: {"status": ...}
+# 예전 요청 형식(CustomerSupportCreate 그대로 보냄)도 받음 → parent_id가 있으면 그 질문을 resolved, 없으면 이 글을 open
+class CustomerSupportStatusUpdate(BaseModel):
+    status: Optional[str] = None
+    parent_id: Optional[int] = None
+    content: Optional[str] = None
+
 class CustomerSupportResponse(BaseModel):
     id: int
     user_id: int
@@ -33,6 +52,7 @@ class CustomerSupportResponse(BaseModel):
     title: Optional[str]
     content: str
     status: str
+    resolved_at: Optional[datetime] = None
 
     class Config:
         from_attribute = True  # SQLAlchemy 객체를 자동 변환
@@ -42,25 +62,91 @@ async def customer_support():
     return RedirectResponse(url="/customer-support/list")
 # 자주하는 질문 리스트로 넘어가도록
 @router.get("/list")
-async def customer_support_list(db: Session = Depends(get_db)):
-    customer_support_lists = db.query(CustomerSupport).filter(CustomerSupport.parent_id == None).all()
-    return customer_support_lists
+async def customer_support_list(
+    request: Request,
+    status: Optional[List[SupportStatus]] = Query(None, description="상태 필터 (여러 번 지정 가능, 예: status=open&status=in_progress)"),
+    category: Optional[str] = Query(None, description="카테고리 필터"),
+    user_id: Optional[int] = Query(None, description="작성자 필터"),
+    page: int = Query(1, ge=1, description="페이지 번호"),
+    size: int = Query(20, ge=1, le=100, description="한 페이지당 질문 수"),
+    cursor: Optional[str] = Query(None, description="커서 모드: 첫 페이지는 빈 값, 이후엔 next_cursor"),
+    db: AsyncSession = Depends(get_read_db),
+):
+    cache_key = response_cache.key(request)
+    # 질문(최상위 글)만, 필터는 부분 인덱스 조건(parent_id IS NULL, status)과 맞춰서 적용
+    filters = [CustomerSupport.parent_id == None]
+    if status:
+        filters.append(CustomerSupport.status.in_(status))
+        if set(status) <= ACTIVE_STATUSES:
+            filters.append(ACTIVE_QUEUE)
+    if category:
+        filters.append(CustomerSupport.category == category)
+    if user_id is not None:
+        filters.append(CustomerSupport.user_id == user_id)
+
+    # 페이지에 들어갈 행들의 id/상태/updated_at만 먼저 보고 ETag 생성 → 바뀐 게 없으면 304
+    versions = (await db.execute(paginate(
+        select(CustomerSupport.id, CustomerSupport.status, CustomerSupport.updated_at).where(*filters),
+        CustomerSupport, page, size, cursor,
+    ))).all()
+    etag = make_etag(cache_key, [tuple(row) for row in versions])
+    last_modified = latest(*(row.updated_at for row in versions))
+    unchanged = not_modified(request, etag, last_modified)
+    if unchanged is not None:
+        return unchanged
+    cached = response_cache.get(cache_key, etag)
+    if cached is not None:
+        return set_validators(cached, etag, last_modified)
+
+    results = (await db.scalars(paginate(
+        select(CustomerSupport).where(*filters), CustomerSupport, page, size, cursor,
+    ))).all()
+    has_more = cursor is not None and len(results) > size
+    results = results[:size]
+    if cursor is None:
+        content = results  # 기존 page 방식 (호환용): 질문 배열
+    else:
+        last = results[-1] if has_more else None
+        content = {
+            "items": results,
+            "next_cursor": encode_cursor(last.created_at, last.id) if last else None,
+        }
+    tags = [LIST_TAG, *(item_tag(post.id) for post in results)]
+    return set_validators(response_cache.set(cache_key, content, tags, version=etag), etag, last_modified)
 
 @router.get("/list/{list_id}")
-async def customer_support_by_id(list_id: int, db: Session = Depends(get_db)):
+async def customer_support_by_id(
+    request: Request,
+    list_id: int,
+    max_depth: int = Query(10, ge=0, le=50, description="답변 트리 최대 깊이"),
+    max_children: int = Query(100, ge=1, le=500, description="글 하나당 최대 답변 수"),
+    db: AsyncSession = Depends(get_read_db),
+):
+    cache_key = response_cache.key(request)
     try:
-        post = db.query(CustomerSupport).filter(CustomerSupport.id == list_id).first()
+        etag, last_modified = await thread_validators(db, CustomerSupport, cache_key, list_id, max_depth, max_children)
+        if etag is None:
+            return {"message": "존재하지 않는 게시물입니다."}
+        unchanged = not_modified(request, etag, last_modified)
+        if unchanged is not None:
+            return unchanged
+        cached = response_cache.get(cache_key, etag)
+        if cached is not None:
+            return set_validators(cached, etag, last_modified)
+        # 질문 + 모든 답변(작성자 닉네임 포함)을 재귀 CTE 한 번으로 조회
+        post = await fetch_thread(db, CustomerSupport, list_id, max_depth, max_children)
         if not post:
             return {"message": "존재하지 않는 게시물입니다."}
-        return post
+        tags = [item_tag(post_id) for post_id in thread_ids(post)]
+        return set_validators(response_cache.set(cache_key, post, tags, version=etag), etag, last_modified)
     except Exception as e:
         return {"error": f"Error: {e}"}
 
 @router.post("/list",response_model=CustomerSupportResponse)
-async def customer_support_create(request: CustomerSupportCreate, db: Session = Depends(get_db)):
+async def customer_support_create(request: CustomerSupportCreate, db: AsyncSession = Depends(get_db)):
     # 1. parent_id가 있으면 부모 글이 존재하는지 체크
     if request.parent_id:
-        parent = db.query(CustomerSupport).filter(CustomerSupport.id == request.parent_id).first()
+        parent = await db.scalar(select(CustomerSupport).where(CustomerSupport.id == request.parent_id))
         if not parent:
             raise HTTPException(status_code=404, detail="Parent post not found")
     # 2. 객체 생성
@@ -74,28 +160,45 @@ async def customer_support_create(request: CustomerSupportCreate, db: Session =
     )
     # 3. DB 저장
     db.add(new_post)
-    db.commit()
-    db.refresh(new_post)
+    await db.commit()
+    await db.refresh(new_post)
+    # 목록에는 질문(최상위 글)만 나오므로 질문이 추가될 때만 목록 무효화
+    # 답변이면 부모 글이 들어 있는 질문 상세(트리)만 무효화
+    if new_post.parent_id:
+        response_cache.invalidate(item_tag(new_post.parent_id))
+    else:
+        response_cache.invalidate(LIST_TAG)
 
     return new_post
 @router.patch("/list/{list_id}",response_model=CustomerSupportResponse)
-async def customer_support_update(request: CustomerSupportCreate, db: Session = Depends(get_db)):
-    list_id=request.parent_id
-    if request.parent_id:
-        parent = db.query(CustomerSupport).filter(CustomerSupport.id == list_id).first()
-        parent.status="resolved"
+async def customer_support_update(list_id: int, request: CustomerSupportStatusUpdate, db: AsyncSession = Depends(get_db)):
+    if request.content is not None:
+        # 예전 요청 형식
+        list_id, status = (request.parent_id, "resolved") if request.parent_id else (list_id, "open")
+    elif request.status in get_args(SupportStatus):
+        status = request.status
     else:
-        parent = db.query(CustomerSupport).first()
-        parent.status="open"
-    return parent
+        raise HTTPException(status_code=422, detail="status는 open, in_progress, resolved, closed 중 하나여야 합니다.")
+    post = await db.scalar(select(CustomerSupport).where(CustomerSupport.id == list_id))
+    if not post:
+        raise HTTPException(status_code=404, detail="Post not found")
+    if post.status != status:
+        post.status = status
+        post.updated_at = datetime.now()
+        # 대시보드 집계(상태별/카테고리별/일별, 해결 시간)는 DB 트리거가 같은 트랜잭션에서 갱신
+        await db.commit()
+        await db.refresh(post)
+        response_cache.invalidate(LIST_TAG, item_tag(list_id))
+    return post
 
 @router.delete("/list/{list_id}")
-async def customer_support_delete(list_id: int, db: Session = Depends(get_db)):
-    try: db.query(CustomerSupport).filter(
+async def customer_support_delete(list_id: int, db: AsyncSession = Depends(get_db)):
+    try: await db.execute(delete(CustomerSupport).where(
         CustomerSupport.id == list_id
-    ).delete()
+    ))
     except Exception as e:
         return {"error": f"Error: {e}"}
-    db.commit()
+    await db.commit()
+    response_cache.invalidate(LIST_TAG, item_tag(list_id))
     return {"success": True}
 
@@ -0,0 +1,95 @@
+import asyncio
+import os
+from datetime import date, timedelta
+
+from dotenv import load_dotenv
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app.login.login import get_current_user
+from app.models import CustomerSupportResolveHist, CustomerSupportStats
+from data.postgresDB import get_read_db
+from data.reconcile_support_stats import reconcile
+
+load_dotenv()  # .env 파일 자동 로드
+
+# ✅ 고객센터 관리자 대시보드
+# 질문 테이블을 훑지 않고 트리거가 유지하는 집계 테이블만 읽음
+# (customer_support_stats: 작성일/상태/카테고리별 질문 수, customer_support_resolve_hist: 해결 시간 분포)
+router = APIRouter()
+
+# 0이면 주기 보정 안 함 (크론으로 python -m data.reconcile_support_stats 실행해도 됨)
+SUPPORT_STATS_RECONCILE_SECONDS = float(os.getenv("SUPPORT_STATS_RECONCILE_SECONDS", "0"))
+
+
+def require_admin(user=Depends(get_current_user)):
+    if user.role != "admin":
+        raise HTTPException(status_code=403, detail="관리자만 접근할 수 있습니다.")
+    return user
+
+
+def bucket_bounds(bucket):
+    # support_resolve_bucket(dodam.sql)과 같은 구간: [60 * 2^(b/4), 60 * 2^((b+1)/4)) 초
+    # 0번 구간에는 1분 미만도 모두 들어가므로(greatest(seconds, 60)) 아래쪽 경계는 0초
+    return (60 * 2 ** (bucket / 4) if bucket > 0 else 0), 60 * 2 ** ((bucket + 1) / 4)
+
+
+def histogram_median(buckets):
+    # 누적 개수가 절반을 넘는 구간 안에서 선형 보간
+    total = sum(count for _, count in buckets)
+    if total <= 0:
+        return None
+    half, seen = total / 2, 0
+    for bucket, count in buckets:
+        if count <= 0:
+            continue
+        if seen + count >= half:
+            low, high = bucket_bounds(bucket)
+            return round(low + (high - low) * (half - seen) / count)
+        seen += count
+    return None
+
+
+@router.get("", dependencies=[Depends(require_admin)])
+async def support_dashboard(
+    days: int = Query(30, ge=1, le=366, description="일별 추이를 볼 기간(일)"),
+    db: AsyncSession = Depends(get_read_db),
+):
+    tickets = func.sum(CustomerSupportStats.tickets)
+    by_status = (await db.execute(
+        select(CustomerSupportStats.status, tickets).group_by(CustomerSupportStats.status)
+    )).all()
+    by_category = (await db.execute(
+        select(CustomerSupportStats.category, tickets).group_by(CustomerSupportStats.category)
+    )).all()
+    daily = (await db.execute(
+        select(CustomerSupportStats.day, tickets)
+        .where(CustomerSupportStats.day > date.today() - timedelta(days=days))
+        .group_by(CustomerSupportStats.day)
+        .order_by(CustomerSupportStats.day)
+    )).all()
+    hist = (await db.execute(
+        select(CustomerSupportResolveHist.bucket, CustomerSupportResolveHist.tickets)
+        .order_by(CustomerSupportResolveHist.bucket)
+    )).all()
+
+    return {
+        "total": sum(count for _, count in by_status),
+        "by_status": {status: count for status, count in by_status if count},
+        "by_category": {category: count for category, count in by_category if count},  # 카테고리 없음은 ""
+        "daily": [{"day": day, "tickets": count} for day, count in daily if count],
+        "resolved": sum(count for _, count in hist),
+        "median_resolve_seconds": histogram_median(hist),
+    }
+
+
+async def reconcile_periodically():
+    # 트리거가 놓친 변경(트리거 없이 넣은 데이터, 수동 수정 등)을 주기적으로 바로잡음
+    while True:
+        await asyncio.sleep(SUPPORT_STATS_RECONCILE_SECONDS)
+        try:
+            await run_in_threadpool(reconcile)
+        except Exception as e:
+            print(f"고객센터 집계 보정 실패: {e}")
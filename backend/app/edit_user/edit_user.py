@@ -1,9 +1,16 @@
 from dotenv import load_dotenv
-from fastapi import APIRouter, Body, Depends, HTTPException
-from sqlalchemy.orm import Session
+from datetime import datetime
+from fastapi import APIRouter, Body, Depends, HTTPException, Request, Response
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.responses import RedirectResponse
 from app.models import Users as User
-from data.postgresDB import SessionLocal
+from app.models import ParentForumPosts, ReadingForumPosts
+from app.cache.response_cache import response_cache
+from app.cache.identity_cache import identity_cache
+from app.cache.conditional import make_etag, not_modified, set_validators
+from app.forum.cache_tags import namespace_tag
+from data.postgresDB import get_db, get_read_db
 from typing import Optional
 from pydantic import BaseModel
 
@@ -11,12 +18,6 @@ load_dotenv()  # .env 파일 자동 로드
 # 유저 정보
 router = APIRouter()
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
 class UserRead(BaseModel):
     id: int
     login_id: Optional[str]
@@ -46,21 +47,29 @@ class UserUpdate(BaseModel):
         from_attributes = True
 
 @router.get("/info/{email}", response_model=UserRead)
-def info(   email: str,
-            db: Session = Depends(get_db)
+async def info(   email: str,
+            request: Request,
+            response: Response,
+            db: AsyncSession = Depends(get_read_db)
     ):
-    user = db.query(User).filter(User.email == email).first()
+    user = await db.scalar(select(User).where(User.email == email))
     if not user:
         return {"error": "User not found"}
+    # 정보가 바뀌지 않았으면 응답 모델 검증/직렬화 없이 304
+    etag = make_etag(request.url.path, user.id, user.updated_at)
+    unchanged = not_modified(request, etag, user.updated_at)
+    if unchanged is not None:
+        return unchanged
+    set_validators(response, etag, user.updated_at)
     return user
 
 @router.patch("/info/{email}", response_model=UserRead)
-def patch_info(
+async def patch_info(
         email: str,
         data: UserUpdate = Body(...),
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_db)
 ):
-    user = db.query(User).filter(User.email == email).first()
+    user = await db.scalar(select(User).where(User.email == email))
     if not user:
         from fastapi import HTTPException
         raise HTTPException(status_code=404, detail="User not found")
@@ -69,23 +78,32 @@ def patch_info(
 
     for key, value in update_data.items():
         setattr(user, key, value)
+    if update_data:
+        user.updated_at = datetime.now()  # ETag/Last-Modified 갱신용
 
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
+    identity_cache.invalidate(user.id)
+    # 커뮤니티 응답 캐시에 닉네임이 들어가 있음
+    if "nickname" in update_data:
+        response_cache.invalidate(namespace_tag(ParentForumPosts), namespace_tag(ReadingForumPosts))
 
     return user
 @router.delete("/info/{email}", response_model=UserRead)
-def delete_info(
+async def delete_info(
     email: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    user = db.query(User).filter(User.email == email).first()
+    user = await db.scalar(select(User).where(User.email == email))
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    try:db.query(User).filter(User.email == email).delete()
+    try:await db.execute(delete(User).where(User.email == email))
     except Exception as error:
         raise HTTPException(status_code=404, detail=error)
-    db.commit()
+    await db.commit()
+    identity_cache.invalidate(user.id)
+    # 탈퇴하면 작성한 글/댓글이 CASCADE로 지워짐
+    response_cache.invalidate(namespace_tag(ParentForumPosts), namespace_tag(ReadingForumPosts))
     print({"message": "User deleted"})
     return RedirectResponse("http://localhost:5173/")
     # return RedirectResponse("/")
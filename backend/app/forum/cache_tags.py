@@ -0,0 +1,16 @@
+# 응답 캐시 무효화 태그 (app/cache/response_cache.py)
+# - 목록 페이지: 목록 태그 + 페이지에 실린 글 태그
+# - 상세(트리): 트리에 실린 모든 글/댓글 태그
+# - 모든 항목: 테이블 이름 태그 (닉네임 변경/회원 탈퇴처럼 범위를 특정하기 어려운 경우 전체 무효화)
+
+
+def namespace_tag(model):
+    return model.__tablename__
+
+
+def list_tag(model):
+    return f"{model.__tablename__}:list"
+
+
+def post_tags(model, post_ids):
+    return [f"{model.__tablename__}:post:{post_id}" for post_id in post_ids]
@@ -1,10 +1,17 @@
 from datetime import datetime
-from typing import Optional, List
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import aliased,joinedload
-from sqlalchemy import func
-from sqlalchemy.orm import Session
-from data.postgresDB import SessionLocal
+from typing import Optional, List, Literal, Union
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.orm import joinedload
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from data.postgresDB import get_db, get_read_db
+from app.forum.pagination import encode_cursor, paginate
+from app.forum.summary import summary_items, summary_query
+from app.cache.response_cache import response_cache
+from app.cache.conditional import not_modified, set_validators
+from app.forum.cache_tags import list_tag, namespace_tag, post_tags
+from app.forum.thread import fetch_thread, subtree_ids, thread_ids
+from app.forum.validators import list_validators, thread_validators
 from app.models import ReadingForumPosts
 from pydantic import BaseModel, Field
 from dotenv import load_dotenv
@@ -13,13 +20,6 @@ load_dotenv()  # .env 파일 자동 로드
 
 router = APIRouter()
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 # ✅ 사용자 닉네임용 (기존과 동일)
 class UserNickname(BaseModel):
     nickname: str
@@ -66,39 +66,80 @@ class ReadingForumPostRead(BaseModel):
 # ForwardRef 갱신
 ReadingForumPostRead.model_rebuild()
 
-@router.get("/posts", response_model=list[ReadingForumPostRead])
-def get_posts(
+# ✅ 커서 모드 응답용
+class ReadingForumPostPage(BaseModel):
+    items: List[ReadingForumPostRead]
+    next_cursor: Optional[str] = None  # 마지막 페이지면 None
+
+# ✅ 요약 모드(?view=summary) 응답용 (문서화용, 실제 응답은 dict를 바로 직렬화)
+class ReadingForumPostSummary(BaseModel):
+    id: int
+    title: Optional[str]
+    book_title: Optional[str]
+    discussion_tags: Optional[str]
+    excerpt: str  # 본문 앞부분
+    truncated: bool  # 본문이 잘렸는지
+    created_at: datetime
+    updated_at: datetime
+    comment_count: int
+    user: UserNickname
+
+class ReadingForumPostSummaryPage(BaseModel):
+    items: List[ReadingForumPostSummary]
+    next_cursor: Optional[str] = None
+
+@router.get("/posts", response_model=Union[list[ReadingForumPostRead], ReadingForumPostPage, list[ReadingForumPostSummary], ReadingForumPostSummaryPage])
+async def get_posts(
+    request: Request,
     page: int = Query(1, ge=1, description="페이지 번호"),
     size: int = Query(10, ge=1, le=50, description="한 페이지당 게시글 수"),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="커서 모드: 첫 페이지는 빈 값, 이후엔 next_cursor"),
+    view: Literal["full", "summary"] = Query("full", description="summary: 본문 앞부분만 담은 가벼운 목록"),
+    db: AsyncSession = Depends(get_read_db)
 ):
-    offset = (page - 1) * size
-    comment = aliased(ReadingForumPosts)
-
-    subq = (
-        db.query(
-            ReadingForumPosts.id.label("post_id"),
-            func.count(comment.id).label("comment_count")
+    cache_key = response_cache.key(request)
+    # 페이지에 들어갈 행들의 id/updated_at만 먼저 보고, 클라이언트 사본이 최신이면 304
+    etag, last_modified = await list_validators(db, ReadingForumPosts, cache_key, page, size, cursor)
+    unchanged = not_modified(request, etag, last_modified)
+    if unchanged is not None:
+        return unchanged
+    cached = response_cache.get(cache_key, etag)
+    if cached is not None:
+        return set_validators(cached, etag, last_modified)
+
+    # 댓글 수는 comment_count 컬럼(트리거로 유지)을 그대로 읽음 → 비용이 테이블 크기가 아니라 페이지 크기에 비례
+    if view == "summary":
+        # 필요한 컬럼 + 본문 앞부분 + 닉네임만 조회
+        query = summary_query(ReadingForumPosts, ReadingForumPosts.book_title, ReadingForumPosts.discussion_tags)
+    else:
+        query = (
+            select(ReadingForumPosts)
+            .where(ReadingForumPosts.parent_id == None)
+            .options(joinedload(ReadingForumPosts.user))  # ✅ 유저 닉네임 미리 로딩
         )
-        .outerjoin(comment, comment.parent_id == ReadingForumPosts.id)
-        .filter(ReadingForumPosts.parent_id == None)
-        .group_by(ReadingForumPosts.id)
-        .subquery()
-    )
-
-    query = (
-        db.query(ReadingForumPosts, subq.c.comment_count)
-        .join(subq, subq.c.post_id == ReadingForumPosts.id)
-        .options(joinedload(ReadingForumPosts.user))  # ✅ 유저 닉네임 미리 로딩
-        .order_by(ReadingForumPosts.created_at.desc())
-        .offset(offset)
-        .limit(size)
-    )
-
-    results = query.all()
+    query = paginate(query, ReadingForumPosts, page, size, cursor)
+
+    if view == "summary":
+        results = (await db.execute(query)).mappings().all()
+        has_more = cursor is not None and len(results) > size
+        items = summary_items(results[:size])
+        if cursor is None:
+            content = items
+        else:
+            last = items[-1] if has_more else None
+            content = {
+                "items": items,
+                "next_cursor": encode_cursor(last["created_at"], last["id"]) if last else None,
+            }
+        tags = [namespace_tag(ReadingForumPosts), list_tag(ReadingForumPosts), *post_tags(ReadingForumPosts, (item["id"] for item in items))]
+        return set_validators(response_cache.set(cache_key, content, tags, raw=True, version=etag), etag, last_modified)
+
+    results = (await db.scalars(query)).all()
+    has_more = cursor is not None and len(results) > size
+    results = results[:size]
 
     response = []
-    for post, comment_count in results:
+    for post in results:
         response.append(
             ReadingForumPostRead(
                 id=post.id,
@@ -109,62 +150,102 @@ def get_posts(
                 discussion_tags=post.discussion_tags,
                 created_at=post.created_at,
                 updated_at=post.updated_at,
-                comment_count=comment_count,
+                comment_count=post.comment_count,
                 user=post.user   # ✅ UserNickname 모델로 자동 직렬화
             )
         )
-    return response
+    if cursor is None:
+        content = response
+    else:
+        last = results[-1] if has_more else None
+        content = ReadingForumPostPage(
+            items=response,
+            next_cursor=encode_cursor(last.created_at, last.id) if last else None,
+        )
+    tags = [namespace_tag(ReadingForumPosts), list_tag(ReadingForumPosts), *post_tags(ReadingForumPosts, (post.id for post in results))]
+    return set_validators(response_cache.set(cache_key, content, tags, version=etag), etag, last_modified)
 
-@router.get("/post/{list_id}",response_model=ParentForumPostRead)
-def get_post(post_id: int, db: Session = Depends(get_db)):
-    post = db.query(ParentForumPost).filter(ParentForumPost.id == post_id).first()
+@router.get("/post/{list_id}",response_model=ReadingForumPostRead)
+async def get_post(
+    request: Request,
+    list_id: int,
+    max_depth: int = Query(10, ge=0, le=50, description="댓글 트리 최대 깊이"),
+    max_children: int = Query(100, ge=1, le=500, description="글/댓글 하나당 최대 자식 수"),
+    db: AsyncSession = Depends(get_read_db)
+):
+    cache_key = response_cache.key(request)
+    etag, last_modified = await thread_validators(db, ReadingForumPosts, cache_key, list_id, max_depth, max_children)
+    if etag is None:
+        raise HTTPException(status_code=404, detail={"성공여부":False,"이유":"존재하지 않는 게시물입니다."})
+    unchanged = not_modified(request, etag, last_modified)
+    if unchanged is not None:
+        return unchanged
+    cached = response_cache.get(cache_key, etag)
+    if cached is not None:
+        return set_validators(cached, etag, last_modified)
+
+    # 글 + 댓글 트리(작성자 닉네임 포함)를 재귀 CTE 한 번으로 조회
+    post = await fetch_thread(db, ReadingForumPosts, list_id, max_depth, max_children)
     if not post:
         raise HTTPException(status_code=404, detail={"성공여부":False,"이유":"존재하지 않는 게시물입니다."})
-    return post
+    tags = [namespace_tag(ReadingForumPosts), *post_tags(ReadingForumPosts, thread_ids(post))]
+    return set_validators(response_cache.set(cache_key, ReadingForumPostRead.model_validate(post), tags, version=etag), etag, last_modified)
 
-@router.post("/post/create", response_model=ParentForumPostCreate)
-def create_post(
-    request: ParentForumPostCreate,
-    db: Session = Depends(get_db)
+@router.post("/post/create", response_model=ReadingForumPostCreate)
+async def create_post(
+    request: ReadingForumPostCreate,
+    db: AsyncSession = Depends(get_db)
 ):
-    new_post = ParentForumPost(
+    new_post = ReadingForumPosts(
         user_id=request.user_id,
         title=request.title,
         content=request.content,
-        category=request.category,
-        is_important=request.is_important,
+        book_title=request.book_title,
+        discussion_tags=request.discussion_tags,
         parent_id=request.parent_id
     )
     db.add(new_post)
-    db.commit()
-    db.refresh(new_post)
+    await db.commit()
+    await db.refresh(new_post)
+    # 새 글이면 목록 전체, 댓글이면 부모글(댓글 수/트리)만 무효화
+    if new_post.parent_id:
+        response_cache.invalidate(*post_tags(ReadingForumPosts, [new_post.parent_id]))
+    else:
+        response_cache.invalidate(list_tag(ReadingForumPosts))
     return new_post
 
-@router.patch("/post/{list_id}/update",response_model=ParentForumPostUpdate)
-def update_post(
-    request: ParentForumPostUpdate,
+@router.patch("/post/{list_id}/update",response_model=ReadingForumPostUpdate)
+async def update_post(
+    request: ReadingForumPostUpdate,
     list_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    post = db.query(ParentForumPost).filter(ParentForumPost.id == list_id).first()
+    post = await db.scalar(select(ReadingForumPosts).where(ReadingForumPosts.id == list_id))
     if not post:
         raise HTTPException(status_code=404, detail={"성공여부":False,"이유":"존재하지 않는 게시물입니다."})
     if request.title:
         post.title = request.title
         post.updated_at = datetime.now()
         post.content = request.content
-        db.commit()
-        db.refresh(post)
+        await db.commit()
+        await db.refresh(post)
+        response_cache.invalidate(*post_tags(ReadingForumPosts, [list_id]))
         return post
     return {"로그":"수정될 것이 없거나 실패했습니다."}
 @router.delete("/post/{list_id}/delete")
-def delete_post(
+async def delete_post(
     list_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    post = db.query(ParentForumPost).filter(ParentForumPost.id == list_id).first()
+    post = await db.scalar(select(ReadingForumPosts).where(ReadingForumPosts.id == list_id))
     if not post:
         raise HTTPException(status_code=404, detail={"성공여부":False,"이유":"존재하지 않는 게시물입니다."})
-    db.delete(post)
-    db.commit()
+    # 같이 지워질 댓글들까지 캐시에서 제거
+    deleted_ids = await subtree_ids(db, ReadingForumPosts, list_id)
+    parent_id = post.parent_id
+    await db.delete(post)
+    await db.commit()
+    tags = post_tags(ReadingForumPosts, deleted_ids)
+    tags += post_tags(ReadingForumPosts, [parent_id]) if parent_id else [list_tag(ReadingForumPosts)]
+    response_cache.invalidate(*tags)
     return {"성공여부": True}
\ No newline at end of file
@@ -0,0 +1,42 @@
+import base64
+import json
+from datetime import datetime
+
+from fastapi import HTTPException
+from sqlalchemy import tuple_
+
+# ✅ 커서(keyset) 페이지네이션: (created_at, id) 내림차순으로 마지막 행 다음부터 조회
+# OFFSET과 달리 깊은 페이지도 인덱스 탐색 한 번이고, 새 글이 올라와도 결과가 밀리지 않음
+
+
+def encode_cursor(created_at: datetime, post_id: int) -> str:
+    raw = json.dumps([created_at.isoformat(), post_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, post_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), int(post_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="잘못된 cursor 값입니다.")
+
+
+def seek_after(model, cursor: str):
+    # created_at DESC, id DESC 순서에서 커서 다음 행들
+    # 행 비교 (created_at, id) < (...) 로 써야 복합 인덱스를 그대로 탄다
+    created_at, post_id = decode_cursor(cursor)
+    return tuple_(model.created_at, model.id) < tuple_(created_at, post_id)
+
+
+def paginate(query, model, page: int, size: int, cursor):
+    # 목록 정렬 + page 방식(cursor가 None) 또는 커서 방식 적용
+    query = query.order_by(model.created_at.desc(), model.id.desc())
+    if cursor is None:
+        # 기존 page 방식 (호환용)
+        return query.offset((page - 1) * size).limit(size)
+    if cursor:
+        query = query.where(seek_after(model, cursor))
+    # 한 개 더 가져와서 다음 페이지가 있는지 판단
+    return query.limit(size + 1)
@@ -0,0 +1,136 @@
+import base64
+import html
+import json
+import re
+from datetime import datetime
+from typing import List, Literal, Optional
+
+from dotenv import load_dotenv
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import BaseModel
+from sqlalchemy import String, cast, func, literal, select, tuple_, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import ParentForumPosts, ReadingForumPosts, Users
+from data.postgresDB import get_read_db
+
+load_dotenv()  # .env 파일 자동 로드
+
+# ✅ 커뮤니티 글 검색 (부모 커뮤니티 + 독서토론)
+# search_vector(bigram + 단어 끝 글자 tsvector, GIN 인덱스)로 후보를 찾고 ts_rank_cd로 정렬
+router = APIRouter()
+
+SNIPPET_RADIUS = 40  # 하이라이트 주변으로 잘라낼 글자 수
+
+BOARDS = {
+    "parent": ParentForumPosts,
+    "reading": ReadingForumPosts,
+}
+
+
+class SearchHit(BaseModel):
+    board: str
+    id: int
+    title: Optional[str]
+    title_highlight: Optional[str]
+    snippet: str  # <mark>로 감싼 본문 일부 (HTML 이스케이프됨)
+    rank: float
+    created_at: datetime
+    nickname: Optional[str]
+
+
+class SearchPage(BaseModel):
+    items: List[SearchHit]
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(rank, board, post_id):
+    raw = json.dumps([rank, board, post_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    try:
+        rank, board, post_id = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return float(rank), str(board), int(post_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="잘못된 cursor 값입니다.")
+
+
+def highlight(text, terms, radius=None):
+    # 검색어가 나온 곳을 <mark>로 감쌈. radius가 있으면 첫 매치 주변만 잘라냄
+    if not text:
+        return text
+    if not terms:
+        return html.escape(text[:radius * 3] if radius is not None else text)
+    pattern = re.compile("|".join(re.escape(term) for term in terms), re.IGNORECASE)
+    if radius is not None:
+        match = pattern.search(text)
+        start = max(0, match.start() - radius) if match else 0
+        end = min(len(text), (match.end() if match else 0) + radius * 2)
+        text = ("…" if start > 0 else "") + text[start:end] + ("…" if end < len(text) else "")
+    parts, last = [], 0
+    for match in pattern.finditer(text):
+        parts.append(html.escape(text[last:match.start()]))
+        parts.append(f"<mark>{html.escape(match.group())}</mark>")
+        last = match.end()
+    parts.append(html.escape(text[last:]))
+    return "".join(parts)
+
+
+def board_query(board, model, tsquery):
+    return (
+        select(
+            cast(literal(board), String).label("board"),
+            model.id,
+            model.title,
+            model.content,
+            model.created_at,
+            Users.nickname,
+            func.ts_rank_cd(model.search_vector, tsquery).label("rank"),
+        )
+        .outerjoin(Users, Users.id == model.user_id)
+        # 부분 인덱스(WHERE parent_id IS NULL)와 조건을 맞춰야 인덱스를 탄다
+        .where(model.parent_id == None, model.search_vector.op("@@")(tsquery))
+    )
+
+
+@router.get("", response_model=SearchPage)
+async def search(
+    q: str = Query(..., min_length=1, max_length=100, description="검색어 (한 글자 검색어는 그 글자가 들어간 단어를 찾음)"),
+    board: Literal["all", "parent", "reading"] = Query("all", description="검색할 게시판"),
+    size: int = Query(10, ge=1, le=50),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    db: AsyncSession = Depends(get_read_db),
+):
+    terms = q.split()
+    # 검색어도 같은 규칙으로 쪼개서 AND 조건 tsquery로 만듦 (한 글자 검색어는 접두어 검색, dodam.sql korean_tsquery)
+    tsquery = func.korean_tsquery(q)
+    boards = BOARDS if board == "all" else {board: BOARDS[board]}
+    hits = union_all(*(board_query(name, model, tsquery) for name, model in boards.items())).subquery()
+
+    query = select(hits).order_by(hits.c.rank.desc(), hits.c.board.desc(), hits.c.id.desc())
+    if cursor:
+        query = query.where(tuple_(hits.c.rank, hits.c.board, hits.c.id) < tuple_(*decode_cursor(cursor)))
+    rows = (await db.execute(query.limit(size + 1))).mappings().all()
+    has_more = len(rows) > size
+    rows = rows[:size]
+
+    items = [
+        SearchHit(
+            board=row["board"],
+            id=row["id"],
+            title=row["title"],
+            title_highlight=highlight(row["title"], terms),
+            snippet=highlight(row["content"], terms, SNIPPET_RADIUS),
+            rank=row["rank"],
+            created_at=row["created_at"],
+            nickname=row["nickname"],
+        )
+        for row in rows
+    ]
+    last = rows[-1] if has_more else None
+    return SearchPage(
+        items=items,
+        next_cursor=encode_cursor(last["rank"], last["board"], last["id"]) if last else None,
+    )
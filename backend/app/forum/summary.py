@@ -0,0 +1,38 @@
+from sqlalchemy import func, select
+
+from app.models import Users
+
+# ✅ 목록 요약 모드 (?view=summary)
+# ORM 엔티티/Users 행 전체 대신 목록에 필요한 컬럼 + 본문 앞부분만 SELECT
+# 결과는 dict 그대로 orjson으로 직렬화 (Pydantic 모델 생성/재검증 생략)
+
+EXCERPT_LENGTH = 120  # 요약 모드 본문 미리보기 글자 수
+
+
+def summary_query(model, *columns):
+    # columns: 게시판별 추가 컬럼 (예: category, book_title)
+    return (
+        select(
+            model.id,
+            model.title,
+            *columns,
+            func.substr(model.content, 1, EXCERPT_LENGTH).label("excerpt"),
+            (func.length(model.content) > EXCERPT_LENGTH).label("truncated"),
+            model.created_at,
+            model.updated_at,
+            model.comment_count,
+            Users.nickname,
+        )
+        .outerjoin(Users, Users.id == model.user_id)
+        .where(model.parent_id == None)
+    )
+
+
+def summary_items(rows):
+    items = []
+    for row in rows:
+        item = dict(row)
+        item["truncated"] = bool(item["truncated"])
+        item["user"] = {"nickname": item.pop("nickname")}
+        items.append(item)
+    return items
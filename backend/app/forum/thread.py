@@ -0,0 +1,79 @@
+from sqlalchemy import literal, select, true
+from sqlalchemy.orm import aliased
+
+from app.models import Users
+
+# ✅ 게시글 + 전체 댓글 트리를 재귀 CTE 한 번으로 조회
+# 깊이마다 lazy load 하던 것을 왕복 1회로 줄이고, 트리는 메모리에서 O(n)으로 조립
+
+
+def thread_cte(model, post_id: int, max_depth: int, max_children: int):
+    # 글 id부터 max_depth 깊이까지의 (id, depth), 글/댓글 하나당 작성 순으로 max_children개까지만
+    tree = (
+        select(model.id, literal(0).label("depth"))
+        .where(model.id == post_id)
+        .cte("thread", recursive=True)
+    )
+    child = aliased(model)
+    # 자식 수 제한을 재귀 단계 안에서 (잘린 자식의 하위 트리는 아예 읽지 않음)
+    children = (
+        select(child.id)
+        .where(child.parent_id == tree.c.id)
+        .order_by(child.created_at, child.id)
+        .limit(max_children)
+        .lateral("children")
+    )
+    return tree.union_all(
+        select(children.c.id, (tree.c.depth + 1).label("depth"))
+        .select_from(tree)
+        .join(children, true())
+        .where(tree.c.depth < max_depth)
+    )
+
+
+async def fetch_thread(db, model, post_id: int, max_depth: int, max_children: int):
+    tree = thread_cte(model, post_id, max_depth, max_children)
+    # 검색용 컬럼처럼 deferred 된 컬럼은 제외
+    columns = [prop.columns[0] for prop in model.__mapper__.column_attrs if not prop.deferred]
+    query = (
+        select(*columns, Users.nickname, tree.c.depth)
+        .join(tree, tree.c.id == model.id)
+        .outerjoin(Users, Users.id == model.user_id)
+        # 부모가 항상 자식보다 먼저 나오도록 깊이 순, 같은 부모 안에서는 작성 순
+        .order_by(tree.c.depth, model.created_at, model.id)
+    )
+    rows = (await db.execute(query)).mappings().all()
+    if not rows:
+        return None
+
+    nodes = {}
+    root = None
+    for row in rows:
+        node = {key: value for key, value in row.items() if key not in ("nickname", "depth")}
+        node["user"] = {"nickname": row["nickname"]}
+        node["children"] = []
+        if row["depth"] == 0:
+            root = node
+        else:
+            # 자식 수 제한은 CTE에서 이미 적용됨 (잘린 댓글 수는 comment_count로 알 수 있음)
+            nodes[row["parent_id"]]["children"].append(node)
+        nodes[node["id"]] = node
+    return root
+
+
+def thread_ids(root):
+    # 조립된 트리에 포함된 모든 글 id
+    ids, stack = [], [root]
+    while stack:
+        node = stack.pop()
+        ids.append(node["id"])
+        stack.extend(node["children"])
+    return ids
+
+
+async def subtree_ids(db, model, post_id: int):
+    # 글과 그 아래 모든 댓글 id (ON DELETE CASCADE로 같이 지워질 행들)
+    tree = select(model.id).where(model.id == post_id).cte("subtree", recursive=True)
+    child = aliased(model)
+    tree = tree.union_all(select(child.id).join(tree, child.parent_id == tree.c.id))
+    return (await db.scalars(select(tree.c.id))).all()
@@ -0,0 +1,44 @@
+from sqlalchemy import func, select
+
+from app.cache.conditional import latest, make_etag
+from app.forum.pagination import paginate
+from app.forum.thread import thread_cte
+from app.models import Users
+
+# ✅ 커뮤니티 GET 응답의 ETag / Last-Modified 계산
+# 본문(content)은 읽지 않고 id, updated_at, comment_count, 작성자 updated_at(닉네임 변경)만 조회
+# - comment_count는 댓글이 달려도 부모글 updated_at이 안 바뀌므로 따로 포함
+
+
+async def list_validators(db, model, key, page, size, cursor):
+    # 목록 한 페이지에 들어갈 행들의 버전 정보 (같은 정렬/페이지 조건)
+    query = paginate(
+        select(model.id, model.updated_at, model.comment_count, Users.updated_at.label("user_updated_at"))
+        .outerjoin(Users, Users.id == model.user_id)
+        .where(model.parent_id == None),
+        model, page, size, cursor,
+    )
+    rows = (await db.execute(query)).all()
+    etag = make_etag(key, [tuple(row) for row in rows])
+    return etag, latest(*(row.updated_at for row in rows), *(row.user_updated_at for row in rows))
+
+
+async def thread_validators(db, model, key, post_id, max_depth, max_children):
+    # fetch_thread 와 같은 (자식 수 제한된) 트리를 집계 한 번으로 요약 (행 수, id 합, 최신 updated_at)
+    # comment_count 컬럼이 없는 테이블(고객센터)도 같은 방식으로 사용
+    tree = thread_cte(model, post_id, max_depth, max_children)
+    counts = [func.sum(model.comment_count)] if hasattr(model, "comment_count") else []
+    row = (await db.execute(
+        select(
+            func.count(model.id).label("rows"),
+            func.sum(model.id),
+            *counts,
+            func.max(model.updated_at).label("updated_at"),
+            func.max(Users.updated_at).label("user_updated_at"),
+        )
+        .join(tree, tree.c.id == model.id)
+        .outerjoin(Users, Users.id == model.user_id)
+    )).one()
+    if not row.rows:
+        return None, None  # 없는 글 → 본 핸들러에서 404 처리
+    return make_etag(key, tuple(row)), latest(row.updated_at, row.user_updated_at)
@@ -0,0 +1,267 @@
+import asyncio
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+
+from dotenv import load_dotenv
+from sqlalchemy import delete, func, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from starlette.concurrency import run_in_threadpool
+
+from app.games.ranking import GAME_TYPES, PERIODS, Board, period_key
+from app.models import LeaderboardEntries, LeaderboardSnapshots, UserGames
+from data.postgresDB import SessionLocal
+
+load_dotenv()  # .env 파일 자동 로드
+
+# ✅ 게임 리더보드 (game_type × 일간/주간/전체, 메모리)
+# 조회마다 user_games 를 ORDER BY score / COUNT(*) WHERE score > x 하면 게임 기록이 쌓일수록 느려짐
+# → 보드별 순위 구조(app/games/ranking.py)를 메모리에 두고 기록이 들어올 때마다 바로 반영
+#   - 이 워커에서 끝난 게임은 record()로 즉시 반영
+#   - 다른 워커에서 끝난 게임은 user_games.id 이후만 주기적으로 읽어서 반영 (LEADERBOARD_SYNC_SECONDS)
+#     SERIAL은 커밋 순서와 다를 수 있어서 마지막 id보다 LEADERBOARD_ID_LOOKBACK 개 앞부터 다시 읽음 (다시 반영해도 결과 같음)
+# - 보드 내용(유저별 최고 점수)은 leaderboard_entries 에 주기적으로 저장 (바뀐 유저만 upsert)
+#   서버 시작 시 스냅샷 + 그 이후 user_games 만 읽어서 복원 (스냅샷이 없으면 user_games 전체를 한 번 읽음)
+# - 메모리에는 현재/직전 기간의 일간·주간 보드와 전체 보드만 둠, 지난 기간은 leaderboard_entries 에 남음
+# 워커마다 따로 가짐: 보드 항목 100만 개 기준 약 200MB
+
+LEADERBOARD_SYNC_SECONDS = float(os.getenv("LEADERBOARD_SYNC_SECONDS", "10"))  # 0이면 주기 동기화 안 함 (첫 조회 때 한 번만 로드)
+LEADERBOARD_SNAPSHOT_SECONDS = float(os.getenv("LEADERBOARD_SNAPSHOT_SECONDS", "300"))  # 0이면 종료 시에만 저장
+LEADERBOARD_ID_LOOKBACK = int(os.getenv("LEADERBOARD_ID_LOOKBACK", "1000"))
+LEADERBOARD_HISTORY_DAYS = int(os.getenv("LEADERBOARD_HISTORY_DAYS", "90"))  # 지난 일간/주간 보드를 DB에 남겨 두는 기간
+BATCH = 5000  # 한 번에 읽고 반영하는 행 수 (반영 중에는 조회가 기다리므로 짧게 끊음)
+
+
+def kept_keys(now):
+    # 메모리에 두는 기간: 현재 + 직전 (자정/월요일 직후에 늦게 들어온 기록도 반영되도록)
+    return {
+        "daily": {period_key("daily", now), period_key("daily", now - timedelta(days=1))},
+        "weekly": {period_key("weekly", now), period_key("weekly", now - timedelta(weeks=1))},
+        "all": {"all"},
+    }
+
+
+class Leaderboards:
+    def __init__(self):
+        self.boards = {}         # (game_type, period, period_key) → Board
+        self.last_game_id = 0    # 반영한 user_games.id 최댓값
+        self._lock = threading.Lock()       # 보드 변경/조회 (이벤트 루프와 스레드풀에서 같이 씀)
+        self._sync_lock = threading.Lock()  # sync / snapshot 은 한 번에 하나씩
+        self._saved_game_id = None          # 마지막 스냅샷 때의 last_game_id
+        self.loaded_at = None
+        self.syncs = 0
+        self.last_sync_rows = 0
+        self.last_sync_ms = 0.0
+        self.snapshots = 0
+        self.last_snapshot_entries = 0
+        self.last_snapshot_ms = 0.0
+        self.recorded = 0
+
+    # --- 반영 ---
+
+    def _apply(self, rows, mark_dirty=True):
+        # rows: [(game_type, user_id, score, played_at)], self._lock 을 잡고 호출
+        keep = kept_keys(datetime.now())
+        keys_of = {}  # 날짜 → 보드 키 목록 (같은 날짜 기록이 대부분이라 한 번만 계산)
+        for game_type, user_id, score, played_at in rows:
+            if game_type not in GAME_TYPES or user_id is None or score is None or played_at is None:
+                continue
+            day = played_at.date()
+            keys = keys_of.get(day)
+            if keys is None:
+                keys = keys_of[day] = [(period, key) for period in PERIODS
+                                       for key in (period_key(period, played_at),) if key in keep[period]]
+            for period, key in keys:
+                board = self.boards.get((game_type, period, key))
+                if board is None:
+                    board = self.boards[(game_type, period, key)] = Board()
+                board.submit(user_id, score, played_at, mark_dirty)
+
+    def record(self, user_id, game_type, score, played_at):
+        # 이 워커에서 끝난 게임 (user_games 커밋 직후, 이벤트 루프에서 호출)
+        with self._lock:
+            self._apply([(game_type, user_id, score, played_at)])
+            self.recorded += 1
+
+    # --- DB 동기화 (동기 함수 → run_in_threadpool 에서 호출) ---
+
+    def sync(self):
+        with self._sync_lock:
+            start = time.perf_counter()
+            with SessionLocal() as db:
+                if self.loaded_at is None:
+                    self._load(db)
+                rows = self._catch_up(db)
+            self._evict()
+            self.loaded_at = time.time()
+            self.syncs += 1
+            self.last_sync_rows = rows
+            self.last_sync_ms = round((time.perf_counter() - start) * 1000, 1)
+
+    def _load(self, db):
+        # 마지막 스냅샷 복원 (없으면 user_games 처음부터 읽음)
+        watermark = db.execute(select(func.max(LeaderboardSnapshots.last_game_id))).scalar()
+        if watermark is None:
+            return
+        keep = kept_keys(datetime.now())
+        entry = LeaderboardEntries
+        result = db.execute(
+            select(entry.game_type, entry.period, entry.period_key, entry.user_id, entry.score, entry.achieved_at)
+            .where(or_(*[(entry.period == period) & entry.period_key.in_(keys) for period, keys in keep.items()]))
+            .order_by(entry.achieved_at)  # 같은 점수 안에서 먼저 달성한 순서 유지
+            .execution_options(yield_per=BATCH)
+        )
+        for rows in result.partitions():
+            with self._lock:
+                for game_type, period, key, user_id, score, achieved_at in rows:
+                    board = self.boards.get((game_type, period, key))
+                    if board is None:
+                        board = self.boards[(game_type, period, key)] = Board()
+                    board.submit(user_id, score, achieved_at, mark_dirty=False)
+        self.last_game_id = max(watermark - LEADERBOARD_ID_LOOKBACK, 0)
+        self._saved_game_id = watermark
+
+    def _catch_up(self, db):
+        after = max(self.last_game_id - LEADERBOARD_ID_LOOKBACK, 0) if self.loaded_at else self.last_game_id
+        total = 0
+        while True:
+            rows = db.execute(
+                select(UserGames.id, UserGames.game_type, UserGames.user_id, UserGames.score, UserGames.played_at)
+                .where(UserGames.id > after)
+                .order_by(UserGames.id)
+                .limit(BATCH)
+            ).all()
+            if not rows:
+                break
+            with self._lock:
+                self._apply([row[1:] for row in rows])
+                self.last_game_id = max(self.last_game_id, rows[-1][0])
+            after = rows[-1][0]
+            total += len(rows)
+            if len(rows) < BATCH:
+                break
+        return total
+
+    def _evict(self):
+        # 지난 기간 보드는 스냅샷에 다 저장된 뒤에 버림
+        keep = kept_keys(datetime.now())
+        with self._lock:
+            for key in [key for key, board in self.boards.items() if key[2] not in keep[key[1]] and not board.dirty]:
+                del self.boards[key]
+
+    def snapshot(self):
+        # 마지막 스냅샷 이후 최고 점수가 바뀐 유저만 leaderboard_entries 에 upsert
+        # 여러 워커가 같은 내용을 써도 점수가 높아질 때만 바뀌므로 결과는 같음
+        with self._sync_lock:
+            start = time.perf_counter()
+            with self._lock:
+                rows = [dict(game_type=game_type, period=period, period_key=key,
+                             user_id=user_id, score=score, achieved_at=achieved_at)
+                        for (game_type, period, key), board in self.boards.items()
+                        for user_id, score, achieved_at in board.take_dirty()]
+                watermark = self.last_game_id
+            if not rows and watermark == self._saved_game_id:
+                return 0
+            try:
+                with SessionLocal() as db:
+                    for i in range(0, len(rows), BATCH):
+                        stmt = insert(LeaderboardEntries).values(rows[i:i + BATCH])
+                        db.execute(stmt.on_conflict_do_update(
+                            index_elements=["game_type", "period", "period_key", "user_id"],
+                            set_={"score": stmt.excluded.score, "achieved_at": stmt.excluded.achieved_at},
+                            where=stmt.excluded.score > LeaderboardEntries.score,
+                        ))
+                    db.add(LeaderboardSnapshots(last_game_id=watermark, entries=len(rows)))
+                    self._prune(db)
+                    db.commit()
+            except Exception:
+                # 못 쓴 유저는 다음 스냅샷 때 다시
+                with self._lock:
+                    for row in rows:
+                        board = self.boards.get((row["game_type"], row["period"], row["period_key"]))
+                        if board is not None and row["user_id"] in board.best:
+                            board.dirty.add(row["user_id"])
+                raise
+            self._saved_game_id = watermark
+            self.snapshots += 1
+            self.last_snapshot_entries = len(rows)
+            self.last_snapshot_ms = round((time.perf_counter() - start) * 1000, 1)
+            return len(rows)
+
+    def _prune(self, db):
+        cutoff = datetime.now() - timedelta(days=LEADERBOARD_HISTORY_DAYS)
+        for period in ("daily", "weekly"):
+            db.execute(delete(LeaderboardEntries).where(
+                LeaderboardEntries.game_type.in_(GAME_TYPES),  # 기본키 인덱스 앞부분
+                LeaderboardEntries.period == period,
+                LeaderboardEntries.period_key < period_key(period, cutoff),
+            ))
+        db.execute(delete(LeaderboardSnapshots).where(LeaderboardSnapshots.saved_at < cutoff))
+
+    async def ready(self):
+        if self.loaded_at is None:
+            await run_in_threadpool(self.sync)
+
+    # --- 조회 (이벤트 루프에서 바로, 수 µs) ---
+
+    def top(self, game_type, period, limit=10, offset=0):
+        # (보드 키, 참가 유저 수, [(순위, user_id, 점수)])
+        key = period_key(period, datetime.now())
+        with self._lock:
+            board = self.boards.get((game_type, period, key))
+            if board is None:
+                return key, 0, []
+            return key, len(board), board.top(limit, offset)
+
+    def rank(self, game_type, period, user_id):
+        # (보드 키, 참가 유저 수, (순위, 점수) 또는 None)
+        key = period_key(period, datetime.now())
+        with self._lock:
+            board = self.boards.get((game_type, period, key))
+            if board is None:
+                return key, 0, None
+            return key, len(board), board.rank(user_id)
+
+    def stats(self):
+        with self._lock:
+            boards = {"/".join(key): len(board) for key, board in sorted(self.boards.items())}
+            dirty = sum(len(board.dirty) for board in self.boards.values())
+        return {
+            "boards": boards,
+            "dirty": dirty,
+            "last_game_id": self.last_game_id,
+            "recorded": self.recorded,
+            "loaded_at": self.loaded_at,
+            "syncs": self.syncs,
+            "last_sync_rows": self.last_sync_rows,
+            "last_sync_ms": self.last_sync_ms,
+            "snapshots": self.snapshots,
+            "last_snapshot_entries": self.last_snapshot_entries,
+            "last_snapshot_ms": self.last_snapshot_ms,
+        }
+
+
+leaderboard = Leaderboards()
+
+
+async def sync_periodically():
+    # 서버 시작 시 로드하고 바로 한 번 저장, 이후 새 게임 기록만 주기적으로 반영
+    saved_at = 0.0
+    while True:
+        try:
+            await run_in_threadpool(leaderboard.sync)
+            if LEADERBOARD_SNAPSHOT_SECONDS > 0 and time.time() - saved_at >= LEADERBOARD_SNAPSHOT_SECONDS:
+                saved_at = time.time()
+                await run_in_threadpool(leaderboard.snapshot)
+        except Exception as e:
+            print(f"리더보드 동기화 실패: {e}")
+        await asyncio.sleep(LEADERBOARD_SYNC_SECONDS)
+
+
+async def save_on_shutdown():
+    if leaderboard.loaded_at is not None:
+        try:
+            await run_in_threadpool(leaderboard.snapshot)
+        except Exception as e:
+            print(f"리더보드 저장 실패: {e}")
@@ -0,0 +1,66 @@
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, Depends, Query
+from pydantic import BaseModel
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.games.leaderboard import leaderboard
+from app.login.login import get_current_user
+from app.models import Users
+from data.postgresDB import get_read_db
+
+# ✅ 게임 리더보드 (app/games/leaderboard.py)
+router = APIRouter()
+
+GameType = Literal["word_chain", "word_meaning", "sentence_completion"]
+Period = Literal["daily", "weekly", "all"]
+
+
+class LeaderboardEntry(BaseModel):
+    rank: int
+    user_id: int
+    nickname: Optional[str]
+    score: int
+
+
+class Leaderboard(BaseModel):
+    game_type: str
+    period: str
+    period_key: str  # daily '2026-10-18', weekly '2026-W42', all 'all'
+    total: int       # 이 기간에 기록이 있는 유저 수
+    entries: List[LeaderboardEntry]
+
+
+class MyRank(BaseModel):
+    game_type: str
+    period: str
+    period_key: str
+    total: int
+    rank: Optional[int] = None  # 기록이 없으면 None
+    score: Optional[int] = None
+
+
+@router.get("/{game_type}", response_model=Leaderboard)
+async def get_leaderboard(game_type: GameType, period: Period = "weekly",
+                          limit: int = Query(10, ge=1, le=100), offset: int = Query(0, ge=0, le=1000),
+                          db: AsyncSession = Depends(get_read_db)):
+    await leaderboard.ready()
+    key, total, rows = leaderboard.top(game_type, period, limit, offset)
+    # 순위는 메모리에서, 닉네임만 기본키로 조회 (최대 limit 명)
+    nicknames = dict((await db.execute(
+        select(Users.id, Users.nickname).where(Users.id.in_([user_id for _, user_id, _ in rows]))
+    )).all()) if rows else {}
+    return Leaderboard(
+        game_type=game_type, period=period, period_key=key, total=total,
+        entries=[LeaderboardEntry(rank=rank, user_id=user_id, nickname=nicknames.get(user_id), score=score)
+                 for rank, user_id, score in rows],
+    )
+
+
+@router.get("/{game_type}/me", response_model=MyRank)
+async def my_rank(game_type: GameType, period: Period = "weekly", user=Depends(get_current_user)):
+    await leaderboard.ready()
+    key, total, found = leaderboard.rank(game_type, period, user.id)
+    rank, score = found or (None, None)
+    return MyRank(game_type=game_type, period=period, period_key=key, total=total, rank=rank, score=score)
@@ -0,0 +1,274 @@
+import asyncio
+import os
+import random
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+
+import numpy as np
+from dotenv import load_dotenv
+from sqlalchemy import select
+from starlette.concurrency import run_in_threadpool
+
+from app.models import Words
+from app.words.embedding_index import embedding_index
+from app.words.hangul import decompose
+from app.words.synonym_graph import synonym_graph
+from data.postgresDB import SessionLocal
+
+load_dotenv()  # .env 파일 자동 로드
+
+# ✅ 단어 퀴즈 문제 풀 (user_games.game_type = 'word_meaning' / 'sentence_completion')
+# 문제마다 words를 무작위로 조회하지 않고, 백그라운드에서 문제를 묶음으로 만들어 풀(deque)에 쌓아 둠
+# → 퀴즈 요청은 풀에서 꺼내기만 함 (DB 조회 없음). 풀이 QUIZ_POOL_LOW_WATER 아래로 내려가면 다시 채움
+#   word_meaning       : 뜻풀이를 보고 맞는 단어 고르기
+#   sentence_completion: 다른 단어의 뜻풀이 문장에서 표제어 하나를 빈칸으로 (예문 데이터가 없어서 뜻풀이를 문장으로 씀)
+# 오답 보기: 임베딩 인덱스(app/words/embedding_index.py)로 묶음 전체의 이웃을 한 번에 구하고 numpy 마스크로 거름
+#   - 너무 비슷한 단어(QUIZ_MAX_SIMILARITY 이상)와 유의어 그래프에서 QUIZ_SYNONYM_HOPS 안의 단어는 정답과 헷갈리므로 제외
+#   - 정답을 포함하거나 정답에 포함되는 단어 제외 ('사랑' / '사랑니')
+#   - 빈칸 뒤 조사가 받침에 따라 바뀌면(을/를, 이/가 ...) 받침 유무가 정답과 같은 단어만
+# 채점용 정답은 서버 메모리에만 두고, 제출하면 user_games에 한 번 기록
+
+QUIZ_POOL_SIZE = int(os.getenv("QUIZ_POOL_SIZE", "500"))
+QUIZ_POOL_LOW_WATER = int(os.getenv("QUIZ_POOL_LOW_WATER", "200"))
+QUIZ_BATCH_SIZE = int(os.getenv("QUIZ_BATCH_SIZE", "200"))
+QUIZ_MAX_SIMILARITY = float(os.getenv("QUIZ_MAX_SIMILARITY", "0.85"))
+QUIZ_SYNONYM_HOPS = int(os.getenv("QUIZ_SYNONYM_HOPS", "2"))  # 유의어의 유의어까지 제외
+QUIZ_SESSION_TTL = float(os.getenv("QUIZ_SESSION_TTL", "1800"))
+QUIZ_MAX_SESSIONS = int(os.getenv("QUIZ_MAX_SESSIONS", "10000"))
+
+GAME_TYPES = ("word_meaning", "sentence_completion")
+CHOICES = 4
+CANDIDATES = 30      # 문제마다 살펴볼 이웃 수 (여기서 오답 CHOICES - 1개를 고름)
+SPREAD = 8           # 조건을 통과한 가까운 이웃 중 이 안에서 무작위로 (매번 같은 오답이 나오지 않도록)
+POINTS_PER_ANSWER = 10
+BLANK = "____"
+
+# 받침 유무에 따라 형태가 바뀌는 조사 (빈칸 바로 뒤에 붙은 경우)
+FINAL_PARTICLES = ("을", "를", "이", "가", "은", "는", "과", "와", "으로", "이다", "이나", "나", "아", "야")
+OTHER_PARTICLES = ("의", "에", "에서", "에게", "도", "만", "로", "까지", "부터", "처럼", "보다", "하다", "한", "하는", "하여", "되다", "적")
+PARTICLES = sorted(FINAL_PARTICLES + OTHER_PARTICLES, key=len, reverse=True)
+TOKEN = re.compile(r"[가-힣]+")
+
+
+def has_final(text):
+    parts = decompose(text[-1]) if text else None
+    return bool(parts and parts[2])
+
+
+def find_blank(sentence, row_of_text, exclude):
+    # 뜻풀이 문장에서 빈칸으로 만들 표제어 (row, 시작, 끝, 받침을 맞춰야 하는지) — 없으면 None
+    for match in TOKEN.finditer(sentence):
+        token = match.group()
+        for particle in ("",) + tuple(PARTICLES):
+            word = token[:len(token) - len(particle)] if particle else token
+            if len(word) < 2 or (particle and not token.endswith(particle)) or word in exclude:
+                continue
+            row = row_of_text.get(word)
+            if row is not None:
+                return row, match.start(), match.start() + len(word), particle in FINAL_PARTICLES
+    return None
+
+
+class Question:
+    def __init__(self, game_type, prompt, choices, answer):
+        self.game_type = game_type
+        self.prompt = prompt        # word_meaning: 뜻풀이, sentence_completion: 빈칸 문장
+        self.choices = choices      # 단어 CHOICES개 (정답 위치는 섞여 있음)
+        self.answer = answer        # 정답 인덱스
+
+    def public(self):
+        return {"prompt": self.prompt, "choices": self.choices}
+
+
+class QuizSession:
+    def __init__(self, user_id, game_type, questions):
+        self.id = uuid.uuid4().hex
+        self.user_id = user_id
+        self.game_type = game_type
+        self.questions = questions
+        self.created_at = time.time()
+
+
+class QuizGenerator:
+    def __init__(self, pool_size=QUIZ_POOL_SIZE, low_water=QUIZ_POOL_LOW_WATER, batch_size=QUIZ_BATCH_SIZE):
+        self.pool_size = pool_size
+        self.low_water = low_water
+        self.batch_size = batch_size
+        self.pools = {game_type: deque() for game_type in GAME_TYPES}
+        self._refilling = {}  # game_type → 백그라운드 채우기 task (참조를 들고 있어야 GC로 사라지지 않음)
+        self._locks = {game_type: threading.Lock() for game_type in GAME_TYPES}
+        self._has_final = (None, None)  # (임베딩 스냅샷, 행별 받침 유무)
+        self._sessions = OrderedDict()  # quiz_id → QuizSession
+        self.rng = random.Random()
+        self.batches = {game_type: 0 for game_type in GAME_TYPES}
+        self.generated = {game_type: 0 for game_type in GAME_TYPES}
+        self.last_batch_ms = {game_type: 0.0 for game_type in GAME_TYPES}
+        self.served = {game_type: 0 for game_type in GAME_TYPES}
+        self.empty = 0  # 풀이 비어 있어서 채울 때까지 기다린 요청 수
+
+    # --- 문제 만들기 (동기, 스레드풀에서 호출) ---
+
+    def fill(self, game_type):
+        # 풀이 QUIZ_POOL_SIZE가 될 때까지 묶음 단위로 만듦
+        with self._locks[game_type]:
+            pool = self.pools[game_type]
+            attempts = 0
+            while len(pool) < self.pool_size and attempts < 5:
+                start = time.perf_counter()
+                questions = self.generate(game_type, self.batch_size)
+                pool.extend(questions)
+                self.batches[game_type] += 1
+                self.generated[game_type] += len(questions)
+                self.last_batch_ms[game_type] = round((time.perf_counter() - start) * 1000, 1)
+                attempts = attempts + 1 if not questions else 0
+            return len(pool)
+
+    def generate(self, game_type, count):
+        snapshot = embedding_index.ensure_loaded()
+        if len(snapshot) < CHOICES:
+            return []
+        # 뜻풀이가 없는 단어도 있으므로 넉넉히 뽑아서 한 번에 조회
+        rows = self.rng.sample(range(len(snapshot)), min(len(snapshot), count * 2))
+        with SessionLocal() as db:
+            found = db.execute(
+                select(Words.word_id, Words.definition)
+                .where(Words.word_id.in_([snapshot.word_ids[row] for row in rows]), Words.definition.is_not(None))
+            ).all()
+        if game_type == "word_meaning":
+            # 뜻풀이에 정답 단어가 그대로 들어 있으면 가림
+            targets = [(row, definition.replace(snapshot.texts[row], BLANK), False)
+                       for row, definition in ((snapshot.row_of.get(word_id), definition) for word_id, definition in found)
+                       if row is not None]
+        else:
+            targets = []
+            for word_id, definition in found:
+                blank = find_blank(definition, snapshot.row_of_text, exclude={snapshot.texts[snapshot.row_of[word_id]]}
+                                   if word_id in snapshot.row_of else set())
+                if blank:
+                    row, start, end, final = blank
+                    targets.append((row, definition[:start] + BLANK + definition[end:], final))
+        targets = targets[:count]
+        if not targets:
+            return []
+
+        target_rows = np.array([row for row, _, _ in targets])
+        idx, score = self._neighbours(snapshot, target_rows)
+        graph = synonym_graph.ensure_loaded()
+
+        # 벡터화한 조건: 이웃이 있음, 너무 비슷하지 않음, (빈칸이면) 받침 유무 일치
+        ok = (idx >= 0) & (score < QUIZ_MAX_SIMILARITY)
+        need = np.array([final for _, _, final in targets], dtype=bool)
+        if need.any():
+            has = self._finals(snapshot)
+            ok[need] &= has[np.where(idx[need] >= 0, idx[need], 0)] == has[target_rows[need], None]
+
+        questions = []
+        for q, (row, prompt, _) in enumerate(targets):
+            answer = snapshot.texts[row]
+            excluded = graph.within(answer, QUIZ_SYNONYM_HOPS)
+            picks = []
+            for candidate in idx[q][ok[q]]:
+                text = snapshot.texts[candidate]
+                if text in excluded or answer in text or text in answer:
+                    continue
+                picks.append(text)
+                if len(picks) >= SPREAD:
+                    break
+            if len(picks) < CHOICES - 1:
+                continue
+            choices = self.rng.sample(picks, CHOICES - 1) + [answer]
+            self.rng.shuffle(choices)
+            questions.append(Question(game_type, prompt, choices, choices.index(answer)))
+        return questions
+
+    def _neighbours(self, snapshot, rows):
+        # 묶음 전체를 한 번에 검색 → (문제 수, CANDIDATES) 행 번호/점수, 빈자리는 -1
+        hits = embedding_index.search(snapshot.vectors(rows), CANDIDATES, exclude_rows=[{int(row)} for row in rows],
+                                      snapshot=snapshot)
+        idx = np.full((len(rows), CANDIDATES), -1, dtype=np.int64)
+        score = np.full((len(rows), CANDIDATES), np.inf, dtype=np.float32)
+        for q, found in enumerate(hits):
+            if found:
+                idx[q, :len(found)], score[q, :len(found)] = zip(*found)
+        return idx, score
+
+    def _finals(self, snapshot):
+        # 행별 받침 유무 (스냅샷이 바뀔 때만 다시 계산)
+        source, finals = self._has_final
+        if source is not snapshot:
+            finals = np.array([has_final(text) for text in snapshot.texts], dtype=bool)
+            self._has_final = (snapshot, finals)
+        return finals
+
+    # --- 퀴즈 내기 / 채점 (이벤트 루프) ---
+
+    async def take(self, user_id, game_type, count):
+        pool = self.pools[game_type]
+        if len(pool) < count:
+            # 처음이거나 다 써 버린 경우에만 기다림
+            self.empty += 1
+            await run_in_threadpool(self.fill, game_type)
+        questions = [pool.popleft() for _ in range(min(count, len(pool)))]
+        self.served[game_type] += len(questions)
+        if len(pool) < self.low_water:
+            self.refill(game_type)
+        if not questions:
+            return None  # 풀이 비었으면 세션을 만들지 않음 (빈 세션이 QUIZ_MAX_SESSIONS 자리를 차지하지 않게)
+        self._expire()
+        session = QuizSession(user_id, game_type, questions)
+        self._sessions[session.id] = session
+        return session
+
+    def refill(self, game_type):
+        if game_type in self._refilling:
+            return
+        task = self._refilling[game_type] = asyncio.create_task(self._refill(game_type))
+        # 끝나면 (실패/취소 포함) 다음 채우기를 허용
+        task.add_done_callback(lambda _: self._refilling.pop(game_type, None))
+
+    async def _refill(self, game_type):
+        try:
+            await run_in_threadpool(self.fill, game_type)
+        except Exception as e:
+            print(f"퀴즈 문제 풀 채우기 실패 ({game_type}): {e}")
+
+    def get_session(self, quiz_id):
+        self._expire()
+        return self._sessions.get(quiz_id)
+
+    def pop_session(self, quiz_id):
+        return self._sessions.pop(quiz_id, None)
+
+    def _expire(self):
+        now = time.time()
+        while self._sessions:
+            session = next(iter(self._sessions.values()))
+            if now - session.created_at < QUIZ_SESSION_TTL and len(self._sessions) < QUIZ_MAX_SESSIONS:
+                break
+            self._sessions.popitem(last=False)
+
+    def stats(self):
+        return {
+            "pools": {game_type: len(pool) for game_type, pool in self.pools.items()},
+            "batches": self.batches,
+            "generated": self.generated,
+            "served": self.served,
+            "last_batch_ms": self.last_batch_ms,
+            "waited_for_empty_pool": self.empty,
+            "sessions": len(self._sessions),
+        }
+
+
+quiz_generator = QuizGenerator()
+
+
+async def fill_on_startup():
+    # 서버 시작 시 풀을 미리 채워 둠 (임베딩 인덱스 로드가 끝난 뒤)
+    for game_type in GAME_TYPES:
+        try:
+            await run_in_threadpool(quiz_generator.fill, game_type)
+        except Exception as e:
+            print(f"퀴즈 문제 풀 채우기 실패 ({game_type}): {e}")
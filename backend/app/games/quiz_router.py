@@ -0,0 +1,67 @@
+from datetime import datetime
+from typing import List, Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.games.leaderboard import leaderboard
+from app.games.quiz import POINTS_PER_ANSWER, quiz_generator
+from app.login.login import get_current_user
+from app.models import UserGames
+from data.postgresDB import get_db
+
+# ✅ 단어 퀴즈 (app/games/quiz.py)
+router = APIRouter()
+
+MAX_QUESTIONS = 20
+
+
+class QuizQuestion(BaseModel):
+    prompt: str
+    choices: List[str]
+
+
+class Quiz(BaseModel):
+    quiz_id: str
+    game_type: str
+    questions: List[QuizQuestion]
+
+
+class QuizAnswers(BaseModel):
+    answers: List[int]  # 문제 순서대로 고른 보기 인덱스
+
+
+class QuizResult(BaseModel):
+    score: int
+    correct: List[bool]
+    answers: List[int]  # 문제별 정답 인덱스
+
+
+@router.post("/{game_type}", response_model=Quiz)
+async def new_quiz(game_type: Literal["word_meaning", "sentence_completion"],
+                   count: int = Query(10, ge=1, le=MAX_QUESTIONS), user=Depends(get_current_user)):
+    # 미리 만들어 둔 풀에서 꺼내기만 함 (DB 조회 없음)
+    session = await quiz_generator.take(user.id, game_type, count)
+    if session is None:
+        raise HTTPException(status_code=503, detail="퀴즈 문제를 준비하고 있습니다. 잠시 후 다시 시도하세요.")
+    return Quiz(quiz_id=session.id, game_type=game_type, questions=[q.public() for q in session.questions])
+
+
+@router.post("/{quiz_id}/answers", response_model=QuizResult)
+async def submit_answers(quiz_id: str, body: QuizAnswers, user=Depends(get_current_user),
+                         db: AsyncSession = Depends(get_db)):
+    session = quiz_generator.get_session(quiz_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="퀴즈가 없거나 이미 제출했습니다.")
+    if session.user_id != user.id:
+        raise HTTPException(status_code=403, detail="본인의 퀴즈가 아닙니다.")
+    # 본인 확인 뒤에 꺼냄 (다른 유저가 제출해도 퀴즈가 사라지지 않게, await 전이라 중복 제출도 한 번만 통과)
+    quiz_generator.pop_session(quiz_id)
+    correct = [i < len(body.answers) and body.answers[i] == q.answer for i, q in enumerate(session.questions)]
+    score = sum(correct) * POINTS_PER_ANSWER
+    played_at = datetime.now()  # 리더보드 기간 구분과 같은 시각으로 기록
+    db.add(UserGames(user_id=user.id, game_type=session.game_type, score=score, played_at=played_at))
+    await db.commit()
+    leaderboard.record(user.id, session.game_type, score, played_at)
+    return QuizResult(score=score, correct=correct, answers=[q.answer for q in session.questions])
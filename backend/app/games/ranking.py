@@ -0,0 +1,123 @@
+from bisect import bisect_left, insort
+
+# ✅ 리더보드 한 판(보드)의 순위 구조 (DB 없이 동작 → 벤치마크에서 그대로 씀, app/games/leaderboard.py 참고)
+# 보드마다 유저별 최고 점수만 둠 (같은 점수를 다시 받거나 낮은 점수는 무시 → 같은 기록을 여러 번 반영해도 결과가 같음)
+# - 순위: 점수별 유저 수를 펜윅 트리(Fenwick, binary indexed tree)에 두고 "내 점수보다 높은 유저 수 + 1"
+#         → 유저 수와 상관없이 O(log 점수 범위), COUNT(*) WHERE score > x 처럼 매번 세지 않음
+# - 상위 N명: 점수별 유저 묶음(먼저 달성한 순)과 정렬된 점수 목록을 높은 점수부터 훑음
+# - 같은 점수는 같은 순위 (1, 2, 2, 4 ...)
+# 게임 점수는 0 이상 정수 (음수는 0으로 취급)
+
+GAME_TYPES = ("word_chain", "word_meaning", "sentence_completion")  # user_games.game_type
+PERIODS = ("daily", "weekly", "all")
+
+
+def period_key(period, played_at):
+    # 기간별 보드 이름 (서버 로컬 시간 기준): daily '2026-10-18', weekly '2026-W42' (월요일 시작), all 'all'
+    if period == "daily":
+        return played_at.date().isoformat()
+    if period == "weekly":
+        year, week, _ = played_at.isocalendar()
+        return f"{year}-W{week:02d}"
+    return "all"
+
+
+class Fenwick:
+    # counts[score] 누적합, 점수가 범위를 넘으면 크기를 두 배로 늘림
+    def __init__(self, size=1024):
+        self.size = size
+        self.tree = [0] * (size + 1)
+
+    def add(self, score, delta):
+        while score >= self.size:
+            # 크기 n → 2n: 새로 생기는 칸 중 tree[2n]만 [1, 2n] 전체 합을 가짐, 나머지는 빈 구간
+            total = self.prefix(self.size)
+            self.tree += [0] * self.size
+            self.size *= 2
+            self.tree[self.size] = total
+        i = score + 1
+        tree, size = self.tree, self.size
+        while i <= size:
+            tree[i] += delta
+            i += i & -i
+
+    def prefix(self, score):
+        # 점수가 score 미만인 개수
+        i = min(score, self.size)
+        tree = self.tree
+        total = 0
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+
+class Board:
+    def __init__(self):
+        self.best = {}      # user_id → (점수, 달성 시각)
+        self.counts = Fenwick()
+        self.buckets = {}   # 점수 → {user_id: None} (dict 순서 = 먼저 달성한 순)
+        self.scores = []    # 유저가 있는 점수 (오름차순)
+        self.dirty = set()  # 마지막 스냅샷 이후 바뀐 user_id
+
+    def __len__(self):
+        return len(self.best)
+
+    def submit(self, user_id, score, achieved_at=None, mark_dirty=True):
+        # 최고 점수가 바뀌면 True
+        score = max(int(score), 0)
+        old = self.best.get(user_id)
+        if old is not None:
+            if score <= old[0]:
+                return False
+            self._remove(user_id, old[0])
+        self.best[user_id] = (score, achieved_at)
+        bucket = self.buckets.get(score)
+        if bucket is None:
+            bucket = self.buckets[score] = {}
+            insort(self.scores, score)
+        bucket[user_id] = None
+        self.counts.add(score, 1)
+        if mark_dirty:
+            self.dirty.add(user_id)
+        return True
+
+    def _remove(self, user_id, score):
+        bucket = self.buckets[score]
+        del bucket[user_id]
+        if not bucket:
+            del self.buckets[score]
+            del self.scores[bisect_left(self.scores, score)]
+        self.counts.add(score, -1)
+
+    def rank(self, user_id):
+        # (순위, 점수) / 기록 없으면 None
+        entry = self.best.get(user_id)
+        if entry is None:
+            return None
+        score = entry[0]
+        return len(self.best) - self.counts.prefix(score + 1) + 1, score
+
+    def top(self, limit, offset=0):
+        # [(순위, user_id, 점수)] 높은 점수부터
+        result = []
+        seen = 0
+        for score in reversed(self.scores):
+            bucket = self.buckets[score]
+            if seen + len(bucket) <= offset:
+                seen += len(bucket)
+                continue
+            rank = seen + 1
+            for user_id in bucket:
+                if seen >= offset:
+                    result.append((rank, user_id, score))
+                    if len(result) >= limit:
+                        return result
+                seen += 1
+        return result
+
+    def take_dirty(self):
+        # 스냅샷에 쓸 [(user_id, 점수, 달성 시각)], 꺼낸 뒤 비움
+        rows = [(user_id, *self.best[user_id]) for user_id in self.dirty]
+        self.dirty = set()
+        return rows
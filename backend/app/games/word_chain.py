@@ -0,0 +1,289 @@
+import asyncio
+import os
+import random
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from dotenv import load_dotenv
+from starlette.concurrency import run_in_threadpool
+
+from app.words.autocomplete import autocomplete_index
+from app.words.hangul import dueum, is_hangul_word
+
+load_dotenv()  # .env 파일 자동 로드
+
+# ✅ 끝말잇기 엔진 (user_games.game_type = 'word_chain')
+# - 단어를 첫 음절별로 묶어 메모리에 둠 → 이을 수 있는 단어 찾기는 dict 조회 (턴마다 words 조회 안 함)
+#   단어 목록은 자동완성 인덱스(app/words/autocomplete.py) 스냅샷에서 가져오고, 스냅샷이 바뀌면 백그라운드에서 다시 만듦
+# - 끝 음절에 두음법칙을 적용한 음절로도 이을 수 있음 ('력' → '역')
+# - "한방 단어": 끝 음절로 시작하는 단어가 하나도 없는 단어 (받으면 짐). 미리 계산해서 난이도별로 다르게 씀
+#     easy   : 한방 단어를 쓰지 않고, 이을 단어가 많은 쪽을 고름
+#     normal : 한방 단어를 뺀 나머지에서 무작위
+#     hard   : 한방 단어가 있으면 바로 씀, 없으면 상대가 이을 단어가 가장 적은 쪽
+# - 게임 진행 상태는 메모리(세션)에만 두고, 끝났을 때 user_games에 한 번만 기록
+#   워커 프로세스마다 따로 가지므로 여러 워커로 띄우면 같은 게임 요청이 같은 워커로 가야 함 (sticky)
+
+WORD_CHAIN_SESSION_TTL = float(os.getenv("WORD_CHAIN_SESSION_TTL", "1800"))  # 마지막 수 이후 이 시간이 지나면 게임 폐기
+WORD_CHAIN_MAX_SESSIONS = int(os.getenv("WORD_CHAIN_MAX_SESSIONS", "10000"))
+
+DIFFICULTIES = ("easy", "normal", "hard")
+WIN_BONUS = {"easy": 20, "normal": 50, "hard": 100}
+POINTS_PER_WORD = 10
+RANDOM_TRIES = 8  # 무작위로 고를 때 이미 쓴 단어에 걸리면 다시 뽑는 횟수 (넘으면 순서대로 찾음)
+
+
+def next_syllables(word):
+    # 다음 단어가 시작할 수 있는 음절 (끝 음절, 두음법칙 적용 음절)
+    last = word[-1]
+    alternate = dueum(last)
+    return (last, alternate) if alternate else (last,)
+
+
+class ChainIndex:
+    # 한 번 만들면 바꾸지 않음 (단어가 바뀌면 새로 만들어 교체)
+    def __init__(self, words, seed=None):
+        rng = random.Random(seed)
+        words = [word for word in set(words) if len(word) >= 2 and is_hangul_word(word)]
+        rng.shuffle(words)  # 같은 점수끼리는 순서가 섞이도록
+
+        by_first = {}
+        for word in words:
+            by_first.setdefault(word[0], []).append(word)
+        self.words = set(words)
+        # 음절 → 그 음절로 끝난 단어 다음에 올 수 있는 단어 수 (두음법칙 포함)
+        self.reply_counts = {}
+        for word in words:
+            last = word[-1]
+            if last not in self.reply_counts:
+                self.reply_counts[last] = sum(len(by_first.get(s, ())) for s in next_syllables(word))
+        self.killers = {s for s, count in self.reply_counts.items() if count == 0}
+
+        # 첫 음절별로 한방 단어 / 나머지(상대가 이을 단어 수 오름차순)를 나눠 둠
+        self.killer_words = {}
+        self.safe_words = {}
+        for first, bucket in by_first.items():
+            killer = [word for word in bucket if word[-1] in self.killers]
+            safe = sorted((word for word in bucket if word[-1] not in self.killers),
+                          key=lambda word: self.reply_counts[word[-1]])
+            if killer:
+                self.killer_words[first] = killer
+            if safe:
+                self.safe_words[first] = safe
+        self.starters = [word for word in words if self.reply_counts[word[-1]] >= 10] or words
+
+    def __len__(self):
+        return len(self.words)
+
+    def reply_count(self, word):
+        return self.reply_counts.get(word[-1], 0)
+
+    def can_follow(self, previous, word):
+        return word[0] in next_syllables(previous)
+
+    def pick(self, previous, used, difficulty, rng=random):
+        # previous 다음에 AI가 낼 단어 (없으면 None)
+        starts = next_syllables(previous)
+        safe = [self.safe_words.get(s, ()) for s in starts]
+        if difficulty == "hard":
+            for s in starts:
+                word = _first_unused(self.killer_words.get(s, ()), used)
+                if word:
+                    return word
+            found = [word for word in (_first_unused(bucket, used) for bucket in safe) if word]
+            return min(found, key=self.reply_count) if found else None
+        if difficulty == "easy":
+            # 이을 단어가 많은 뒤쪽 절반에서
+            word = _random_unused([bucket[len(bucket) // 2:] for bucket in safe], used, rng)
+            return word or _random_unused(safe, used, rng)
+        word = _random_unused(safe, used, rng)
+        if word:
+            return word
+        return _random_unused([self.killer_words.get(s, ()) for s in starts], used, rng)
+
+    def has_reply(self, previous, used):
+        buckets = [bucket.get(s, ()) for s in next_syllables(previous) for bucket in (self.safe_words, self.killer_words)]
+        return any(_first_unused(bucket, used) for bucket in buckets)
+
+    def starter(self, rng=random):
+        return rng.choice(self.starters) if self.starters else None
+
+    def stats(self):
+        return {
+            "words": len(self.words),
+            "first_syllables": len(self.safe_words.keys() | self.killer_words.keys()),
+            "killer_syllables": len(self.killers),
+            "killer_words": sum(len(bucket) for bucket in self.killer_words.values()),
+        }
+
+
+def _first_unused(bucket, used):
+    for word in bucket:
+        if word not in used:
+            return word
+    return None
+
+
+def _random_unused(buckets, used, rng):
+    buckets = [bucket for bucket in buckets if bucket]
+    total = sum(len(bucket) for bucket in buckets)
+    if not total:
+        return None
+    for _ in range(RANDOM_TRIES):
+        i = rng.randrange(total)
+        for bucket in buckets:
+            if i < len(bucket):
+                if bucket[i] not in used:
+                    return bucket[i]
+                break
+            i -= len(bucket)
+    for bucket in buckets:
+        word = _first_unused(bucket, used)
+        if word:
+            return word
+    return None
+
+
+class InvalidMove(ValueError):
+    pass
+
+
+class GameSession:
+    def __init__(self, user_id, difficulty):
+        self.id = uuid.uuid4().hex
+        self.user_id = user_id
+        self.difficulty = difficulty
+        self.used = set()
+        self.history = []  # [(누가, 단어)], 누가 = "user" | "ai"
+        self.turns = 0     # 유저가 낸 단어 수
+        self.winner = None
+        self.started_at = self.touched_at = time.time()
+
+    @property
+    def finished(self):
+        return self.winner is not None
+
+    @property
+    def last_word(self):
+        return self.history[-1][1] if self.history else None
+
+    @property
+    def score(self):
+        return self.turns * POINTS_PER_WORD + (WIN_BONUS[self.difficulty] if self.winner == "user" else 0)
+
+    def play(self, who, word):
+        self.used.add(word)
+        self.history.append((who, word))
+        self.touched_at = time.time()
+
+
+class WordChainEngine:
+    def __init__(self, ttl=WORD_CHAIN_SESSION_TTL, max_sessions=WORD_CHAIN_MAX_SESSIONS):
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self.index = None
+        self._source = None      # index를 만든 자동완성 스냅샷
+        self._rebuild_task = None  # 백그라운드 재구성 (참조를 들고 있어야 GC로 사라지지 않음)
+        self._build_lock = threading.Lock()
+        self._sessions = OrderedDict()  # game_id → GameSession (오래 안 쓴 순)
+        self.builds = 0
+        self.last_build_ms = 0.0
+        self.finished_games = 0
+
+    # --- 단어 인덱스 ---
+
+    def build(self):
+        # 동기 함수 → run_in_threadpool 에서 호출
+        with self._build_lock:
+            snapshot = autocomplete_index.ensure_loaded()
+            if snapshot is not self._source:
+                start = time.perf_counter()
+                self.index = ChainIndex(word_text for _, (_, word_text) in snapshot.versions.values())
+                self._source = snapshot
+                self.builds += 1
+                self.last_build_ms = round((time.perf_counter() - start) * 1000, 1)
+            return self.index
+
+    async def ready(self):
+        # 처음에는 만들 때까지 기다리고, 이후 단어가 바뀌었으면 이전 인덱스로 처리하면서 백그라운드에서 다시 만듦
+        if self.index is None:
+            return await run_in_threadpool(self.build)
+        building = self._rebuild_task is not None and not self._rebuild_task.done()
+        if autocomplete_index.snapshot is not self._source and not building:
+            self._rebuild_task = asyncio.create_task(self._rebuild())
+        return self.index
+
+    async def _rebuild(self):
+        try:
+            await run_in_threadpool(self.build)
+        except Exception as e:
+            print(f"끝말잇기 인덱스 갱신 실패: {e}")
+
+    # --- 게임 진행 (이벤트 루프에서만 호출) ---
+
+    def start(self, user_id, difficulty):
+        self._expire()
+        game = GameSession(user_id, difficulty)
+        word = self.index.starter()
+        if word is None:
+            raise LookupError("끝말잇기에 쓸 단어가 없습니다.")
+        game.play("ai", word)
+        self._sessions[game.id] = game
+        return game
+
+    def get(self, game_id):
+        self._expire()
+        game = self._sessions.get(game_id)
+        if game is not None:
+            self._sessions.move_to_end(game_id)
+        return game
+
+    def move(self, game, word):
+        # 유저 단어 검사 → AI 응수. 게임이 끝나면 True
+        index = self.index
+        word = word.strip()
+        if word not in index.words:
+            raise InvalidMove("사전에 없는 단어입니다.")
+        if not index.can_follow(game.last_word, word):
+            raise InvalidMove(f"'{'/'.join(next_syllables(game.last_word))}'(으)로 시작하는 단어를 내야 합니다.")
+        if word in game.used:
+            raise InvalidMove("이미 나온 단어입니다.")
+        game.play("user", word)
+        game.turns += 1
+        reply = index.pick(word, game.used, game.difficulty)
+        if reply is None:
+            return self._finish(game, "user")
+        game.play("ai", reply)
+        if not index.has_reply(reply, game.used):
+            return self._finish(game, "ai")
+        return False
+
+    def give_up(self, game):
+        return self._finish(game, "ai")
+
+    def _finish(self, game, winner):
+        game.winner = winner
+        self._sessions.pop(game.id, None)
+        self.finished_games += 1
+        return True
+
+    def _expire(self):
+        now = time.time()
+        while self._sessions:
+            game = next(iter(self._sessions.values()))
+            if now - game.touched_at < self.ttl and len(self._sessions) < self.max_sessions:
+                break
+            self._sessions.popitem(last=False)
+
+    def stats(self):
+        return {
+            "index": self.index.stats() if self.index is not None else None,
+            "builds": self.builds,
+            "last_build_ms": self.last_build_ms,
+            "sessions": len(self._sessions),
+            "finished_games": self.finished_games,
+        }
+
+
+word_chain = WordChainEngine()
@@ -0,0 +1,98 @@
+from datetime import datetime
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel, Field
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.games.leaderboard import leaderboard
+from app.games.word_chain import InvalidMove, next_syllables, word_chain
+from app.login.login import get_current_user
+from app.models import UserGames
+from data.postgresDB import get_db
+
+# ✅ 끝말잇기 (app/games/word_chain.py)
+router = APIRouter()
+
+
+class StartRequest(BaseModel):
+    difficulty: Literal["easy", "normal", "hard"] = "normal"
+
+
+class MoveRequest(BaseModel):
+    word: str = Field(..., min_length=2, max_length=50)
+
+
+class GameState(BaseModel):
+    game_id: str
+    difficulty: str
+    last_word: Optional[str]
+    next_syllables: List[str]  # 다음 단어가 시작할 수 있는 음절 (두음법칙 포함)
+    history: List[List[str]]   # [[누가, 단어], ...]
+    turns: int
+    score: int
+    finished: bool
+    winner: Optional[str] = None  # user | ai
+
+
+def to_state(game):
+    return GameState(
+        game_id=game.id, difficulty=game.difficulty, last_word=game.last_word,
+        next_syllables=list(next_syllables(game.last_word)) if game.last_word and not game.finished else [],
+        history=[[who, word] for who, word in game.history], turns=game.turns, score=game.score,
+        finished=game.finished, winner=game.winner,
+    )
+
+
+def own_game(game_id, user):
+    game = word_chain.get(game_id)
+    if game is None:
+        raise HTTPException(status_code=404, detail="게임이 없거나 시간이 지나 종료되었습니다.")
+    if game.user_id != user.id:
+        raise HTTPException(status_code=403, detail="본인의 게임이 아닙니다.")
+    return game
+
+
+async def record(db, game):
+    # 끝난 게임만 한 번에 기록 (진행 중에는 DB에 쓰지 않음)
+    # played_at 을 직접 넣어서 리더보드의 일간/주간 구분이 DB 기록과 같게
+    played_at = datetime.now()
+    db.add(UserGames(user_id=game.user_id, game_type="word_chain", score=game.score, played_at=played_at))
+    await db.commit()
+    leaderboard.record(game.user_id, "word_chain", game.score, played_at)
+
+
+@router.post("/start", response_model=GameState)
+async def start_game(body: StartRequest = StartRequest(), user=Depends(get_current_user)):
+    await word_chain.ready()
+    try:
+        game = word_chain.start(user.id, body.difficulty)
+    except LookupError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    return to_state(game)
+
+
+@router.get("/{game_id}", response_model=GameState)
+async def get_game(game_id: str, user=Depends(get_current_user)):
+    return to_state(own_game(game_id, user))
+
+
+@router.post("/{game_id}/move", response_model=GameState)
+async def move(game_id: str, body: MoveRequest, user=Depends(get_current_user), db: AsyncSession = Depends(get_db)):
+    game = own_game(game_id, user)
+    await word_chain.ready()
+    try:
+        finished = word_chain.move(game, body.word)
+    except InvalidMove as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if finished:
+        await record(db, game)
+    return to_state(game)
+
+
+@router.post("/{game_id}/give-up", response_model=GameState)
+async def give_up(game_id: str, user=Depends(get_current_user), db: AsyncSession = Depends(get_db)):
+    game = own_game(game_id, user)
+    word_chain.give_up(game)
+    await record(db, game)
+    return to_state(game)
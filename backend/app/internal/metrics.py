@@ -0,0 +1,104 @@
+import os
+import secrets
+from typing import Optional
+
+from dotenv import load_dotenv
+from fastapi import APIRouter, Depends, Header, HTTPException
+
+from app.cache.identity_cache import identity_cache
+from app.cache.response_cache import response_cache
+from app.games.leaderboard import leaderboard
+from app.games.quiz import quiz_generator
+from app.games.word_chain import word_chain
+from app.login import oauth_client
+from app.login.google import google_metadata
+from app.login.password_pool import password_pool
+from app.words.autocomplete import autocomplete_index
+from app.words.embedding_index import embedding_index
+from app.words.synonym_graph import synonym_graph
+from data import sql_profiler
+from data.pool_metrics import POOL_METRICS
+
+load_dotenv()  # .env 파일 자동 로드
+
+# 운영/모니터링용 내부 엔드포인트
+router = APIRouter()
+
+INTERNAL_API_TOKEN = os.getenv("INTERNAL_API_TOKEN")  # 설정하지 않으면 내부 엔드포인트 전체를 막음
+
+
+def verify_internal(x_internal_token: Optional[str] = Header(None)):
+    # X-Internal-Token 헤더가 INTERNAL_API_TOKEN 과 일치해야 접근 가능
+    if not INTERNAL_API_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if x_internal_token is None or not secrets.compare_digest(x_internal_token.encode(), INTERNAL_API_TOKEN.encode()):
+        raise HTTPException(status_code=403, detail="Forbidden")
+
+
+@router.get("/db/pool", dependencies=[Depends(verify_internal)])
+async def db_pool():
+    return {name: metrics.snapshot() for name, metrics in POOL_METRICS.items()}
+
+
+@router.get("/sql/profile", dependencies=[Depends(verify_internal)])
+async def sql_profile():
+    return {
+        "n_plus_one_threshold": sql_profiler.N_PLUS_ONE_THRESHOLD,
+        "routes": sql_profiler.report.snapshot(),
+    }
+
+
+@router.delete("/sql/profile", dependencies=[Depends(verify_internal)])
+async def sql_profile_reset():
+    sql_profiler.report.reset()
+    return {"success": True}
+
+
+@router.get("/cache", dependencies=[Depends(verify_internal)])
+async def cache_stats():
+    return response_cache.stats()
+
+
+@router.get("/identity-cache", dependencies=[Depends(verify_internal)])
+async def identity_cache_stats():
+    return identity_cache.stats()
+
+
+@router.get("/password-pool", dependencies=[Depends(verify_internal)])
+async def password_pool_stats():
+    return password_pool.stats()
+
+
+@router.get("/oauth", dependencies=[Depends(verify_internal)])
+async def oauth_stats():
+    return {"http_pool": oauth_client.stats(), "google_metadata": google_metadata.stats()}
+
+
+@router.get("/word-index", dependencies=[Depends(verify_internal)])
+async def word_index_stats():
+    return embedding_index.stats()
+
+
+@router.get("/word-autocomplete", dependencies=[Depends(verify_internal)])
+async def word_autocomplete_stats():
+    return autocomplete_index.stats()
+
+
+@router.get("/word-chain", dependencies=[Depends(verify_internal)])
+async def word_chain_stats():
+    return word_chain.stats()
+
+
+@router.get("/quiz", dependencies=[Depends(verify_internal)])
+async def quiz_stats():
+    return quiz_generator.stats()
+
+
+@router.get("/synonym-graph", dependencies=[Depends(verify_internal)])
+async def synonym_graph_stats():
+    return synonym_graph.stats()
+
+
+@router.get("/leaderboard", dependencies=[Depends(verify_internal)])
+async def leaderboard_stats():
+    return leaderboard.stats()
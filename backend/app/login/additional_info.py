@@ -1,22 +1,20 @@
+from datetime import datetime
 from fastapi import APIRouter, Depends, Body
 from fastapi.responses import RedirectResponse
-from sqlalchemy.orm import Session
-from data.postgresDB import SessionLocal
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from data.postgresDB import get_db
 from app.models import Users as User
+from app.models import ParentForumPosts, ReadingForumPosts
+from app.cache.identity_cache import identity_cache
+from app.cache.response_cache import response_cache
+from app.forum.cache_tags import namespace_tag
 from pydantic import BaseModel
 from dotenv import load_dotenv
 load_dotenv()  # .env 파일 자동 로드
 
 router = APIRouter()
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 class AdditionalInfo(BaseModel):
     user_id: int
     nickname: str
@@ -37,17 +35,23 @@ async def additional_info_form(email: str):
 async def additional_info(
         email: str,
         data: AdditionalInfo=Body(...),
-        db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.email == email).first()
+        db: AsyncSession = Depends(get_db)):
+    user = await db.scalar(select(User).where(User.email == email))
     if not user:
         return {"error": "User not found"}
 
+    nickname_changed = user.nickname != data.nickname
     user.nickname = data.nickname
     user.age = data.age
     user.gender = data.gender
     user.phone = data.phone
     user.role = data.role
-    db.commit()
-    db.refresh(user)
+    user.updated_at = datetime.now()  # /user/info ETag 갱신용
+    await db.commit()
+    await db.refresh(user)
+    identity_cache.invalidate(user.id)
+    # 커뮤니티 응답 캐시에 닉네임이 들어가 있음 (edit_user.patch_info 와 같은 무효화)
+    if nickname_changed:
+        response_cache.invalidate(namespace_tag(ParentForumPosts), namespace_tag(ReadingForumPosts))
 
     return {"message": "User info updated", "email": user.email}
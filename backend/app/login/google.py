@@ -1,12 +1,11 @@
 # google.py
-import httpx
 from fastapi import APIRouter, Request, Depends, HTTPException
 from fastapi.responses import RedirectResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from authlib.integrations.starlette_client import OAuth
 import os,datetime
-from app.models import Users as User
-from data.postgresDB import SessionLocal
+from app.login import oauth_client, social_identity
+from data.postgresDB import get_db
 from jose import jwt
 from dotenv import load_dotenv
 from typing import Any, Optional
@@ -14,24 +13,23 @@ load_dotenv()  # .env 파일 자동 로드
 router = APIRouter()   # ✅ 모듈별 라우터
 ALGORITHM = "HS256"
 
-GOOGLE_CLIENT_ID = os.environ.get("GOOGLE_CLIENT_ID")
+GOOGLE_CLIENT_ID = oauth_client.client_id("GOOGLE_CLIENT_ID")
 GOOGLE_CLIENT_SECRET = os.environ.get("GOOGLE_CLIENT_SECRET")
-# OAuth 설정
+GOOGLE_METADATA_URL = oauth_client.provider_url(
+    'https://accounts.google.com/.well-known/openid-configuration', 'google/.well-known/openid-configuration'
+)
+# OAuth 설정 (공용 커넥션 풀 사용)
 oauth = OAuth()
 oauth.register(
     name='google',
     client_id=GOOGLE_CLIENT_ID,
     client_secret=GOOGLE_CLIENT_SECRET,
-    server_metadata_url='https://accounts.google.com/.well-known/openid-configuration',
-    client_kwargs={'scope': 'openid email profile'}
+    server_metadata_url=GOOGLE_METADATA_URL,
+    client_kwargs=oauth_client.client_kwargs(scope='openid email profile')
 )
+# discovery 문서 + JWKS 캐시 (OIDC_METADATA_TTL마다 갱신)
+google_metadata = oauth_client.ProviderMetadata(GOOGLE_METADATA_URL)
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
 SECRET_KEY=os.environ.get("SECRET_KEY")
 
 def create_token(user_id: int):
@@ -45,36 +43,34 @@ def create_token(user_id: int):
 @router.get("/login")
 async def google_login(request: Request):
     redirect_uri = request.url_for("google_callback")
+    await google_metadata.ensure(oauth.google)
     return await oauth.google.authorize_redirect(request, redirect_uri)
 
 @router.get("/callback")
-async def google_callback(request: Request, db: Session = Depends(get_db)):
+async def google_callback(request: Request, db: AsyncSession = Depends(get_db)):
+    metadata = await google_metadata.ensure(oauth.google)
     token = await oauth.google.authorize_access_token(request)
 
-    id_token = token.get("id_token")
-    user_info: Optional[dict[str, Any]] = None
+    # id_token은 authlib이 캐시된 JWKS로 서명/aud/nonce를 검증한 뒤 userinfo에 넣어 줌
+    user_info: Optional[dict[str, Any]] = token.get("userinfo")
 
-    if id_token:
-        user_info = jwt.get_unverified_claims(id_token)
-    else:
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                "https://www.googleapis.com/oauth2/v2/userinfo",
-                headers={"Authorization": f"Bearer {token['access_token']}"}
-            )
-            user_info = resp.json()
+    if not user_info:
+        # id_token이 없으면 userinfo 엔드포인트 조회 (공용 커넥션 풀)
+        resp = await oauth_client.http_client.get(
+            metadata["userinfo_endpoint"],
+            headers={"Authorization": f"Bearer {token['access_token']}"}
+        )
+        user_info = resp.json()
 
     if not user_info:
         raise HTTPException(status_code=400, detail="Failed to fetch user info")
 
-        # ✅ DB 조회
-    user = db.query(User).filter(User.email == user_info["email"]).first()
-    if not user:
+    # ✅ DB 조회 (user_identities 기본키 → 없으면 이메일로 연결/가입)
+    user, created = await social_identity.get_or_create_user(
+        db, "google", user_info.get("sub") or user_info["id"], user_info["email"], user_info.get("name")
+    )
+    if created:
         # 신규 회원이면 추가정보 입력 페이지로
-        user = User(email=user_info["email"], name=user_info.get("name"), oauth="google")
-        db.add(user)
-        db.commit()
-        db.refresh(user)
         return RedirectResponse(f"http://localhost:5173/additional-info?email={user.email}")
 
     # ✅ JWT 발급
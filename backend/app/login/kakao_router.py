@@ -1,38 +1,31 @@
 from fastapi import APIRouter, Request, Depends
 from fastapi.responses import RedirectResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from authlib.integrations.starlette_client import OAuth
-import os
+from app.login import oauth_client, social_identity
 from app.login.google import create_token
-from app.models import Users as User
-from data.postgresDB import SessionLocal
+from data.postgresDB import get_db
 
 router = APIRouter()
 oauth = OAuth()
 
 oauth.register(
     name="kakao",
-    client_id=os.getenv("KAKAO_CLIENT_ID"),   # ✅ REST API 키
-    authorize_url="https://kauth.kakao.com/oauth/authorize",
-    access_token_url="https://kauth.kakao.com/oauth/token",
-    api_base_url="https://kapi.kakao.com/v2/",
+    client_id=oauth_client.client_id("KAKAO_CLIENT_ID"),   # ✅ REST API 키
+    authorize_url=oauth_client.provider_url("https://kauth.kakao.com/oauth/authorize", "kakao/authorize"),
+    access_token_url=oauth_client.provider_url("https://kauth.kakao.com/oauth/token", "kakao/token"),
+    api_base_url=oauth_client.provider_url("https://kapi.kakao.com/v2/", "kakao/"),
+    client_kwargs=oauth_client.client_kwargs(),  # 공용 커넥션 풀
     # scope 빼고 기본만 요청
 )
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 @router.get("/login")
 async def kakao_login(request: Request):
     redirect_uri = request.url_for("kakao_callback")
     return await oauth.kakao.authorize_redirect(request, redirect_uri)
 
 @router.get("/callback", name="kakao_callback")
-async def kakao_callback(request: Request, db: Session = Depends(get_db)):
+async def kakao_callback(request: Request, db: AsyncSession = Depends(get_db)):
     try:
         token = await oauth.kakao.authorize_access_token(request)
     except Exception as e:
@@ -50,21 +43,16 @@ async def kakao_callback(request: Request, db: Session = Depends(get_db)):
 
     kakao_id = user_info.get("id")
 
-    # ✅ 이메일/닉네임이 없으므로 카카오 id를 기반으로 유저 검색
-    user = db.query(User).filter(
-        User.oauth == "kakao", User.name == f"kakao_{kakao_id}"
-    ).first()
+    # ✅ 이메일/닉네임이 없으므로 카카오 회원번호로 유저 검색 (user_identities 기본키)
+    # 신규 회원 → 임시 이메일/닉네임 생성
+    user, created = await social_identity.get_or_create_user(
+        db, "kakao", kakao_id,
+        email=f"{kakao_id}@kakao.local",   # 임시 이메일
+        name=f"kakao_{kakao_id}",          # 임시 닉네임
+        verified_email=False,              # 임시 이메일로는 기존 회원과 연결하지 않음
+    )
 
-    if not user:
-        # 신규 회원 → 임시 이메일/닉네임 생성
-        user = User(
-            email=f"{kakao_id}@kakao.local",   # 임시 이메일
-            name=f"kakao_{kakao_id}",          # 임시 닉네임
-            oauth="kakao"
-        )
-        db.add(user)
-        db.commit()
-        db.refresh(user)
+    if created:
         return RedirectResponse(
             f"http://localhost:5173/additional-info?email={user.email}"
         )
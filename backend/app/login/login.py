@@ -3,13 +3,15 @@ from datetime import datetime, timedelta
 from dotenv import load_dotenv
 from fastapi import Cookie, Depends, HTTPException, APIRouter
 from fastapi.responses import RedirectResponse, JSONResponse
-from passlib.context import CryptContext
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 import os
 from jose import jwt, JWTError
 
-from data.postgresDB import SessionLocal
+from app.cache.identity_cache import CurrentUser, identity_cache
+from app.login.password_pool import PasswordPoolBusy, password_pool
+from data.postgresDB import get_db, get_read_db
 
 load_dotenv()  # .env 파일 자동 로드
 router = APIRouter()   # ✅ 모듈별 라우터
@@ -28,35 +30,40 @@ def create_refresh_token(user_id: int, expires_days: int = 7):
     payload = {"sub": str(user_id), "exp": expire, "type": "refresh"}
     return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
 SECRET_KEY=os.environ.get("SECRET_KEY")
 ALGORITHM = "HS256"
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-def verify_password(password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(password, hashed_password)
+async def verify_password(password: str, hashed_password: str):
+    # bcrypt 전용 프로세스 풀에서 검증, 풀이 꽉 차 있으면 바로 503
+    try:
+        return await password_pool.verify(password, hashed_password)
+    except PasswordPoolBusy:
+        raise HTTPException(status_code=503, detail="로그인 요청이 많습니다. 잠시 후 다시 시도하세요.", headers={"Retry-After": "1"})
 
-def get_current_user(access_token: str = Cookie(None), db: Session = Depends(get_db)):
+async def get_current_user(access_token: str = Cookie(None), db: AsyncSession = Depends(get_read_db)):
     if not access_token:
         raise HTTPException(status_code=401, detail="Not authenticated")
 
     try:
         payload = jwt.decode(access_token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id = payload.get("sub")
+        user_id = int(payload.get("sub"))  # sub가 없거나 숫자가 아니면 아래에서 401
     except JWTError:
         raise HTTPException(status_code=401, detail="Token expired")
     except Exception:
         raise HTTPException(status_code=401, detail="Invalid token")
 
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
+    # 인증 요청마다 users를 조회하지 않도록 필요한 필드만 캐시 (유저 정보 변경 시 무효화)
+    user = identity_cache.get(user_id)
+    if user is not None:
+        return user
+    generation = identity_cache.generation()
+    row = (await db.execute(
+        select(User.id, User.email, User.name, User.nickname, User.role).where(User.id == user_id)
+    )).first()
+    if not row:
         raise HTTPException(status_code=404, detail="User not found")
+    user = CurrentUser.model_validate(row)
+    identity_cache.set(user_id, user, generation)
     return user
 
 @router.get("/profile-data")
@@ -64,17 +71,22 @@ def profile_data(user=Depends(get_current_user)):
     return {"id": user.id, "email": user.email, "name": user.name, "nickname": user.nickname, "role":user.role}
 # 로그인 상태 유지
 @router.post("/login")
-def login(data: LoginSchema, db: Session = Depends(get_db)):
+async def login(data: LoginSchema, db: AsyncSession = Depends(get_db)):
 
-    user = db.query(User).filter(User.email == data.email).first()
+    user = await db.scalar(select(User).where(User.email == data.email))
     if not user:
         raise HTTPException(status_code=401, detail="Invalid email or password")
     # ✅ 소셜 로그인 유저는 비밀번호 없음
     if user.oauth:
         raise HTTPException(status_code=400, detail=f"소셜 {user.oauth} 로그인을 사용하세요")
 
-    if not verify_password(data.password, user.password):
+    valid, new_hash = await verify_password(data.password, user.password)
+    if not valid:
         raise HTTPException(status_code=401, detail="이메일이나 비밀번호가 틀렸습니다.")
+    # BCRYPT_ROUNDS가 바뀌었으면 새 cost로 다시 해시한 값으로 교체
+    if new_hash:
+        user.password = new_hash
+        await db.commit()
 
     # JWT 발급
     access_token = create_access_token(user.id, expires_delta=15)   # 15분짜리
@@ -91,7 +103,7 @@ def login(data: LoginSchema, db: Session = Depends(get_db)):
     return response
 
 @router.post("/refresh")
-def refresh_token(refresh_token: str = Cookie(None), db: Session = Depends(get_db)):
+async def refresh_token(refresh_token: str = Cookie(None), db: AsyncSession = Depends(get_db)):
     if not refresh_token:
         raise HTTPException(status_code=401, detail="Missing refresh token")
 
@@ -104,7 +116,7 @@ def refresh_token(refresh_token: str = Cookie(None), db: Session = Depends(get_d
         raise HTTPException(status_code=401, detail="Refresh token expired")
 
     # DB에서 유저 확인
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.scalar(select(User).where(User.id == int(user_id)))
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
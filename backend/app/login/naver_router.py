@@ -1,11 +1,11 @@
 from fastapi import APIRouter, Request, Depends
 from fastapi.responses import RedirectResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from authlib.integrations.starlette_client import OAuth
 import os
+from app.login import oauth_client, social_identity
 from app.login.google import create_token
-from app.models import Users as User
-from data.postgresDB import SessionLocal
+from data.postgresDB import get_db
 from dotenv import load_dotenv
 load_dotenv()  # .env 파일 자동 로드
 
@@ -14,20 +14,14 @@ oauth = OAuth()
 
 oauth.register(
     name="naver",
-    client_id=os.getenv("NAVER_CLIENT_ID"),
+    client_id=oauth_client.client_id("NAVER_CLIENT_ID"),
     client_secret=os.getenv("NAVER_CLIENT_SECRET"),
-    authorize_url="https://nid.naver.com/oauth2.0/authorize",
-    access_token_url="https://nid.naver.com/oauth2.0/token",
-    api_base_url="https://openapi.naver.com/v1/nid/",
-    client_kwargs={"scope": "name email"},
+    authorize_url=oauth_client.provider_url("https://nid.naver.com/oauth2.0/authorize", "naver/authorize"),
+    access_token_url=oauth_client.provider_url("https://nid.naver.com/oauth2.0/token", "naver/token"),
+    api_base_url=oauth_client.provider_url("https://openapi.naver.com/v1/nid/", "naver/"),
+    client_kwargs=oauth_client.client_kwargs(scope="name email"),  # 공용 커넥션 풀
 )
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
 
 @router.get("/login")
 async def naver_login(request: Request):
@@ -35,7 +29,7 @@ async def naver_login(request: Request):
     return await oauth.naver.authorize_redirect(request, redirect_uri)
 
 @router.get("/callback")
-async def naver_callback(request: Request, db: Session = Depends(get_db)):
+async def naver_callback(request: Request, db: AsyncSession = Depends(get_db)):
     try:
         token = await oauth.naver.authorize_access_token(request)
     except Exception as e:
@@ -54,14 +48,10 @@ async def naver_callback(request: Request, db: Session = Depends(get_db)):
     if not email:
         return {"error": "Naver did not return email. Check consent settings."}
 
-    # ✅ DB 조회
-    user = db.query(User).filter(User.email == email).first()
-    if not user:
+    # ✅ DB 조회 (user_identities 기본키 → 없으면 이메일로 연결/가입)
+    user, created = await social_identity.get_or_create_user(db, "naver", user_info["id"], email, user_info.get("name"))
+    if created:
         # 신규 회원 → 추가정보 입력 페이지
-        user = User(email=email, name=user_info.get("name"), oauth="naver")
-        db.add(user)
-        db.commit()
-        db.refresh(user)
         return RedirectResponse(f"http://localhost:5173/additional-info?email={user.email}")
 
     # ✅ JWT 발급
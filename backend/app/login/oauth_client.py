@@ -0,0 +1,129 @@
+import asyncio
+import os
+import time
+
+import httpx
+from dotenv import load_dotenv
+
+load_dotenv()  # .env 파일 자동 로드
+
+# ✅ 소셜 로그인(google/naver/kakao) 공용 HTTP 커넥션 풀 + OIDC 메타데이터 캐시
+# - authlib은 요청마다 httpx 클라이언트를 새로 만들고 닫으므로, 세 provider가 같은 transport(커넥션 풀)를
+#   쓰도록 넘겨서 keep-alive 커넥션을 재사용
+# - Google discovery 문서/JWKS는 OIDC_METADATA_TTL 동안 캐시하고 만료되면 다시 받음
+#   (갱신 실패 시 기존 값 유지, 모르는 kid로 서명된 토큰이 오면 authlib이 JWKS를 강제 갱신)
+# - OAUTH_STUB_URL을 설정하면 세 provider 모두 로컬 stub(app/login/oauth_stub.py)으로 연결 (오프라인 테스트/벤치마크용)
+
+OAUTH_HTTP_TIMEOUT = float(os.getenv("OAUTH_HTTP_TIMEOUT", "5"))
+OAUTH_HTTP_MAX_CONNECTIONS = int(os.getenv("OAUTH_HTTP_MAX_CONNECTIONS", "50"))
+OAUTH_HTTP_KEEPALIVE_SECONDS = float(os.getenv("OAUTH_HTTP_KEEPALIVE_SECONDS", "30"))
+OIDC_METADATA_TTL = float(os.getenv("OIDC_METADATA_TTL", "3600"))
+OAUTH_STUB_URL = os.getenv("OAUTH_STUB_URL")  # 예: http://localhost:8000/oauth-stub
+
+
+class SharedTransport(httpx.AsyncHTTPTransport):
+    # authlib이 만든 클라이언트가 async with를 빠져나갈 때 transport까지 닫으므로,
+    # 그때는 무시하고 앱 종료 시 close_pool()에서만 실제로 닫음
+    async def __aexit__(self, *args):
+        pass
+
+    async def aclose(self):
+        pass
+
+    async def close_pool(self):
+        await super().aclose()
+
+
+transport = SharedTransport(
+    limits=httpx.Limits(
+        max_connections=OAUTH_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=OAUTH_HTTP_MAX_CONNECTIONS,
+        keepalive_expiry=OAUTH_HTTP_KEEPALIVE_SECONDS,
+    ),
+    retries=1,  # 연결 단계 실패만 한 번 재시도
+)
+timeout = httpx.Timeout(OAUTH_HTTP_TIMEOUT)
+
+# 직접 호출용 (userinfo 등)
+http_client = httpx.AsyncClient(transport=transport, timeout=timeout)
+
+
+def client_kwargs(**kwargs):
+    # oauth.register(client_kwargs=...)에 넘길 값
+    return {"transport": transport, "timeout": timeout, **kwargs}
+
+
+def provider_url(real_url, stub_path):
+    return f"{OAUTH_STUB_URL}/{stub_path}" if OAUTH_STUB_URL else real_url
+
+
+def client_id(env_name):
+    # stub 모드에서는 키가 없어도 동작하도록 기본값 사용
+    return os.getenv(env_name) or ("stub-client" if OAUTH_STUB_URL else None)
+
+
+class ProviderMetadata:
+    def __init__(self, url, ttl=OIDC_METADATA_TTL):
+        self.url = url
+        self.ttl = ttl
+        self._lock = asyncio.Lock()
+        self._loaded_at = None
+        self.refreshes = 0
+        self.failures = 0
+
+    def _fresh(self):
+        return self._loaded_at is not None and time.monotonic() - self._loaded_at < self.ttl
+
+    async def _fetch(self):
+        resp = await http_client.get(self.url)
+        resp.raise_for_status()
+        metadata = resp.json()
+        resp = await http_client.get(metadata["jwks_uri"])
+        resp.raise_for_status()
+        metadata["jwks"] = resp.json()
+        # authlib은 _loaded_at이 있으면 discovery 문서를 다시 받지 않음
+        metadata["_loaded_at"] = time.time()
+        return metadata
+
+    async def ensure(self, app):
+        # app: oauth.google (authlib 앱). 만료됐을 때만 다시 받아서 app.server_metadata 교체
+        if self._fresh():
+            return app.server_metadata
+        async with self._lock:
+            if self._fresh():
+                return app.server_metadata
+            try:
+                metadata = await self._fetch()
+            except (httpx.HTTPError, KeyError, ValueError):
+                self.failures += 1
+                if self._loaded_at is None:
+                    raise
+                return app.server_metadata  # 갱신 실패 → 이전 값으로 계속
+            app.server_metadata = metadata
+            self._loaded_at = time.monotonic()
+            self.refreshes += 1
+            return metadata
+
+    def stats(self):
+        return {
+            "url": self.url,
+            "ttl": self.ttl,
+            "age": round(time.monotonic() - self._loaded_at, 1) if self._loaded_at is not None else None,
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+        }
+
+
+async def aclose():
+    await http_client.aclose()
+    await transport.close_pool()
+
+
+def stats():
+    pool = transport._pool
+    return {
+        "connections": len(pool.connections),
+        "idle": sum(1 for connection in pool.connections if connection.is_idle()),
+        "max_connections": OAUTH_HTTP_MAX_CONNECTIONS,
+        "stub": OAUTH_STUB_URL,
+    }
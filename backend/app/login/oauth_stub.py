@@ -0,0 +1,143 @@
+import base64
+import json
+import time
+from typing import Optional
+from urllib.parse import parse_qs, urlencode
+
+from authlib.jose import JsonWebKey, jwt
+from fastapi import APIRouter, Header, HTTPException, Request
+from fastapi.responses import RedirectResponse
+
+# ✅ 오프라인 테스트/벤치마크용 가짜 OAuth provider (OAUTH_STUB_URL 설정 시에만 /oauth-stub에 등록)
+# - google: discovery 문서, JWKS, RS256 서명 id_token, userinfo
+# - naver: /naver/me ({"response": {...}}), kakao: /kakao/user/me ({"id": ...})
+# - authorize에 stub_user=N 을 붙이면 그 번호의 유저로 로그인 (기본 1)
+# - 동의 화면 없이 바로 redirect_uri로 code를 돌려줌. 운영 환경에서는 절대 켜지 않음
+
+router = APIRouter()
+
+PROVIDERS = ("google", "naver", "kakao")
+
+# 프로세스 시작 시 한 번 만드는 서명 키 (JWKS로 공개)
+signing_key = JsonWebKey.generate_key("RSA", 2048, {"kid": "stub-key", "use": "sig", "alg": "RS256"}, is_private=True)
+
+
+def _encode_code(data):
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip("=")
+
+
+def _decode_code(code):
+    try:
+        return json.loads(base64.urlsafe_b64decode(code + "=" * (-len(code) % 4)))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="invalid code")
+
+
+def _profile(provider, user):
+    return {
+        "id": user,
+        "sub": f"{provider}-{user}",
+        "email": f"stub{user}@{provider}.example.com",
+        "name": f"{provider} 테스트{user}",
+    }
+
+
+def _client_id(authorization, form_client_id):
+    # client_secret_basic(Authorization 헤더) / client_secret_post(form) 둘 다 지원
+    if authorization and authorization.startswith("Basic "):
+        try:
+            return base64.b64decode(authorization[6:]).decode().split(":", 1)[0]
+        except ValueError:
+            pass
+    return form_client_id or "stub-client"
+
+
+def _bearer_code(authorization):
+    if not authorization or not authorization.startswith("Bearer stub."):
+        raise HTTPException(status_code=401, detail="invalid access token")
+    return _decode_code(authorization[len("Bearer stub."):])
+
+
+@router.get("/google/.well-known/openid-configuration")
+async def google_discovery(request: Request):
+    base = str(request.url_for("stub_authorize", provider="google")).rsplit("/", 1)[0]
+    return {
+        "issuer": base,
+        "authorization_endpoint": f"{base}/authorize",
+        "token_endpoint": f"{base}/token",
+        "userinfo_endpoint": f"{base}/userinfo",
+        "jwks_uri": f"{base}/jwks",
+        "response_types_supported": ["code"],
+        "subject_types_supported": ["public"],
+        "id_token_signing_alg_values_supported": ["RS256"],
+        "scopes_supported": ["openid", "email", "profile"],
+        "token_endpoint_auth_methods_supported": ["client_secret_basic", "client_secret_post"],
+    }
+
+
+@router.get("/google/jwks")
+async def google_jwks():
+    return {"keys": [signing_key.as_dict(is_private=False)]}
+
+
+@router.get("/{provider}/authorize", name="stub_authorize")
+async def stub_authorize(provider: str, redirect_uri: str, state: Optional[str] = None,
+                         nonce: Optional[str] = None, stub_user: int = 1):
+    if provider not in PROVIDERS:
+        raise HTTPException(status_code=404, detail="unknown provider")
+    code = _encode_code({"provider": provider, "user": stub_user, "nonce": nonce})
+    params = {"code": code}
+    if state:
+        params["state"] = state
+    return RedirectResponse(f"{redirect_uri}?{urlencode(params)}", status_code=302)
+
+
+@router.post("/{provider}/token")
+async def stub_token(request: Request, provider: str, authorization: Optional[str] = Header(None)):
+    # python-multipart 의존성 없이 form 본문 직접 파싱
+    form = {k: v[0] for k, v in parse_qs((await request.body()).decode()).items()}
+    if "code" not in form:
+        raise HTTPException(status_code=400, detail="code is required")
+    code = form["code"]
+    data = _decode_code(code)
+    if data.get("provider") != provider:
+        raise HTTPException(status_code=400, detail="code was issued for another provider")
+    token = {"access_token": f"stub.{code}", "token_type": "Bearer", "expires_in": 3600}
+    if provider == "google":
+        now = int(time.time())
+        profile = _profile(provider, data["user"])
+        claims = {
+            "iss": str(request.url_for("stub_authorize", provider="google")).rsplit("/", 1)[0],
+            "aud": _client_id(authorization, form.get("client_id")),
+            "sub": profile["sub"],
+            "email": profile["email"],
+            "email_verified": True,
+            "name": profile["name"],
+            "iat": now,
+            "exp": now + 3600,
+        }
+        if data.get("nonce"):
+            claims["nonce"] = data["nonce"]
+        header = {"alg": "RS256", "kid": signing_key.kid}
+        token["id_token"] = jwt.encode(header, claims, signing_key).decode()
+        token["scope"] = "openid email profile"
+    return token
+
+
+@router.get("/google/userinfo")
+async def google_userinfo(authorization: Optional[str] = Header(None)):
+    profile = _profile("google", _bearer_code(authorization)["user"])
+    return {"sub": profile["sub"], "email": profile["email"], "name": profile["name"]}
+
+
+@router.get("/naver/me")
+async def naver_me(authorization: Optional[str] = Header(None)):
+    profile = _profile("naver", _bearer_code(authorization)["user"])
+    return {"resultcode": "00", "message": "success",
+            "response": {"id": profile["sub"], "email": profile["email"], "name": profile["name"]}}
+
+
+@router.get("/kakao/user/me")
+async def kakao_me(authorization: Optional[str] = Header(None)):
+    data = _bearer_code(authorization)
+    return {"id": 900000000 + data["user"]}
@@ -0,0 +1,105 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from dotenv import load_dotenv
+from passlib.context import CryptContext
+from starlette.concurrency import run_in_threadpool
+
+load_dotenv()  # .env 파일 자동 로드
+
+# ✅ bcrypt 전용 프로세스 풀
+# - bcrypt는 일부러 느린 CPU 작업이라 요청 워커에서 돌리면 로그인 몰릴 때 다른 API까지 같이 느려짐
+# - 전용 프로세스 몇 개에서만 돌리고, 대기 중인 작업이 PASSWORD_POOL_MAX_PENDING을 넘으면 바로 거절(503)
+# - BCRYPT_ROUNDS를 바꾸면 로그인 성공 시 새 cost로 다시 해시해서 저장 (rehash-on-login)
+# - PASSWORD_POOL_WORKERS=0 이면 프로세스 풀 없이 스레드풀에서 실행 (개발/테스트용)
+# 이 모듈은 spawn된 자식 프로세스에서도 import되므로 app/DB 관련 모듈을 import하지 않음
+
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+PASSWORD_POOL_WORKERS = int(os.getenv("PASSWORD_POOL_WORKERS", str(max(1, (os.cpu_count() or 2) // 2))))
+PASSWORD_POOL_MAX_PENDING = int(os.getenv("PASSWORD_POOL_MAX_PENDING", "64"))
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
+
+
+def _hash(password):
+    return pwd_context.hash(password)
+
+
+def _verify_and_update(password, hashed_password):
+    # (일치 여부, cost가 바뀌었으면 새 해시 아니면 None)
+    return pwd_context.verify_and_update(password, hashed_password)
+
+
+class PasswordPoolBusy(Exception):
+    pass
+
+
+class PasswordPool:
+    def __init__(self, workers=PASSWORD_POOL_WORKERS, max_pending=PASSWORD_POOL_MAX_PENDING):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor = None
+        # 이벤트 루프 스레드에서만 바뀌므로 락 불필요
+        self.pending = 0
+        self.peak_pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.rehashed = 0
+
+    def _get_executor(self):
+        if self._executor is None:
+            # fork는 이벤트 루프/DB 커넥션이 있는 프로세스를 복제하므로 spawn 사용
+            self._executor = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("spawn"))
+        return self._executor
+
+    async def _run(self, fn, *args):
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise PasswordPoolBusy()
+        self.pending += 1
+        self.peak_pending = max(self.peak_pending, self.pending)
+        try:
+            if self.workers > 0:
+                return await asyncio.get_running_loop().run_in_executor(self._get_executor(), fn, *args)
+            return await run_in_threadpool(fn, *args)
+        finally:
+            self.pending -= 1
+            self.completed += 1
+
+    async def hash(self, password):
+        return await self._run(_hash, password)
+
+    async def verify(self, password, hashed_password):
+        valid, new_hash = await self._run(_verify_and_update, password, hashed_password)
+        if new_hash:
+            self.rehashed += 1
+        return valid, new_hash
+
+    def start(self):
+        # 첫 로그인 때 프로세스 spawn 지연이 없도록 미리 띄움
+        if self.workers > 0:
+            executor = self._get_executor()
+            for _ in range(self.workers):
+                executor.submit(int)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self):
+        return {
+            "workers": self.workers,
+            "bcrypt_rounds": BCRYPT_ROUNDS,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "peak_pending": self.peak_pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "rehashed": self.rehashed,
+        }
+
+
+password_pool = PasswordPool()
@@ -3,22 +3,17 @@ from typing import Optional
 
 from dotenv import load_dotenv
 from fastapi import APIRouter, Depends, HTTPException
-from passlib.context import CryptContext
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models import Users as User
-from data.postgresDB import SessionLocal
+from app.login.password_pool import PasswordPoolBusy, password_pool
+from data.postgresDB import get_db
 from app.edit_user.edit_user import UserRead
 
 load_dotenv()  # .env 파일 자동 로드
 router = APIRouter()   # ✅ 모듈별 라우터
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
 SECRET_KEY=os.environ.get("SECRET_KEY")
 ALGORITHM = "HS256"
 
@@ -36,20 +31,26 @@ class UserRegister(BaseModel):
     class Config:
         from_attributes = True
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+async def hash_password(password: str) -> str:
+    # bcrypt 전용 프로세스 풀에서 해시, 풀이 꽉 차 있으면 바로 503
+    try:
+        return await password_pool.hash(password)
+    except PasswordPoolBusy:
+        raise HTTPException(status_code=503, detail="가입 요청이 많습니다. 잠시 후 다시 시도하세요.", headers={"Retry-After": "1"})
 
 @router.post("/new", response_model=UserRead)
-def register(data: UserRegister, db: Session = Depends(get_db)):
+async def register(data: UserRegister, db: AsyncSession = Depends(get_db)):
+    # *.local 은 소셜 로그인 임시 이메일 전용 (kakao_router), 미리 가입해 두면 남의 계정 이메일을 선점할 수 있음
+    if data.email.strip().lower().rstrip(".").endswith(".local"):
+        raise HTTPException(status_code=400, detail="Invalid email")
+
     # 이메일 중복 검사
-    user = db.query(User).filter(User.email == data.email).first()
+    user = await db.scalar(select(User).where(User.email == data.email))
     if user:
         raise HTTPException(status_code=400, detail="Email already registered")
 
     # ✅ 비밀번호 해시
-    hashed_pw = hash_password(data.password)
+    hashed_pw = await hash_password(data.password)
 
     user = User(
         login_id=data.login_id,
@@ -62,6 +63,6 @@ def register(data: UserRegister, db: Session = Depends(get_db)):
         age=data.age,
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
     return user
\ No newline at end of file
@@ -0,0 +1,52 @@
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import UserIdentities
+from app.models import Users as User
+
+# ✅ 소셜 로그인 유저 찾기/연결/가입 (google, naver, kakao 콜백 공용)
+# - (provider, provider_user_id) 기본키로 user_identities → users 한 번에 조회
+# - 연결이 없으면 이메일(unique 인덱스)로 기존 회원을 찾아 연결 (일반 가입 회원, 마이그레이션 전 google/naver 회원)
+#   단, 제공자가 확인한 실제 이메일일 때만 (kakao 임시 이메일로 연결하면 같은 이메일로 먼저 가입한 계정에 붙을 수 있음)
+# - 그래도 없으면 신규 가입. 같은 계정으로 동시에 첫 로그인하면 한쪽은 unique 위반 → 롤백 후 다시 조회
+
+
+async def find_user(db: AsyncSession, provider: str, provider_user_id: str):
+    return await db.scalar(
+        select(User)
+        .join(UserIdentities, UserIdentities.user_id == User.id)
+        .where(UserIdentities.provider == provider, UserIdentities.provider_user_id == provider_user_id)
+    )
+
+
+async def get_or_create_user(db: AsyncSession, provider: str, provider_user_id, email: str, name=None,
+                             verified_email: bool = True):
+    # (user, 신규 가입 여부)
+    provider_user_id = str(provider_user_id)
+    user = await find_user(db, provider, provider_user_id)
+    if user:
+        return user, False
+
+    created = False
+    try:
+        user = await db.scalar(select(User).where(User.email == email)) if verified_email else None
+        if not user:
+            user = User(email=email, name=name, oauth=provider)
+            db.add(user)
+            await db.flush()
+            created = True
+        db.add(UserIdentities(provider=provider, provider_user_id=provider_user_id, user_id=user.id))
+        await db.commit()
+    except IntegrityError:
+        # 동시에 들어온 다른 요청이 먼저 가입/연결함
+        await db.rollback()
+        user = await find_user(db, provider, provider_user_id)
+        if not user and verified_email:
+            user = await db.scalar(select(User).where(User.email == email))
+        if not user:
+            raise
+        return user, False
+
+    await db.refresh(user)
+    return user, created
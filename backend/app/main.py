@@ -4,15 +4,34 @@ from starlette.middleware.sessions import SessionMiddleware
 from starlette.responses import JSONResponse
 from fastapi.requests import Request
 from app.customer_center.customer_support import router as customer_support
+from app.customer_center.dashboard import router as support_dashboard
+from app.customer_center import dashboard
 from app.edit_user.edit_user import router as edit_user
 from app.forum.parent import router as parent
+from app.forum.children import router as reading
+from app.forum.search import router as search
+from app.words.similar import router as words_similar
+from app.words.autocomplete_router import router as words_autocomplete
+from app.words.synonyms_router import router as words_synonyms
+from app.games.word_chain_router import router as word_chain
+from app.games.quiz_router import router as quiz
+from app.games.leaderboard_router import router as games_leaderboard
+from app.games import quiz as quiz_pool
+from app.games import leaderboard
+from app.words import embedding_index, autocomplete, synonym_graph
 from app.login.register import router as register
 from app.login.naver_router import router as naver_router
 from app.login.google import router as google_router
 from app.login.additional_info import router as additional_info_router
 from app.login.kakao_router import router as kakao_router
 from app.login.login import router as login
+from app.login.password_pool import password_pool
+from app.login import oauth_client
+from app.internal.metrics import router as internal_metrics
+from data import sql_profiler
+from data.postgresDB import mark_primary_sticky
 from dotenv import load_dotenv
+import asyncio
 import uvicorn
 import os
 
@@ -35,6 +54,7 @@ app.add_middleware(
     allow_credentials=True,           # 쿠키 인증을 허용할지
     allow_methods=["*"],              # 허용할 HTTP 메소드
     allow_headers=["*"],              # 허용할 HTTP 헤더
+    expose_headers=["ETag", "Last-Modified"],  # 조건부 요청(If-None-Match)용 헤더를 JS에서 읽을 수 있게
 )
 # --- SessionMiddleware 추가 --- # 반드시 안전한 키로 교체
 app.add_middleware(SessionMiddleware, secret_key=SECRET_KEY)
@@ -43,8 +63,13 @@ app.include_router(additional_info_router, prefix="/auth", tags=["auth"])
 app.include_router(google_router, prefix="/auth/google", tags=["google"])
 app.include_router(naver_router, prefix="/auth/naver", tags=["naver"])
 app.include_router(kakao_router, prefix="/auth/kakao", tags=["kakao"])
+# 오프라인 테스트/벤치마크용 가짜 OAuth provider (OAUTH_STUB_URL 설정 시에만)
+if oauth_client.OAUTH_STUB_URL:
+    from app.login.oauth_stub import router as oauth_stub
+    app.include_router(oauth_stub, prefix="/oauth-stub", tags=["oauth-stub"], include_in_schema=False)
 # 고객센터
 app.include_router(customer_support, prefix="/customer-support", tags=["customer-support"])
+app.include_router(support_dashboard, prefix="/customer-support/dashboard", tags=["customer-support"])
 # 사용자 정보 수정/삭제
 app.include_router(edit_user, prefix="/user", tags=["user"])
 # 로그인/상태관리
@@ -53,6 +78,117 @@ app.include_router(login, prefix="/login_user", tags=["login"])
 app.include_router(register, prefix="/register", tags=["register"])
 #커뮤니티
 app.include_router(parent,prefix="/community/parent",tags=["community_parent"])
+app.include_router(reading,prefix="/community/reading",tags=["community_reading"])
+
+app.include_router(search, prefix="/search", tags=["search"])
+# 단어
+app.include_router(words_similar, prefix="/words", tags=["words"])
+app.include_router(words_autocomplete, prefix="/words", tags=["words"])
+app.include_router(words_synonyms, prefix="/words", tags=["words"])
+# 게임
+app.include_router(word_chain, prefix="/games/word-chain", tags=["games"])
+app.include_router(quiz, prefix="/games/quiz", tags=["games"])
+app.include_router(games_leaderboard, prefix="/games/leaderboard", tags=["games"])
+# 내부 모니터링
+app.include_router(internal_metrics, prefix="/internal", tags=["internal"], include_in_schema=False)
+
+# ✅ bcrypt 프로세스 풀: 서버 시작 시 미리 띄우고 종료 시 정리
+@app.on_event("startup")
+async def start_password_pool():
+    password_pool.start()
+
+@app.on_event("shutdown")
+async def stop_password_pool():
+    password_pool.shutdown()
+
+# ✅ 소셜 로그인 공용 HTTP 커넥션 풀 정리
+@app.on_event("shutdown")
+async def close_oauth_client():
+    await oauth_client.aclose()
+
+# ✅ 서버 수명 동안 도는 백그라운드 작업: 참조를 들고 있어야 GC로 사라지지 않음, 종료 시 취소
+background_tasks = set()
+
+def start_background(coro):
+    task = asyncio.create_task(coro)
+    background_tasks.add(task)
+    task.add_done_callback(_background_done)
+    return task
+
+def _background_done(task):
+    background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        print(f"백그라운드 작업 중단 ({task.get_coro().__qualname__}): {task.exception()!r}")
+
+# 다른 종료 핸들러(리더보드 저장 등)보다 먼저 등록 → 주기 작업을 먼저 멈춤
+@app.on_event("shutdown")
+async def stop_background_tasks():
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+
+# ✅ 고객센터 대시보드 집계 주기 보정 (SUPPORT_STATS_RECONCILE_SECONDS > 0 일 때)
+@app.on_event("startup")
+async def start_support_stats_reconcile():
+    if dashboard.SUPPORT_STATS_RECONCILE_SECONDS > 0:
+        start_background(dashboard.reconcile_periodically())
+
+# ✅ 단어 임베딩 인덱스: 시작 시 로드, 이후 바뀐 단어만 주기적으로 반영 (WORD_INDEX_REFRESH_SECONDS > 0 일 때)
+@app.on_event("startup")
+async def start_word_index_refresh():
+    if embedding_index.WORD_INDEX_REFRESH_SECONDS > 0:
+        start_background(embedding_index.refresh_periodically())
+
+# ✅ 단어 자동완성 인덱스: 시작 시 로드, 이후 바뀐 단어만 주기적으로 반영 (WORD_AUTOCOMPLETE_REFRESH_SECONDS > 0 일 때)
+@app.on_event("startup")
+async def start_word_autocomplete_refresh():
+    if autocomplete.WORD_AUTOCOMPLETE_REFRESH_SECONDS > 0:
+        start_background(autocomplete.refresh_periodically())
+
+# ✅ 유의어 그래프: 시작 시 로드, 이후 바뀐 단어만 주기적으로 반영 (WORD_SYNONYM_REFRESH_SECONDS > 0 일 때)
+@app.on_event("startup")
+async def start_synonym_graph_refresh():
+    if synonym_graph.WORD_SYNONYM_REFRESH_SECONDS > 0:
+        start_background(synonym_graph.refresh_periodically())
+
+# ✅ 단어 퀴즈 문제 풀: 시작 시 미리 채우고, 이후에는 줄어들면 백그라운드에서 채움
+@app.on_event("startup")
+async def start_quiz_pool():
+    if quiz_pool.QUIZ_POOL_SIZE > 0:
+        start_background(quiz_pool.fill_on_startup())
+
+# ✅ 게임 리더보드: 시작 시 스냅샷 복원, 이후 새 게임 기록만 주기적으로 반영/저장 (LEADERBOARD_SYNC_SECONDS > 0 일 때)
+@app.on_event("startup")
+async def start_leaderboard_sync():
+    if leaderboard.LEADERBOARD_SYNC_SECONDS > 0:
+        start_background(leaderboard.sync_periodically())
+
+@app.on_event("shutdown")
+async def save_leaderboard():
+    await leaderboard.save_on_shutdown()
+
+# ✅ 쓰기 성공 후 잠시 동안은 읽기도 primary에서 (복제본 지연으로 방금 쓴 글이 안 보이는 문제 방지)
+@app.middleware("http")
+async def read_your_writes(request: Request, call_next):
+    response = await call_next(request)
+    if request.method in ("POST", "PUT", "PATCH", "DELETE") and response.status_code < 400:
+        mark_primary_sticky(response)
+    return response
+
+# ✅ 요청별 SQL 쿼리 수/시간 기록, N+1 의심 쿼리 집계
+if sql_profiler.SQL_PROFILE_ENABLED:
+    @app.middleware("http")
+    async def sql_profile(request: Request, call_next):
+        profile, token = sql_profiler.start()
+        try:
+            response = await call_next(request)
+        finally:
+            sql_profiler.finish(token)
+        route = request.scope.get("route")
+        sql_profiler.report.add(f"{request.method} {route.path if route else request.url.path}", profile)
+        if sql_profiler.SQL_PROFILE_DEBUG:
+            sql_profiler.set_debug_headers(response, profile)
+        return response
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -1,7 +1,7 @@
 from typing import List, Optional
 
-from sqlalchemy import ARRAY, BigInteger, Boolean, CheckConstraint, Column, DateTime, Double, ForeignKeyConstraint, Identity, Index, Integer, PrimaryKeyConstraint, SmallInteger, String, Text, UniqueConstraint, Uuid, text
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import ARRAY, BigInteger, Boolean, CheckConstraint, Column, Computed, Date, DateTime, Double, ForeignKeyConstraint, Identity, Index, Integer, PrimaryKeyConstraint, SmallInteger, String, Text, UniqueConstraint, Uuid, text
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, declarative_base, mapped_column, relationship
 from sqlalchemy.orm.base import Mapped
 
@@ -42,6 +42,24 @@ class Users(Base):
     subscriptions: Mapped[List['Subscriptions']] = relationship('Subscriptions', uselist=True, back_populates='user')
     user_games: Mapped[List['UserGames']] = relationship('UserGames', uselist=True, back_populates='user')
     user_tests: Mapped[List['UserTests']] = relationship('UserTests', uselist=True, back_populates='user')
+    identities: Mapped[List['UserIdentities']] = relationship('UserIdentities', uselist=True, back_populates='user')
+
+
+class UserIdentities(Base):
+    __tablename__ = 'user_identities'
+    __table_args__ = (
+        CheckConstraint("provider::text = ANY (ARRAY['google'::character varying, 'naver'::character varying, 'kakao'::character varying]::text[])", name='user_identities_provider_check'),
+        ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE', name='user_identities_user_id_fkey'),
+        PrimaryKeyConstraint('provider', 'provider_user_id', name='user_identities_pkey'),
+        Index('ix_user_identities_user_id', 'user_id')
+    )
+
+    provider = mapped_column(String(20), nullable=False)
+    provider_user_id = mapped_column(String(255), nullable=False)
+    user_id = mapped_column(Integer, nullable=False)
+    created_at = mapped_column(DateTime, server_default=text('now()'))
+
+    user: Mapped['Users'] = relationship('Users', back_populates='identities')
 
 
 class Words(Base):
@@ -56,6 +74,7 @@ class Words(Base):
     definition = mapped_column(Text)
     synonyms = mapped_column(ARRAY(Text()))
     embedding = mapped_column(ARRAY(Double(precision=53)))
+    updated_at = mapped_column(DateTime, server_default=text('now()'))
 
     user_word_usage: Mapped[List['UserWordUsage']] = relationship('UserWordUsage', uselist=True, back_populates='word')
 
@@ -65,7 +84,11 @@ class CustomerSupport(Base):
         CheckConstraint("status::text = ANY (ARRAY['open'::character varying, 'in_progress'::character varying, 'resolved'::character varying, 'closed'::character varying]::text[])", name='customer_support_status_check'),
         ForeignKeyConstraint(['parent_id'], ['customer_support.id'], ondelete='CASCADE', name='customer_support_parent_id_fkey'),
         ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE', name='customer_support_user_id_fkey'),
-        PrimaryKeyConstraint('id', name='customer_support_pkey')
+        PrimaryKeyConstraint('id', name='customer_support_pkey'),
+        Index('ix_customer_support_top_created_id', 'created_at', 'id', postgresql_where=text('parent_id IS NULL')),
+        Index('ix_customer_support_active_created_id', 'created_at', 'id', postgresql_where=text("parent_id IS NULL AND status IN ('open', 'in_progress')")),
+        Index('ix_customer_support_user_created_id', 'user_id', 'created_at', 'id', postgresql_where=text('parent_id IS NULL')),
+        Index('ix_customer_support_parent_id', 'parent_id', postgresql_where=text('parent_id IS NOT NULL'))
     )
 
     id = mapped_column(Integer)
@@ -77,12 +100,35 @@ class CustomerSupport(Base):
     status = mapped_column(String(20))
     created_at = mapped_column(DateTime, server_default=text('now()'))
     updated_at = mapped_column(DateTime, server_default=text('now()'))
+    resolved_at = mapped_column(DateTime)  # resolved/closed가 된 시각 (트리거로 유지)
 
     parent: Mapped[Optional['CustomerSupport']] = relationship('CustomerSupport', remote_side=[id], back_populates='parent_reverse')
     parent_reverse: Mapped[List['CustomerSupport']] = relationship('CustomerSupport', uselist=True, remote_side=[parent_id], back_populates='parent')
     user: Mapped[Optional['Users']] = relationship('Users', back_populates='customer_support')
 
 
+class CustomerSupportStats(Base):
+    __tablename__ = 'customer_support_stats'
+    __table_args__ = (
+        PrimaryKeyConstraint('day', 'status', 'category', name='customer_support_stats_pkey'),
+    )
+
+    day = mapped_column(Date, nullable=False)
+    status = mapped_column(String(20), nullable=False)
+    category = mapped_column(String(50), nullable=False, server_default=text("''::character varying"))
+    tickets = mapped_column(Integer, nullable=False, server_default=text('0'))
+
+
+class CustomerSupportResolveHist(Base):
+    __tablename__ = 'customer_support_resolve_hist'
+    __table_args__ = (
+        PrimaryKeyConstraint('bucket', name='customer_support_resolve_hist_pkey'),
+    )
+
+    bucket = mapped_column(SmallInteger)
+    tickets = mapped_column(Integer, nullable=False, server_default=text('0'))
+
+
 class DailyWritings(Base):
     __tablename__ = 'daily_writings'
     __table_args__ = (
@@ -136,7 +182,10 @@ class ParentForumPosts(Base):
     __table_args__ = (
         ForeignKeyConstraint(['parent_id'], ['parent_forum_posts.id'], ondelete='CASCADE', name='parent_forum_posts_parent_id_fkey'),
         ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE', name='parent_forum_posts_user_id_fkey'),
-        PrimaryKeyConstraint('id', name='parent_forum_posts_pkey')
+        PrimaryKeyConstraint('id', name='parent_forum_posts_pkey'),
+        Index('ix_parent_forum_posts_top_created_id', 'created_at', 'id', postgresql_where=text('parent_id IS NULL')),
+        Index('ix_parent_forum_posts_parent_id', 'parent_id', postgresql_where=text('parent_id IS NOT NULL')),
+        Index('ix_parent_forum_posts_search', 'search_vector', postgresql_using='gin', postgresql_where=text('parent_id IS NULL'))
     )
 
     id = mapped_column(Integer)
@@ -148,28 +197,49 @@ class ParentForumPosts(Base):
     updated_at = mapped_column(DateTime, server_default=text('now()'))
     category = mapped_column(String(50))
     is_important = mapped_column(Boolean, server_default=text('false'))
+    comment_count = mapped_column(Integer, nullable=False, server_default=text('0'))
+    # 검색용 bigram tsvector (DB가 쓰기 시점에 계산), 일반 조회에서는 불러오지 않음
+    search_vector = mapped_column(TSVECTOR, Computed(
+        "setweight(to_tsvector('simple', korean_terms(title)), 'A') || "
+        "setweight(to_tsvector('simple', korean_terms(category)), 'B') || "
+        "setweight(to_tsvector('simple', korean_terms(content)), 'C')",
+        persisted=True), deferred=True)
 
     parent: Mapped[Optional['ParentForumPosts']] = relationship('ParentForumPosts', remote_side=[id], back_populates='parent_reverse')
-    parent_reverse: Mapped[List['ParentForumPosts']] = relationship('ParentForumPosts', uselist=True, remote_side=[parent_id], back_populates='parent')
+    parent_reverse: Mapped[List['ParentForumPosts']] = relationship('ParentForumPosts', uselist=True, remote_side=[parent_id], back_populates='parent', passive_deletes=True)
     user: Mapped[Optional['Users']] = relationship('Users', back_populates='parent_forum_posts')
 
 
 class ReadingForumPosts(Base):
     __tablename__ = 'reading_forum_posts'
     __table_args__ = (
+        ForeignKeyConstraint(['parent_id'], ['reading_forum_posts.id'], ondelete='CASCADE', name='reading_forum_posts_parent_id_fkey'),
         ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE', name='reading_forum_posts_user_id_fkey'),
-        PrimaryKeyConstraint('id', name='reading_forum_posts_pkey')
+        PrimaryKeyConstraint('id', name='reading_forum_posts_pkey'),
+        Index('ix_reading_forum_posts_top_created_id', 'created_at', 'id', postgresql_where=text('parent_id IS NULL')),
+        Index('ix_reading_forum_posts_parent_id', 'parent_id', postgresql_where=text('parent_id IS NOT NULL')),
+        Index('ix_reading_forum_posts_search', 'search_vector', postgresql_using='gin', postgresql_where=text('parent_id IS NULL'))
     )
 
     id = mapped_column(Integer)
     title = mapped_column(String(255), nullable=False)
     content = mapped_column(Text, nullable=False)
     user_id = mapped_column(Integer)
+    parent_id = mapped_column(Integer)
     created_at = mapped_column(DateTime, server_default=text('now()'))
     updated_at = mapped_column(DateTime, server_default=text('now()'))
     book_title = mapped_column(String(255))
     discussion_tags = mapped_column(String(100))
-
+    comment_count = mapped_column(Integer, nullable=False, server_default=text('0'))
+    # 검색용 bigram tsvector (DB가 쓰기 시점에 계산), 일반 조회에서는 불러오지 않음
+    search_vector = mapped_column(TSVECTOR, Computed(
+        "setweight(to_tsvector('simple', korean_terms(title)), 'A') || "
+        "setweight(to_tsvector('simple', korean_terms(coalesce(book_title, '') || ' ' || coalesce(discussion_tags, ''))), 'B') || "
+        "setweight(to_tsvector('simple', korean_terms(content)), 'C')",
+        persisted=True), deferred=True)
+
+    parent: Mapped[Optional['ReadingForumPosts']] = relationship('ReadingForumPosts', remote_side=[id], back_populates='parent_reverse')
+    parent_reverse: Mapped[List['ReadingForumPosts']] = relationship('ReadingForumPosts', uselist=True, remote_side=[parent_id], back_populates='parent', passive_deletes=True)
     user: Mapped[Optional['Users']] = relationship('Users', back_populates='reading_forum_posts')
 
 
@@ -230,6 +300,35 @@ class UserGames(Base):
     user: Mapped[Optional['Users']] = relationship('Users', back_populates='user_games')
 
 
+class LeaderboardEntries(Base):
+    __tablename__ = 'leaderboard_entries'
+    __table_args__ = (
+        CheckConstraint("period::text = ANY (ARRAY['daily'::character varying, 'weekly'::character varying, 'all'::character varying]::text[])", name='leaderboard_entries_period_check'),
+        ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE', name='leaderboard_entries_user_id_fkey'),
+        PrimaryKeyConstraint('game_type', 'period', 'period_key', 'user_id', name='leaderboard_entries_pkey'),
+        Index('ix_leaderboard_entries_user_id', 'user_id')
+    )
+
+    game_type = mapped_column(String(50), nullable=False)
+    period = mapped_column(String(10), nullable=False)
+    period_key = mapped_column(String(10), nullable=False)
+    user_id = mapped_column(Integer, nullable=False)
+    score = mapped_column(Integer, nullable=False)
+    achieved_at = mapped_column(DateTime)
+
+
+class LeaderboardSnapshots(Base):
+    __tablename__ = 'leaderboard_snapshots'
+    __table_args__ = (
+        PrimaryKeyConstraint('id', name='leaderboard_snapshots_pkey'),
+    )
+
+    id = mapped_column(Integer)
+    last_game_id = mapped_column(Integer, nullable=False)
+    entries = mapped_column(Integer, nullable=False, server_default=text('0'))
+    saved_at = mapped_column(DateTime, server_default=text('now()'))
+
+
 class UserTests(Base):
     __tablename__ = 'user_tests'
     __table_args__ = (
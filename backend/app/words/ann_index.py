@@ -0,0 +1,170 @@
+import os
+
+import numpy as np
+
+# ✅ 근사 최근접 이웃(ANN) 인덱스: IVF (inverted file), numpy만 사용
+# - 정규화된 벡터를 spherical k-means로 nlist개 군집으로 나누고, 질의와 가까운 nprobe개 군집 안에서만 정확히 점수 계산
+#   → 단어 수 n 전부가 아니라 약 n × nprobe / nlist 개만 계산
+# - nprobe를 올리면 recall↑ 지연↑ (nprobe = nlist 이면 전수 검색과 같음)
+# - label: 호출하는 쪽이 정하는 정수 (embedding_index에서는 스냅샷 행 번호)
+# - 한 번 만든 인덱스는 바꾸지 않음. relabel()/add()는 새 인덱스를 돌려줌 (검색 중인 스냅샷과 충돌 없음)
+# - vectors가 int8(임베딩 저장소의 양자화 파일)이면 scales(행별 배율)를 곱해서 점수 계산
+# 군집 중심은 build 때 고정이라 추가된 벡터가 많아지면(drift) 다시 build 하는 것이 좋음
+
+
+def kmeans(vectors, nlist, iters=10, sample=None, seed=0, batch=65536):
+    # spherical k-means (코사인 유사도 기준), 중심도 정규화해서 반환
+    rng = np.random.default_rng(seed)
+    if sample and len(vectors) > sample:
+        vectors = vectors[rng.choice(len(vectors), sample, replace=False)]
+    nlist = min(nlist, len(vectors))
+    centroids = vectors[rng.choice(len(vectors), nlist, replace=False)].copy()
+    for _ in range(iters):
+        assign = assign_lists(vectors, centroids, batch)
+        counts = np.bincount(assign, minlength=nlist)
+        empty = counts == 0
+        # 군집별 합: 군집 순으로 정렬한 뒤 구간 합 (np.add.at보다 훨씬 빠름)
+        sums = np.zeros_like(centroids)
+        starts = np.cumsum(counts) - counts
+        sums[~empty] = np.add.reduceat(vectors[np.argsort(assign, kind="stable")], starts[~empty], axis=0)
+        if empty.any():
+            # 빈 군집은 아무 점으로 다시 시작
+            sums[empty] = vectors[rng.choice(len(vectors), int(empty.sum()), replace=False)]
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        centroids = np.divide(sums, norms, out=np.zeros_like(sums), where=norms > 0)
+    return centroids.astype(np.float32)
+
+
+def assign_lists(vectors, centroids, batch=65536):
+    out = np.empty(len(vectors), dtype=np.int64)
+    for start in range(0, len(vectors), batch):
+        out[start:start + batch] = np.argmax(vectors[start:start + batch] @ centroids.T, axis=1)
+    return out
+
+
+class IVFIndex:
+    def __init__(self, centroids, vectors, labels, offsets, built_size=None, added=0, scales=None):
+        # vectors/labels는 군집 순서로 정렬되어 있고, 군집 c는 [offsets[c], offsets[c+1])
+        self.centroids = centroids
+        self.vectors = vectors
+        self.labels = labels
+        self.offsets = offsets
+        self.built_size = built_size if built_size is not None else len(labels)
+        self.added = added  # build 이후 add()로 들어온 벡터 수
+        self.scales = scales  # int8 벡터일 때 행별 배율, float32면 None
+
+    @property
+    def nlist(self):
+        return len(self.centroids)
+
+    @property
+    def dim(self):
+        return self.centroids.shape[1]
+
+    def __len__(self):
+        return len(self.labels)
+
+    @classmethod
+    def from_lists(cls, centroids, vectors, labels, assign, built_size=None, added=0):
+        order = np.argsort(assign, kind="stable")
+        counts = np.bincount(assign, minlength=len(centroids))
+        offsets = np.zeros(len(centroids) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        return cls(centroids, np.ascontiguousarray(vectors[order], dtype=np.float32),
+                   np.asarray(labels, dtype=np.int64)[order], offsets, built_size, added)
+
+    @classmethod
+    def build(cls, vectors, labels=None, nlist=None, iters=10, train_per_list=64, seed=0):
+        # vectors: (n, dim) 정규화된 float32
+        if labels is None:
+            labels = np.arange(len(vectors))
+        nlist = nlist or default_nlist(len(vectors))
+        centroids = kmeans(vectors, nlist, iters=iters, sample=nlist * train_per_list, seed=seed)
+        return cls.from_lists(centroids, vectors, labels, assign_lists(vectors, centroids))
+
+    def list_ids(self):
+        # 저장 순서대로 각 벡터의 군집 번호
+        return np.repeat(np.arange(self.nlist), np.diff(self.offsets))
+
+    def add(self, vectors, labels):
+        # 기존 군집 중심에 배정해서 추가한 새 인덱스
+        if not len(labels):
+            return self
+        if self.scales is not None:
+            raise ValueError("양자화된 인덱스에는 추가할 수 없습니다. (저장소를 다시 export)")
+        assign = np.concatenate([self.list_ids(), assign_lists(vectors, self.centroids)])
+        return IVFIndex.from_lists(self.centroids, np.concatenate([self.vectors, vectors]),
+                                   np.concatenate([self.labels, labels]), assign, self.built_size, self.added + len(labels))
+
+    def relabel(self, label_map):
+        # label_map[old_label] = new_label (-1이면 삭제)
+        new_labels = label_map[self.labels]
+        keep = new_labels >= 0
+        if keep.all():
+            return IVFIndex(self.centroids, self.vectors, new_labels, self.offsets, self.built_size, self.added, self.scales)
+        counts = np.bincount(self.list_ids()[keep], minlength=self.nlist)
+        offsets = np.zeros(self.nlist + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        scales = self.scales[keep] if self.scales is not None else None
+        return IVFIndex(self.centroids, self.vectors[keep], new_labels[keep], offsets, self.built_size, self.added, scales)
+
+    def drift(self):
+        # build 이후 추가된 비율 (군집 중심이 현재 데이터를 얼마나 못 대표하는지의 대략적인 지표)
+        return self.added / max(self.built_size, 1)
+
+    def search(self, queries, k=10, nprobe=8):
+        # queries: (질의 수, dim) 정규화된 float32 → 질의별 (labels, scores), 점수 내림차순
+        nprobe = max(1, min(nprobe, self.nlist))
+        coarse = queries @ self.centroids.T
+        probes = np.argpartition(-coarse, nprobe - 1, axis=1)[:, :nprobe]
+        results = []
+        for q, lists in enumerate(probes):
+            rows = np.concatenate([np.arange(self.offsets[c], self.offsets[c + 1]) for c in lists])
+            if not len(rows):
+                results.append((np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)))
+                continue
+            scores = np.asarray(self.vectors[rows], dtype=np.float32) @ queries[q]
+            if self.scales is not None:
+                scores *= self.scales[rows]
+            top = min(k, len(rows))
+            idx = np.argpartition(-scores, top - 1)[:top]
+            idx = idx[np.argsort(-scores[idx], kind="stable")]
+            results.append((self.labels[rows[idx]], scores[idx]))
+        return results
+
+    def save(self, path, keys=None):
+        # keys: label → 외부 키(word_id 문자열 등). 다른 프로세스에서 load 후 label을 다시 맞출 때 사용
+        data = dict(centroids=self.centroids, vectors=self.vectors, labels=self.labels,
+                    offsets=self.offsets, built_size=np.int64(self.built_size), added=np.int64(self.added))
+        if keys is not None:
+            data["keys"] = np.asarray([keys[label] for label in self.labels], dtype=str)
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            np.savez(f, **data)
+        os.replace(tmp, path)  # 읽는 쪽이 쓰다 만 파일을 보지 않도록
+
+    @classmethod
+    def load(cls, path):
+        # (인덱스, keys 또는 None)
+        with np.load(path, allow_pickle=False) as data:
+            index = cls(data["centroids"], data["vectors"], data["labels"], data["offsets"],
+                        int(data["built_size"]), int(data["added"]))
+            keys = data["keys"] if "keys" in data.files else None
+        return index, keys
+
+    def stats(self):
+        sizes = np.diff(self.offsets)
+        return {
+            "nlist": self.nlist,
+            "vectors": len(self),
+            "built_size": self.built_size,
+            "added": self.added,
+            "drift": round(self.drift(), 4),
+            "list_size_max": int(sizes.max()) if len(sizes) else 0,
+            "list_size_mean": round(float(sizes.mean()), 1) if len(sizes) else 0.0,
+        }
+
+
+def default_nlist(n):
+    # 보통 4√n 정도 (10만 → 약 1260)
+    return max(1, int(4 * np.sqrt(n)))
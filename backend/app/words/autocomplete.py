@@ -0,0 +1,97 @@
+import asyncio
+import os
+import threading
+import time
+
+from dotenv import load_dotenv
+from sqlalchemy import select
+from starlette.concurrency import run_in_threadpool
+
+from app.models import Words
+from app.words.prefix_index import EMPTY, FUZZY_MIN_JAMO, PrefixIndex
+from data.postgresDB import SessionLocal
+
+load_dotenv()  # .env 파일 자동 로드
+
+# ✅ 단어 자동완성 인덱스 (words.word_text, 메모리)
+# LIKE '사%' 로는 입력 중인 음절('삵' 치는 중의 '살')이나 초성('ㅅㄹ')을 찾을 수 없음
+# → 단어를 자모 문자열로 풀어('사랑' → ㅅㅏㄹㅏㅇ) 정렬된 배열에 두고 이진 탐색으로 접두어 구간을 찾음
+#   - 접두어: 질의도 자모로 풀어서 찾음 ('살' → ㅅㅏㄹ 이 '사랑'의 접두어, '갑' → '가방')
+#   - 초성: 자음만 입력하면('ㅅㄹ') 초성 문자열 배열에서 찾음
+#   - 오타: 접두어 결과가 모자라면 자모 기준 편집 거리 1 (한 글자 빠짐/더함/바뀜)까지 채움
+# 검색은 bisect 몇 번이라 수 µs (스레드풀 없이 이벤트 루프에서 바로 처리)
+# 갱신은 임베딩 인덱스와 같은 방식: (word_id, updated_at)만 비교해 바뀐 단어만 다시 읽고 새 스냅샷으로 교체
+# 워커마다 따로 가짐: 단어 10만 개 기준 약 40MB
+
+WORD_AUTOCOMPLETE_REFRESH_SECONDS = float(os.getenv("WORD_AUTOCOMPLETE_REFRESH_SECONDS", "300"))  # 0이면 주기 갱신 안 함
+
+
+class AutocompleteIndex:
+    def __init__(self):
+        self.snapshot = EMPTY
+        self._refresh_lock = threading.Lock()
+        self.loaded_at = None
+        self.refreshes = 0
+        self.last_changed = 0
+        self.last_removed = 0
+        self.last_refresh_ms = 0.0
+
+    def refresh(self):
+        # 동기 함수 (DB 조회 + 배열 재구성) → run_in_threadpool 에서 호출
+        with self._refresh_lock:
+            start = time.perf_counter()
+            old = self.snapshot
+            with SessionLocal() as db:
+                versions = dict(db.execute(select(Words.word_id, Words.updated_at)).all())
+                changed = [word_id for word_id, updated_at in versions.items()
+                           if word_id not in old.versions or old.versions[word_id][0] != updated_at]
+                removed = old.versions.keys() - versions.keys()
+                rows = []
+                for i in range(0, len(changed), 1000):
+                    rows += db.execute(
+                        select(Words.word_id, Words.word_text, Words.updated_at)
+                        .where(Words.word_id.in_(changed[i:i + 1000]))
+                    ).all()
+            if self.loaded_at is None:
+                self.snapshot = PrefixIndex.build({word_id: (updated_at, (word_id, word_text))
+                                                   for word_id, word_text, updated_at in rows})
+            elif rows or removed:
+                self.snapshot = old.apply(rows, removed)
+            self.loaded_at = time.time()
+            self.refreshes += 1
+            self.last_changed = len(rows)
+            self.last_removed = len(removed)
+            self.last_refresh_ms = round((time.perf_counter() - start) * 1000, 1)
+            return self.snapshot
+
+    def ensure_loaded(self):
+        if self.loaded_at is None:
+            self.refresh()
+        return self.snapshot
+
+    def complete(self, query, limit=10, fuzzy=True):
+        return self.snapshot.complete(query, limit, fuzzy)
+
+    def stats(self):
+        return {
+            "words": len(self.snapshot),
+            "loaded_at": self.loaded_at,
+            "refreshes": self.refreshes,
+            "last_changed": self.last_changed,
+            "last_removed": self.last_removed,
+            "last_refresh_ms": self.last_refresh_ms,
+            "fuzzy_min_jamo": FUZZY_MIN_JAMO,
+        }
+
+
+autocomplete_index = AutocompleteIndex()
+
+
+async def refresh_periodically():
+    # 서버 시작 시 한 번 로드하고, 이후 바뀐 단어만 주기적으로 반영
+    while True:
+        try:
+            await run_in_threadpool(autocomplete_index.refresh)
+        except Exception as e:
+            print(f"단어 자동완성 인덱스 갱신 실패: {e}")
+        await asyncio.sleep(WORD_AUTOCOMPLETE_REFRESH_SECONDS)
@@ -0,0 +1,38 @@
+from typing import List
+from uuid import UUID
+
+from fastapi import APIRouter, Query
+from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
+
+from app.words.autocomplete import autocomplete_index
+
+# ✅ 단어 자동완성 (접두어 / 초성 / 오타 보정, app/words/autocomplete.py)
+router = APIRouter()
+
+MAX_LIMIT = 50
+
+
+class AutocompleteWord(BaseModel):
+    word_id: UUID
+    word_text: str
+    fuzzy: bool  # 오타 보정(편집 거리 1)으로 찾은 단어
+
+
+class AutocompleteResult(BaseModel):
+    query: str
+    mode: str  # prefix | choseong
+    items: List[AutocompleteWord]
+
+
+@router.get("/autocomplete", response_model=AutocompleteResult)
+async def autocomplete(q: str = Query(..., min_length=1, max_length=50), limit: int = Query(10, ge=1, le=MAX_LIMIT),
+                       fuzzy: bool = True):
+    if autocomplete_index.loaded_at is None:
+        await run_in_threadpool(autocomplete_index.ensure_loaded)
+    # 검색 자체는 수 µs라 이벤트 루프에서 바로 처리
+    mode, hits = autocomplete_index.complete(q, limit, fuzzy)
+    return AutocompleteResult(query=q, mode=mode, items=[
+        AutocompleteWord(word_id=word_id, word_text=word_text, fuzzy=is_fuzzy)
+        for (word_id, word_text), is_fuzzy in hits
+    ])
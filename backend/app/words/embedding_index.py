@@ -0,0 +1,311 @@
+import asyncio
+import os
+import threading
+import time
+
+import numpy as np
+from dotenv import load_dotenv
+from sqlalchemy import select
+from starlette.concurrency import run_in_threadpool
+
+from app.models import Words
+from app.words.ann_index import IVFIndex
+from app.words.embedding_store import WORD_EMBEDDING_STORE_DIR, EmbeddingStore, current_path, dequantize
+from app.words.vectors import normalize, top_k
+from data.postgresDB import SessionLocal
+
+load_dotenv()  # .env 파일 자동 로드
+
+# ✅ 단어 임베딩 유사도 검색 (words.embedding, 코사인 유사도 top-k)
+# - 모든 임베딩을 한 번에 읽어 float32 연속 행렬 (단어 수 × 차원)로 메모리에 올리고, 행마다 미리 정규화
+#   → 코사인 유사도 = 행렬 @ 질의벡터 한 번 (여러 질의도 행렬곱 한 번)
+# - 갱신은 증분: (word_id, updated_at)만 읽어 비교하고, 바뀐/새 단어의 임베딩만 다시 읽음 (words_touch 트리거)
+# - 갱신 중에도 검색은 이전 스냅샷으로 계속 처리 (스냅샷 교체는 참조 한 번 바꾸는 것)
+# - 단어가 WORD_ANN_MIN_WORDS 이상이면 IVF 근사 인덱스(app/words/ann_index.py)로 검색 (exact=True면 전수 검색)
+#   갱신 때는 인덱스도 증분 반영하고, build 이후 추가된 비율이 WORD_ANN_REBUILD_DRIFT를 넘으면 다시 build
+# - WORD_EMBEDDING_STORE_DIR을 설정하면 DB 대신 export된 파일(app/words/embedding_store.py)을 mmap으로 열어서 사용
+#   (워커끼리 페이지 공유, 갱신은 새 버전이 공개됐는지만 확인)
+# DB 모드에서는 워커 프로세스마다 따로 가짐: 단어 수 × 차원 × 4바이트 (예: 10만 × 300 → 약 115MB, ANN 인덱스도 같은 크기)
+
+WORD_INDEX_REFRESH_SECONDS = float(os.getenv("WORD_INDEX_REFRESH_SECONDS", "300"))  # 0이면 주기 갱신 안 함
+SCORE_BATCH_ROWS = int(os.getenv("WORD_INDEX_SCORE_BATCH_ROWS", "16384"))  # 한 번에 점수 계산할 행 수 (메모리 상한)
+WORD_ANN_MIN_WORDS = int(os.getenv("WORD_ANN_MIN_WORDS", "50000"))  # 이보다 적으면 전수 검색이 충분히 빠름
+WORD_ANN_NLIST = int(os.getenv("WORD_ANN_NLIST", "0"))              # 군집 수, 0이면 4√n
+WORD_ANN_NPROBE = int(os.getenv("WORD_ANN_NPROBE", "16"))           # 질의마다 볼 군집 수 (recall ↔ 지연)
+WORD_ANN_REBUILD_DRIFT = float(os.getenv("WORD_ANN_REBUILD_DRIFT", "0.2"))
+WORD_ANN_PATH = os.getenv("WORD_ANN_PATH")  # 설정하면 build한 인덱스를 저장하고, 다음 시작 때 불러와서 k-means 생략
+
+
+class Snapshot:
+    # 한 번 만들면 바꾸지 않음 (갱신은 새 스냅샷을 만들어 교체)
+    def __init__(self, matrix, word_ids, texts, versions, ann=None, scales=None, store=None):
+        self.matrix = matrix          # (n, dim) float32(또는 저장소의 int8 mmap), 행 정규화됨
+        self.scales = scales          # matrix가 int8이면 행별 배율
+        self.ann = ann                # IVFIndex (label = 행 번호) 또는 None
+        self.store = store            # 저장소 버전 이름 (DB 모드면 None)
+        self.word_ids = word_ids      # 행 번호 → word_id
+        self.texts = texts            # 행 번호 → word_text
+        self.versions = versions      # word_id → updated_at
+        self.row_of = {word_id: row for row, word_id in enumerate(word_ids)}
+        self.row_of_text = {text: row for row, text in enumerate(texts)}
+
+    @property
+    def dim(self):
+        return self.matrix.shape[1]
+
+    def __len__(self):
+        return len(self.word_ids)
+
+    def vectors(self, rows):
+        # 행 번호들 → float32 벡터
+        return dequantize(self.matrix[rows], self.scales[rows] if self.scales is not None else None)
+
+    @classmethod
+    def from_store(cls, store: EmbeddingStore):
+        return cls(store.vectors, store.ids(), store.texts or [], {}, ann=store.ann(),
+                   scales=store.scales, store=store.version)
+
+
+EMPTY = Snapshot(np.zeros((0, 0), dtype=np.float32), [], [], {})
+
+
+class EmbeddingIndex:
+    def __init__(self):
+        self.snapshot = EMPTY
+        self._refresh_lock = threading.Lock()
+        self.loaded_at = None
+        self.refreshes = 0
+        self.last_changed = 0
+        self.last_removed = 0
+        self.last_refresh_ms = 0.0
+        self.skipped = 0  # 차원이 다르거나 길이 0이라 제외한 임베딩 수
+        self._rejected = {}  # 제외한 word_id → updated_at (바뀌기 전까지 다시 읽지 않음)
+        self.ann_builds = 0
+        self.last_ann_build_ms = 0.0
+
+    # --- 갱신 ---
+
+    def refresh(self):
+        # 동기 함수 (DB 조회 + 행렬 재구성) → run_in_threadpool / 배치 스크립트에서 호출
+        if WORD_EMBEDDING_STORE_DIR:
+            return self._refresh_from_store()
+        with self._refresh_lock:
+            start = time.perf_counter()
+            old = self.snapshot
+            with SessionLocal() as db:
+                versions = dict(db.execute(
+                    select(Words.word_id, Words.updated_at).where(Words.embedding.is_not(None))
+                ).all())
+                known = {**self._rejected, **old.versions}
+                changed = [word_id for word_id, updated_at in versions.items()
+                           if word_id not in known or known[word_id] != updated_at]
+                removed = old.versions.keys() - versions.keys()
+                self._rejected = {word_id: self._rejected[word_id] for word_id in self._rejected.keys() & versions.keys()}
+                rows = []
+                for i in range(0, len(changed), 1000):
+                    rows += db.execute(
+                        select(Words.word_id, Words.word_text, Words.embedding, Words.updated_at)
+                        .where(Words.word_id.in_(changed[i:i + 1000]))
+                    ).all()
+            if changed or removed or self.loaded_at is None:
+                self.snapshot = self._apply(old, rows, removed)
+            self.loaded_at = time.time()
+            self.refreshes += 1
+            self.last_changed = len(rows)
+            self.last_removed = len(removed)
+            self.last_refresh_ms = round((time.perf_counter() - start) * 1000, 1)
+            return self.snapshot
+
+    def _refresh_from_store(self):
+        # 새 버전이 공개됐을 때만 다시 엶 (이전 mmap은 참조가 없어지면 닫힘)
+        with self._refresh_lock:
+            start = time.perf_counter()
+            path = current_path("words")
+            if path is None:
+                raise FileNotFoundError(f"임베딩 저장소가 없습니다: {WORD_EMBEDDING_STORE_DIR}/words "
+                                        "(python -m data.export_embeddings 먼저 실행)")
+            changed = os.path.basename(path) != self.snapshot.store
+            if changed:
+                self.snapshot = Snapshot.from_store(EmbeddingStore(path))
+            self.loaded_at = time.time()
+            self.refreshes += 1
+            self.last_changed = len(self.snapshot) if changed else 0
+            self.last_removed = 0
+            self.last_refresh_ms = round((time.perf_counter() - start) * 1000, 1)
+            return self.snapshot
+
+    def _apply(self, old, rows, removed):
+        # old 스냅샷에 바뀐 행(rows)과 삭제(removed)를 반영한 새 스냅샷
+        dim = old.dim if len(old) else None
+        if dim is None:
+            # 처음 로드: 가장 많은 차원을 기준으로 (다른 차원은 제외)
+            dims = [len(embedding) for _, _, embedding, _ in rows if embedding]
+            if not dims:
+                self.skipped += len(rows)
+                self._rejected.update({word_id: updated_at for word_id, _, _, updated_at in rows})
+                return EMPTY
+            dim = max(set(dims), key=dims.count)
+
+        updates = {}
+        for word_id, word_text, embedding, updated_at in rows:
+            if not embedding or len(embedding) != dim:
+                self.skipped += 1
+                self._rejected[word_id] = updated_at
+                removed = removed | {word_id}
+                continue
+            updates[word_id] = (word_text, embedding, updated_at)
+
+        keep = [row for row, word_id in enumerate(old.word_ids) if word_id not in removed and word_id not in updates]
+        new_ids = list(updates)
+        vectors = normalize(np.array([updates[word_id][1] for word_id in new_ids], dtype=np.float32).reshape(-1, dim))
+        if len(vectors):
+            zero = ~vectors.any(axis=1)
+            if zero.any():
+                self.skipped += int(zero.sum())
+                self._rejected.update({word_id: updates[word_id][2] for word_id, z in zip(new_ids, zero) if z})
+                new_ids = [word_id for word_id, z in zip(new_ids, zero) if not z]
+                vectors = vectors[~zero]
+
+        matrix = np.ascontiguousarray(np.concatenate([old.matrix[keep].reshape(-1, dim), vectors]), dtype=np.float32)
+        word_ids = [old.word_ids[row] for row in keep] + new_ids
+        texts = [old.texts[row] for row in keep] + [updates[word_id][0] for word_id in new_ids]
+        versions = {word_id: old.versions[word_id] for word_id in word_ids[:len(keep)]}
+        versions.update({word_id: updates[word_id][2] for word_id in new_ids})
+
+        ann = None
+        if len(word_ids) >= WORD_ANN_MIN_WORDS:
+            if old.ann is not None:
+                # 남은 행은 새 행 번호로, 바뀌거나 지운 행은 빼고, 새 행은 기존 군집에 추가
+                label_map = np.full(len(old), -1, dtype=np.int64)
+                label_map[keep] = np.arange(len(keep))
+                ann = old.ann.relabel(label_map).add(vectors, np.arange(len(keep), len(word_ids)))
+            else:
+                ann = self._load_ann(matrix, word_ids)
+            if ann is None or ann.drift() > WORD_ANN_REBUILD_DRIFT:
+                ann = self._build_ann(matrix, word_ids)
+        return Snapshot(matrix, word_ids, texts, versions, ann)
+
+    def _build_ann(self, matrix, word_ids):
+        start = time.perf_counter()
+        ann = IVFIndex.build(matrix, nlist=WORD_ANN_NLIST or None)
+        self.ann_builds += 1
+        self.last_ann_build_ms = round((time.perf_counter() - start) * 1000, 1)
+        if WORD_ANN_PATH:
+            try:
+                ann.save(WORD_ANN_PATH, keys=[str(word_id) for word_id in word_ids])
+            except OSError as e:
+                print(f"단어 ANN 인덱스 저장 실패: {e}")
+        return ann
+
+    def _load_ann(self, matrix, word_ids):
+        # 저장된 인덱스를 현재 행 번호에 맞춤. 없어진 단어는 빼고, 벡터가 바뀌었거나 새로 생긴 단어는 다시 추가
+        if not WORD_ANN_PATH or not os.path.exists(WORD_ANN_PATH):
+            return None
+        try:
+            saved, keys = IVFIndex.load(WORD_ANN_PATH)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"단어 ANN 인덱스 불러오기 실패: {e}")
+            return None
+        if keys is None or saved.dim != matrix.shape[1]:
+            return None
+        saved.labels = np.arange(len(saved))  # keys와 같은 저장 순서 기준으로 다시 맞춤
+        row_of = {str(word_id): row for row, word_id in enumerate(word_ids)}
+        rows = np.array([row_of.get(key, -1) for key in keys], dtype=np.int64)
+        label_map = np.full(len(saved), -1, dtype=np.int64)
+        found = rows >= 0
+        same = np.zeros(len(saved), dtype=bool)
+        same[found] = np.abs(saved.vectors[found] - matrix[rows[found]]).max(axis=1) < 1e-6
+        label_map[saved.labels[same]] = rows[same]
+        ann = saved.relabel(label_map)
+        missing = np.setdiff1d(np.arange(len(word_ids)), ann.labels)
+        return ann.add(matrix[missing], missing)
+
+    def ensure_loaded(self):
+        if self.loaded_at is None:
+            self.refresh()
+        return self.snapshot
+
+    # --- 검색 (동기, numpy 연산 중에는 GIL을 놓으므로 스레드풀에서 호출) ---
+
+    def search(self, vectors, k=10, exclude_rows=None, snapshot=None, nprobe=None, exact=False):
+        # vectors: (질의 수, dim) → 질의별 [(row, score), ...]
+        # exclude_rows: 질의별로 결과에서 뺄 행 (자기 자신 등)
+        # ANN 인덱스가 있으면 근사 검색 (nprobe: 볼 군집 수, 기본 WORD_ANN_NPROBE), exact=True면 전수 검색
+        snapshot = snapshot or self.snapshot
+        queries = normalize(np.atleast_2d(vectors))
+        if not len(snapshot):
+            return [[] for _ in range(len(queries))]
+        if queries.shape[1] != snapshot.dim:
+            raise ValueError(f"벡터 차원이 맞지 않습니다. (기대값 {snapshot.dim}, 입력 {queries.shape[1]})")
+        extra = max((len(rows) for rows in exclude_rows), default=0) if exclude_rows else 0
+        want = k + extra
+
+        if snapshot.ann is not None and not exact:
+            candidates = snapshot.ann.search(queries, want, nprobe or WORD_ANN_NPROBE)
+        else:
+            candidates = self._exact(snapshot, queries, want)
+
+        results = []
+        for q, (idx, score) in enumerate(candidates):
+            skip = exclude_rows[q] if exclude_rows else ()
+            hits = [(int(row), float(s)) for row, s in zip(idx, score) if row not in skip]
+            results.append(hits[:k])
+        return results
+
+    def _exact(self, snapshot, queries, want):
+        # 행이 많으면 나눠서 점수 계산 후 구간별 상위만 모아 다시 고름 (점수 행렬 메모리 제한)
+        cand_idx, cand_score = [], []
+        for start in range(0, len(snapshot), SCORE_BATCH_ROWS):
+            # int8이면 float32로 바꿔서 곱함 (섞인 dtype은 BLAS를 못 써서 훨씬 느림)
+            scores = queries @ np.asarray(snapshot.matrix[start:start + SCORE_BATCH_ROWS], dtype=np.float32).T
+            if snapshot.scales is not None:
+                scores *= snapshot.scales[start:start + SCORE_BATCH_ROWS]
+            idx, score = top_k(scores, want)
+            cand_idx.append(idx + start)
+            cand_score.append(score)
+        idx, score = np.concatenate(cand_idx, axis=1), np.concatenate(cand_score, axis=1)
+        order, score = top_k(score, want)
+        return zip(np.take_along_axis(idx, order, axis=1), score)
+
+    def similar_to_words(self, words, k=10, nprobe=None, exact=False):
+        # 단어(텍스트)별 유사 단어. 임베딩이 없는 단어는 None
+        snapshot = self.snapshot
+        rows = [snapshot.row_of_text.get(word) for word in words]
+        found = [row for row in rows if row is not None]
+        hits = self.search(snapshot.vectors(found), k, exclude_rows=[{row} for row in found], snapshot=snapshot,
+                           nprobe=nprobe, exact=exact) if found else []
+        hits = iter(hits)
+        return [next(hits) if row is not None else None for row in rows], snapshot
+
+    def stats(self):
+        snapshot = self.snapshot
+        return {
+            "words": len(snapshot),
+            "dim": snapshot.dim,
+            "memory_mb": round(snapshot.matrix.nbytes / 2 ** 20, 1),
+            "store": snapshot.store,
+            "dtype": str(snapshot.matrix.dtype),
+            "loaded_at": self.loaded_at,
+            "refreshes": self.refreshes,
+            "last_changed": self.last_changed,
+            "last_removed": self.last_removed,
+            "last_refresh_ms": self.last_refresh_ms,
+            "skipped": self.skipped,
+            "ann": snapshot.ann.stats() if snapshot.ann is not None else None,
+            "ann_nprobe": WORD_ANN_NPROBE,
+            "ann_builds": self.ann_builds,
+            "last_ann_build_ms": self.last_ann_build_ms,
+        }
+
+
+embedding_index = EmbeddingIndex()
+
+
+async def refresh_periodically():
+    # 서버 시작 시 한 번 로드하고, 이후 바뀐 단어만 주기적으로 반영
+    while True:
+        try:
+            await run_in_threadpool(embedding_index.refresh)
+        except Exception as e:
+            print(f"단어 임베딩 인덱스 갱신 실패: {e}")
+        await asyncio.sleep(WORD_INDEX_REFRESH_SECONDS)
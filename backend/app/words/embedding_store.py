@@ -0,0 +1,162 @@
+import json
+import os
+import shutil
+import time
+import uuid
+
+import numpy as np
+
+from app.words.ann_index import IVFIndex
+
+# ✅ 임베딩 파일 저장소 (mmap으로 여러 워커가 같은 페이지를 공유)
+# DB의 FLOAT8[] 를 워커마다 파이썬 리스트 → numpy 로 읽으면 워커 수만큼 메모리를 쓰고 시작도 느림
+# → 배치 작업(python -m data.export_embeddings)이 정규화된 float32(또는 int8) 행렬을 파일로 써 두고,
+#   워커는 np.load(mmap_mode="r")로 열기만 함 (복사 없음, OS 페이지 캐시를 모든 워커가 공유)
+#
+# 디렉터리 구조 (WORD_EMBEDDING_STORE_DIR):
+#   words -> words-20261018T120000/   심볼릭 링크 교체로 새 버전을 원자적으로 공개
+#   words-20261018T120000/
+#     meta.json      {"count", "dim", "dtype", "created_at", ...}
+#     vectors.npy    (count, dim) float32 또는 int8, 행 정규화됨
+#     scales.npy     int8일 때 행별 배율 (벡터 ≈ vectors[i] * scales[i])
+#     keys.npy       (count, 16) uint8, 행 번호 순서의 word_id (UUID 바이트)
+#     texts.json     행 번호 순서의 word_text (words만)
+#     ivf_*.npy      ANN 인덱스 (군집 중심, 군집 순서로 정렬한 벡터/배율/행 번호, 군집 구간)
+
+WORD_EMBEDDING_STORE_DIR = os.getenv("WORD_EMBEDDING_STORE_DIR")  # 설정하면 DB 대신 이 저장소에서 읽음
+
+
+def quantize(vectors):
+    # 행별 대칭 int8 양자화: scale = max|x| / 127
+    scales = np.abs(vectors).max(axis=1) / 127
+    q = np.divide(vectors, scales[:, None], out=np.zeros_like(vectors), where=scales[:, None] > 0)
+    return np.clip(np.rint(q), -127, 127).astype(np.int8), scales.astype(np.float32)
+
+
+def dequantize(vectors, scales=None):
+    vectors = np.asarray(vectors, dtype=np.float32)
+    return vectors * scales[:, None] if scales is not None else vectors
+
+
+class StoreWriter:
+    # 행을 나눠서 받아 바로 파일(memmap)에 씀 → 전체를 메모리에 올리지 않음
+    def __init__(self, root, name, count, dim, dtype="float32"):
+        self.root = root
+        self.name = name
+        self.version = f"{name}-{time.strftime('%Y%m%dT%H%M%S')}-{os.getpid()}"
+        self.path = os.path.join(root, self.version)
+        os.makedirs(self.path)
+        self.count, self.dim, self.dtype = count, dim, dtype
+        self.vectors = np.lib.format.open_memmap(os.path.join(self.path, "vectors.npy"), mode="w+",
+                                                 dtype=np.int8 if dtype == "int8" else np.float32, shape=(count, dim))
+        self.scales = np.lib.format.open_memmap(os.path.join(self.path, "scales.npy"), mode="w+",
+                                                dtype=np.float32, shape=(count,)) if dtype == "int8" else None
+        self.keys = np.lib.format.open_memmap(os.path.join(self.path, "keys.npy"), mode="w+", dtype=np.uint8, shape=(count, 16))
+        self.texts = []
+        self.written = 0
+
+    def write(self, keys, vectors, texts=None):
+        # vectors: 정규화된 float32 (n, dim)
+        start, end = self.written, self.written + len(keys)
+        if self.scales is not None:
+            self.vectors[start:end], self.scales[start:end] = quantize(vectors)
+        else:
+            self.vectors[start:end] = vectors
+        self.keys[start:end] = np.frombuffer(b"".join(key.bytes for key in keys), dtype=np.uint8).reshape(-1, 16)
+        if texts is not None:
+            self.texts += texts
+        self.written = end
+
+    def write_ann(self, ann):
+        # 저장 dtype 그대로 군집 순서로 재배열해서 저장 (int8이면 배율도 함께)
+        labels = ann.labels
+        np.save(os.path.join(self.path, "ivf_centroids.npy"), ann.centroids)
+        np.save(os.path.join(self.path, "ivf_labels.npy"), labels)
+        np.save(os.path.join(self.path, "ivf_offsets.npy"), ann.offsets)
+        np.save(os.path.join(self.path, "ivf_vectors.npy"), self.vectors[labels])
+        if self.scales is not None:
+            np.save(os.path.join(self.path, "ivf_scales.npy"), self.scales[labels])
+
+    def publish(self, keep=2, **meta):
+        # 파일을 다 쓴 뒤 링크만 교체. 이미 열어 둔 워커는 이전 버전 mmap을 계속 쓰다가 다음 갱신 때 넘어감
+        if self.written != self.count:
+            raise ValueError(f"행 수가 맞지 않습니다. (예상 {self.count}, 실제 {self.written})")
+        self.vectors.flush()
+        self.keys.flush()
+        if self.scales is not None:
+            self.scales.flush()
+        if self.texts:
+            with open(os.path.join(self.path, "texts.json"), "w", encoding="utf-8") as f:
+                json.dump(self.texts, f, ensure_ascii=False)
+        with open(os.path.join(self.path, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump({"count": self.count, "dim": self.dim, "dtype": self.dtype,
+                       "created_at": time.time(), **meta}, f)
+        link = os.path.join(self.root, self.name)
+        tmp = f"{link}.tmp-{os.getpid()}"
+        os.symlink(self.version, tmp)
+        os.replace(tmp, link)
+        self._cleanup(keep)
+        return self.version
+
+    def _cleanup(self, keep):
+        # 최근 keep개 버전만 남김 (지운 파일도 이미 mmap한 워커는 닫을 때까지 계속 읽을 수 있음)
+        versions = sorted(d for d in os.listdir(self.root)
+                          if d.startswith(f"{self.name}-") and os.path.isdir(os.path.join(self.root, d)))
+        for old in versions[:-keep]:
+            if old != self.version:
+                shutil.rmtree(os.path.join(self.root, old), ignore_errors=True)
+
+    def abort(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+class EmbeddingStore:
+    # 읽기 전용. 배열은 전부 mmap (실제로 읽은 페이지만 메모리에 올라오고 워커끼리 공유)
+    def __init__(self, path):
+        self.path = path
+        self.version = os.path.basename(path)
+        with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+            self.meta = json.load(f)
+        self.vectors = np.load(os.path.join(path, "vectors.npy"), mmap_mode="r")
+        self.scales = self._optional("scales.npy")
+        self.keys = np.load(os.path.join(path, "keys.npy"), mmap_mode="r")
+        self.texts = None
+        texts_path = os.path.join(path, "texts.json")
+        if os.path.exists(texts_path):
+            with open(texts_path, encoding="utf-8") as f:
+                self.texts = json.load(f)
+
+    def _optional(self, filename):
+        path = os.path.join(self.path, filename)
+        return np.load(path, mmap_mode="r") if os.path.exists(path) else None
+
+    def __len__(self):
+        return len(self.keys)
+
+    @property
+    def dim(self):
+        return self.vectors.shape[1]
+
+    @property
+    def quantized(self):
+        return self.scales is not None
+
+    def ids(self):
+        return [uuid.UUID(bytes=key.tobytes()) for key in self.keys]
+
+    def ann(self):
+        centroids = self._optional("ivf_centroids.npy")
+        if centroids is None:
+            return None
+        return IVFIndex(centroids, self._optional("ivf_vectors.npy"), self._optional("ivf_labels.npy"),
+                        self._optional("ivf_offsets.npy"), scales=self._optional("ivf_scales.npy"))
+
+
+def current_path(name, root=None):
+    # 현재 공개된 버전 디렉터리 (없으면 None)
+    root = root or WORD_EMBEDDING_STORE_DIR
+    if not root:
+        return None
+    link = os.path.join(root, name)
+    return os.path.realpath(link) if os.path.exists(link) else None
+
@@ -0,0 +1,99 @@
+import unicodedata
+
+# ✅ 한글 자모 유틸 (자동완성, 끝말잇기 등에서 공용)
+# 완성형 음절(가~힣)을 호환 자모(ㄱ, ㅏ ...)로 분해. 겹받침/이중모음은 키보드로 치는 순서대로 풀어 씀
+#   '닭' → ㄷㅏㄹㄱ, '과' → ㄱㅗㅏ  → 입력 중인 '달'(ㄷㅏㄹ)이 '닭'의 접두어가 됨
+#   '갑'(ㄱㅏㅂ)도 '가방'(ㄱㅏㅂㅏㅇ)의 접두어 (IME가 다음 음절 초성을 앞 음절 받침으로 보여 주는 경우)
+
+SYLLABLE_BASE = 0xAC00
+SYLLABLE_END = 0xD7A3
+
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = ["", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ",
+             "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+
+# 겹자모 → 치는 순서 (된소리 ㄲㄸㅃㅆㅉ은 키 하나라 그대로)
+COMPOUND = {
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+}
+
+CONSONANTS = set(CHOSEONG) | {j for j in JONGSEONG if j}
+
+
+def _split(jamo):
+    return COMPOUND.get(jamo, jamo)
+
+
+def _build_tables():
+    jamo_table, choseong_table = {}, {}
+    for code in range(SYLLABLE_BASE, SYLLABLE_END + 1):
+        index = code - SYLLABLE_BASE
+        cho, jung, jong = index // 588, (index % 588) // 28, index % 28
+        jamo_table[code] = CHOSEONG[cho] + _split(JUNGSEONG[jung]) + _split(JONGSEONG[jong])
+        choseong_table[code] = CHOSEONG[cho]
+    for jamo, parts in COMPOUND.items():
+        jamo_table[ord(jamo)] = parts
+    return jamo_table, choseong_table
+
+
+# str.translate용 표 (음절 11172개, 한 번만 만듦)
+JAMO_TABLE, CHOSEONG_TABLE = _build_tables()
+
+
+def normalize(text):
+    # NFC(조합형 자모 → 완성형), 소문자, 앞뒤 공백 제거
+    return unicodedata.normalize("NFC", text).strip().lower()
+
+
+def to_jamo(text):
+    return text.translate(JAMO_TABLE)
+
+
+def to_choseong(text):
+    # 음절은 초성만, 나머지 문자는 그대로 ('사랑해요' → 'ㅅㄹㅎㅇ')
+    return text.translate(CHOSEONG_TABLE)
+
+
+def is_choseong_query(text):
+    # 'ㅅㄹ'처럼 자음만으로 된 입력
+    return bool(text) and all(ch in CONSONANTS for ch in text)
+
+
+def decompose(syllable):
+    # 음절 하나 → (초성, 중성, 종성) 인덱스, 한글 음절이 아니면 None
+    code = ord(syllable) - SYLLABLE_BASE
+    if not 0 <= code <= SYLLABLE_END - SYLLABLE_BASE:
+        return None
+    return code // 588, (code % 588) // 28, code % 28
+
+
+def compose(cho, jung, jong=0):
+    return chr(SYLLABLE_BASE + cho * 588 + jung * 28 + jong)
+
+
+# 두음법칙 (한글 맞춤법 제10~12항): 단어 첫머리의 ㄴ/ㄹ이 바뀌는 소리
+#   녀뇨뉴니 → 여요유이, 랴려례료류리 → 야여예요유이, 라래로뢰루르 → 나내노뇌누느
+# 끝말잇기에서 '력'으로 끝나면 '역'으로 시작해도 됨
+DUEUM_VOWELS_N = {JUNGSEONG.index(v) for v in "ㅕㅛㅠㅣ"}
+DUEUM_VOWELS_R = {JUNGSEONG.index(v) for v in "ㅑㅕㅖㅛㅠㅣ"}
+NIEUN, RIEUL, IEUNG = CHOSEONG.index("ㄴ"), CHOSEONG.index("ㄹ"), CHOSEONG.index("ㅇ")
+
+
+def dueum(syllable):
+    # 두음법칙을 적용한 음절 (해당 없으면 None)
+    parts = decompose(syllable)
+    if parts is None:
+        return None
+    cho, jung, jong = parts
+    if cho == RIEUL:
+        return compose(IEUNG if jung in DUEUM_VOWELS_R else NIEUN, jung, jong)
+    if cho == NIEUN and jung in DUEUM_VOWELS_N:
+        return compose(IEUNG, jung, jong)
+    return None
+
+
+def is_hangul_word(text):
+    return bool(text) and all(decompose(ch) is not None for ch in text)
@@ -0,0 +1,149 @@
+import os
+from bisect import bisect_left
+from operator import itemgetter
+
+from app.words.hangul import is_choseong_query, normalize, to_choseong, to_jamo
+
+# ✅ 자모 접두어 / 초성 / 오타(편집 거리 1) 검색용 정렬 배열 (DB와 무관, 갱신은 app/words/autocomplete.py)
+# 단어를 자모 문자열로 풀어('사랑' → ㅅㅏㄹㅏㅇ) 정렬해 두고 bisect로 접두어 구간을 찾음
+
+FUZZY_MIN_JAMO = int(os.getenv("WORD_AUTOCOMPLETE_FUZZY_MIN_JAMO", "4"))  # 이보다 짧은 질의는 오타 검색 안 함 (거의 모든 단어가 걸림)
+REBUILD_RATIO = 0.02  # 바뀐 단어가 이 비율을 넘으면 끼워 넣지 않고 다시 정렬
+
+MAX_CHAR = "\U0010ffff"  # 접두어 구간의 끝: 접두어 + MAX_CHAR 보다 작은 문자열
+
+
+def jamo_key(text):
+    return to_jamo(normalize(text))
+
+
+def choseong_key(text):
+    # 초성이 같으면 짧은 단어 먼저, 그다음 자모 순 ('\0'이 가장 작은 문자)
+    text = normalize(text)
+    return f"{to_choseong(text)}\0{to_jamo(text)}"
+
+
+def prefix_range(keys, prefix, lo=0, hi=None):
+    hi = len(keys) if hi is None else hi
+    lo = bisect_left(keys, prefix, lo, hi)
+    return lo, bisect_left(keys, prefix + MAX_CHAR, lo, hi)
+
+
+class PrefixIndex:
+    # 한 번 만들면 바꾸지 않음 (갱신은 새 스냅샷을 만들어 교체)
+    # entry = (word_id, word_text) 튜플 하나를 두 배열이 같이 가리킴
+    def __init__(self, jamo_keys, jamo_entries, choseong_keys, choseong_entries, versions):
+        self.jamo_keys = jamo_keys                # 정렬된 자모 문자열
+        self.jamo_entries = jamo_entries          # 같은 위치의 entry
+        self.choseong_keys = choseong_keys        # 정렬된 '초성\0자모' 문자열
+        self.choseong_entries = choseong_entries
+        self.versions = versions                  # word_id → (updated_at, entry)
+
+    def __len__(self):
+        return len(self.jamo_keys)
+
+    @classmethod
+    def build(cls, versions):
+        entries = [entry for _, entry in versions.values()]
+        jamo = sorted(((jamo_key(entry[1]), entry) for entry in entries), key=itemgetter(0))
+        choseong = sorted(((choseong_key(entry[1]), entry) for entry in entries), key=itemgetter(0))
+        return cls([key for key, _ in jamo], [entry for _, entry in jamo],
+                   [key for key, _ in choseong], [entry for _, entry in choseong], versions)
+
+    def apply(self, rows, removed):
+        # rows: 바뀌거나 새로 생긴 (word_id, word_text, updated_at), removed: 지워진 word_id
+        versions = dict(self.versions)
+        dropped = [versions.pop(word_id)[1] for word_id in removed]
+        dropped += [versions[word_id][1] for word_id, _, _ in rows if word_id in versions]
+        added = []
+        for word_id, word_text, updated_at in rows:
+            entry = (word_id, word_text)
+            versions[word_id] = (updated_at, entry)
+            added.append(entry)
+        if len(dropped) + len(added) > max(len(self) * REBUILD_RATIO, 100):
+            return PrefixIndex.build(versions)
+
+        # 적게 바뀌었으면 배열을 복사해서 빼고 끼워 넣음 (검색 중인 이전 스냅샷은 그대로)
+        jamo = (list(self.jamo_keys), list(self.jamo_entries), jamo_key)
+        choseong = (list(self.choseong_keys), list(self.choseong_entries), choseong_key)
+        for keys, values, key_of in (jamo, choseong):
+            for entry in dropped:
+                i = bisect_left(keys, key_of(entry[1]))
+                while values[i] is not entry:
+                    i += 1
+                del keys[i]
+                del values[i]
+            for entry in added:
+                i = bisect_left(keys, key_of(entry[1]))
+                keys.insert(i, key_of(entry[1]))
+                values.insert(i, entry)
+        return PrefixIndex(jamo[0], jamo[1], choseong[0], choseong[1], versions)
+
+    # --- 검색 ---
+
+    def prefix(self, query, limit):
+        lo, hi = prefix_range(self.jamo_keys, to_jamo(query))
+        return self.jamo_entries[lo:min(hi, lo + limit)]
+
+    def choseong(self, query, limit):
+        lo, hi = prefix_range(self.choseong_keys, query)
+        return self.choseong_entries[lo:min(hi, lo + limit)]
+
+    def fuzzy(self, query, limit, skip=()):
+        # 자모 기준 편집 거리 1인 접두어로 시작하는 단어 (skip에 있는 entry 제외)
+        # 위치 i마다 q[:i] 구간 안에서만 찾음: 빠진 글자(q[:i] + q[i+1:]),
+        # 바뀐 글자/더 들어갈 글자는 구간 안의 다음 글자 c를 bisect로 건너뛰며 하나씩 (q[:i] + c + q[i+1:] / q[:i] + c + q[i:])
+        q = to_jamo(query)
+        if len(q) < FUZZY_MIN_JAMO:
+            return []
+        keys, entries = self.jamo_keys, self.jamo_entries
+        found, seen = [], set(id(entry) for entry in skip)
+
+        def collect(prefix, lo, hi):
+            lo, hi = prefix_range(keys, prefix, lo, hi)
+            for entry in entries[lo:hi]:
+                if len(found) >= limit:
+                    return
+                if id(entry) not in seen:
+                    seen.add(id(entry))
+                    found.append(entry)
+
+        lo, hi = 0, len(keys)
+        for i in range(len(q)):
+            head = q[:i]
+            if i:
+                lo, hi = prefix_range(keys, head, lo, hi)
+            if lo >= hi:
+                break
+            collect(head + q[i + 1:], lo, hi)
+            pos = lo
+            while pos < hi and len(found) < limit:
+                key = keys[pos]
+                if len(key) <= i:  # q[:i]와 똑같은 단어
+                    pos += 1
+                    continue
+                c = key[i]
+                end = bisect_left(keys, head + c + MAX_CHAR, pos, hi)
+                if c != q[i]:
+                    collect(head + c + q[i + 1:], pos, end)
+                collect(head + c + q[i:], pos, end)
+                pos = end
+            if len(found) >= limit:
+                break
+        return found
+
+    def complete(self, query, limit=10, fuzzy=True):
+        # → (mode, [(entry, 오타 보정 여부), ...])
+        query = normalize(query)
+        if not query:
+            return "prefix", []
+        if is_choseong_query(query):
+            return "choseong", [(entry, False) for entry in self.choseong(query, limit)]
+        items = self.prefix(query, limit)
+        results = [(entry, False) for entry in items]
+        if fuzzy and len(items) < limit:
+            results += [(entry, True) for entry in self.fuzzy(query, limit - len(items), skip=items)]
+        return "prefix", results
+
+
+EMPTY = PrefixIndex([], [], [], [], {})
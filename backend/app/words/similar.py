@@ -0,0 +1,75 @@
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, HTTPException, Query
+from pydantic import BaseModel, Field
+from starlette.concurrency import run_in_threadpool
+
+from app.words.embedding_index import embedding_index
+
+# ✅ 비슷한 단어 찾기 (임베딩 코사인 유사도, app/words/embedding_index.py)
+router = APIRouter()
+
+MAX_K = 100
+MAX_BATCH = 64
+
+
+class SimilarWord(BaseModel):
+    word_id: UUID
+    word_text: str
+    score: float  # 코사인 유사도 (-1 ~ 1)
+
+
+class SimilarResult(BaseModel):
+    word: Optional[str] = None
+    items: List[SimilarWord]
+
+
+class SimilarQuery(BaseModel):
+    # words(단어 여러 개) 또는 vector(임베딩 하나) 중 하나
+    words: Optional[List[str]] = Field(None, max_length=MAX_BATCH)
+    vector: Optional[List[float]] = None
+    k: int = Field(10, ge=1, le=MAX_K)
+    nprobe: Optional[int] = Field(None, ge=1)  # ANN 인덱스에서 볼 군집 수 (클수록 정확, 느림)
+    exact: bool = False                        # True면 ANN 없이 전수 검색
+
+
+def to_items(snapshot, hits):
+    return [SimilarWord(word_id=snapshot.word_ids[row], word_text=snapshot.texts[row], score=round(score, 6))
+            for row, score in hits]
+
+
+async def loaded():
+    snapshot = embedding_index.snapshot
+    if embedding_index.loaded_at is None:
+        snapshot = await run_in_threadpool(embedding_index.ensure_loaded)
+    return snapshot
+
+
+@router.get("/similar", response_model=SimilarResult)
+async def similar_words(word: str = Query(..., min_length=1), k: int = Query(10, ge=1, le=MAX_K),
+                        nprobe: Optional[int] = Query(None, ge=1), exact: bool = False):
+    await loaded()
+    (hits,), snapshot = await run_in_threadpool(embedding_index.similar_to_words, [word], k, nprobe, exact)
+    if hits is None:
+        raise HTTPException(status_code=404, detail="임베딩이 있는 단어가 아닙니다.")
+    return SimilarResult(word=word, items=to_items(snapshot, hits))
+
+
+@router.post("/similar", response_model=List[SimilarResult])
+async def similar_words_batch(query: SimilarQuery):
+    # 여러 단어를 한 번에 (행렬곱 한 번으로 점수 계산) 또는 임의 벡터 근처 단어
+    snapshot = await loaded()
+    if query.vector is not None:
+        try:
+            (hits,) = await run_in_threadpool(embedding_index.search, [query.vector], query.k, None, snapshot,
+                                              query.nprobe, query.exact)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return [SimilarResult(items=to_items(snapshot, hits))]
+    if not query.words:
+        raise HTTPException(status_code=400, detail="words 또는 vector가 필요합니다.")
+    results, snapshot = await run_in_threadpool(embedding_index.similar_to_words, query.words, query.k,
+                                                query.nprobe, query.exact)
+    return [SimilarResult(word=word, items=to_items(snapshot, hits) if hits is not None else [])
+            for word, hits in zip(query.words, results)]
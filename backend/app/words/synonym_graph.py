@@ -0,0 +1,306 @@
+import asyncio
+import os
+import threading
+import time
+
+import numpy as np
+from dotenv import load_dotenv
+from sqlalchemy import select
+from starlette.concurrency import run_in_threadpool
+
+from app.models import Words
+from data.postgresDB import SessionLocal
+
+load_dotenv()  # .env 파일 자동 로드
+
+# ✅ 유의어 그래프 (words.synonyms → 메모리 CSR 인접 배열)
+# words.synonyms는 행마다 TEXT[]라 "유의어의 유의어", "두 단어가 이어져 있나"를 구하려면 DB를 여러 번 오가야 하고,
+# 목록의 단어가 실제 words에 있는지도 보장되지 않음
+# → 단어마다 정수 노드 번호를 주고, synonyms 텍스트를 word_text(words_word_text_key)로 풀어서 무방향 간선으로 만듦
+#   indptr[node]:indptr[node + 1] 구간의 indices가 이웃 노드 (numpy int64/int32 배열 두 개)
+#   words에 없는 텍스트는 간선이 되지 않음 (dangling으로 집계, 나중에 그 단어가 생기면 자동으로 이어짐)
+# - 선언(synonyms) 목록은 (노드, 텍스트 번호) 배열로 들고 있어서, 텍스트 → 노드 변환은 배열 인덱싱 한 번
+# - 갱신은 다른 인덱스와 같은 방식: (word_id, updated_at)만 비교해 바뀐 단어의 synonyms만 다시 읽고,
+#   선언 배열에서 그 단어 행만 바꾼 뒤 CSR/연결 요소를 numpy로 다시 계산해 새 스냅샷으로 교체
+#   rebuild()는 전부 다시 읽음 (지운 단어 노드 번호까지 정리)
+# - 연결 요소: 최소 라벨 전파 + pointer jumping (전부 벡터 연산)
+
+WORD_SYNONYM_REFRESH_SECONDS = float(os.getenv("WORD_SYNONYM_REFRESH_SECONDS", "300"))  # 0이면 주기 갱신 안 함
+MAX_HOPS = 4
+
+
+def expand(indptr, indices, frontier):
+    # frontier 노드들의 이웃을 한 번에 → (이웃, 출발 노드)
+    starts, ends = indptr[frontier], indptr[frontier + 1]
+    lengths = ends - starts
+    total = int(lengths.sum())
+    if not total:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(total)
+    return indices[offsets].astype(np.int64), np.repeat(frontier, lengths)
+
+
+def components(indptr, indices, n):
+    # 노드별 연결 요소 번호 (요소 안에서 가장 작은 노드 번호)
+    labels = np.arange(n, dtype=np.int64)
+    has = np.diff(indptr) > 0
+    starts = indptr[:-1][has]
+    if not len(starts):
+        return labels
+    while True:
+        smallest = np.minimum.reduceat(labels[indices], starts)
+        new = labels.copy()
+        new[has] = np.minimum(labels[has], smallest)
+        # 라벨이 가리키는 노드의 라벨로 건너뜀 (반복 횟수를 지름 대신 log 수준으로)
+        while True:
+            jumped = new[new]
+            if np.array_equal(jumped, new):
+                break
+            new = jumped
+        if np.array_equal(new, labels):
+            return labels
+        labels = new
+
+
+class Graph:
+    # 한 번 만들면 바꾸지 않음 (갱신은 새 그래프를 만들어 교체)
+    def __init__(self, indptr, indices, texts, node_of_text, dangling=0):
+        self.indptr = indptr            # (노드 수 + 1,) int64
+        self.indices = indices          # (간선 수 × 2,) int32, 노드별 이웃 (정렬됨)
+        self.texts = texts              # 노드 → word_text (지운 단어는 None)
+        self.node_of_text = node_of_text
+        self.dangling = dangling        # words에 없는 synonyms 텍스트 수
+        self.labels = components(indptr, indices, len(texts))
+        self.sizes = np.bincount(self.labels, minlength=len(texts))
+
+    def __len__(self):
+        return sum(text is not None for text in self.texts)
+
+    @property
+    def edges(self):
+        return len(self.indices) // 2
+
+    @property
+    def nbytes(self):
+        return self.indptr.nbytes + self.indices.nbytes + self.labels.nbytes + self.sizes.nbytes
+
+    def node(self, text):
+        return self.node_of_text.get(text)
+
+    def neighbours(self, node, hops=1, limit=None):
+        # 거리별 노드 목록 [[거리 1], [거리 2], ...] (limit: 전체 개수 상한)
+        seen = {node}
+        frontier = np.array([node], dtype=np.int64)
+        result, total = [], 0
+        for _ in range(hops):
+            found, _ = expand(self.indptr, self.indices, frontier)
+            found = np.unique(found)
+            frontier = np.array([n for n in found.tolist() if n not in seen], dtype=np.int64)
+            if limit is not None:
+                frontier = frontier[:limit - total]
+            if not len(frontier):
+                break
+            seen.update(frontier.tolist())
+            result.append(frontier.tolist())
+            total += len(frontier)
+            if limit is not None and total >= limit:
+                break
+        return result
+
+    def within(self, text, hops=1):
+        # text에서 hops 안에 있는 단어 텍스트 집합 (게임에서 보기 제외용)
+        node = self.node(text)
+        if node is None:
+            return set()
+        return {self.texts[n] for level in self.neighbours(node, hops) for n in level}
+
+    def path(self, a, b, max_hops=MAX_HOPS):
+        # a → b 최단 경로 (노드 목록, 없으면 None). 같은 연결 요소가 아니면 바로 None
+        if a == b:
+            return [a]
+        if self.labels[a] != self.labels[b]:
+            return None
+        parent = {a: None}
+        frontier = np.array([a], dtype=np.int64)
+        for _ in range(max_hops):
+            found, source = expand(self.indptr, self.indices, frontier)
+            found, first = np.unique(found, return_index=True)
+            new = []
+            for n, s in zip(found.tolist(), source[first].tolist()):
+                if n not in parent:
+                    parent[n] = s
+                    new.append(n)
+            if b in parent:
+                path = [b]
+                while parent[path[-1]] is not None:
+                    path.append(parent[path[-1]])
+                return path[::-1]
+            if not new:
+                return None
+            frontier = np.array(new, dtype=np.int64)
+        return None
+
+    def component(self, node, limit=None):
+        members = np.flatnonzero(self.labels == self.labels[node])
+        return int(self.sizes[self.labels[node]]), members[:limit].tolist()
+
+    def stats(self):
+        alive = np.array([text is not None for text in self.texts], dtype=bool)
+        sizes = self.sizes[self.labels[alive]] if alive.any() else np.zeros(0, dtype=np.int64)
+        return {
+            "words": int(alive.sum()),
+            "nodes": len(self.texts),
+            "edges": self.edges,
+            "dangling": self.dangling,
+            "components": int(len(np.unique(self.labels[alive]))) if alive.any() else 0,
+            "isolated": int((sizes == 1).sum()),
+            "largest_component": int(sizes.max()) if len(sizes) else 0,
+            "memory_mb": round(self.nbytes / 2 ** 20, 2),
+        }
+
+
+EMPTY = Graph(np.zeros(1, dtype=np.int64), np.zeros(0, dtype=np.int32), [], {})
+
+
+class SynonymGraph:
+    def __init__(self):
+        self.graph = EMPTY
+        self._lock = threading.Lock()
+        self._reset()
+        self.loaded_at = None
+        self.refreshes = 0
+        self.rebuilds = 0
+        self.last_changed = 0
+        self.last_removed = 0
+        self.last_refresh_ms = 0.0
+
+    def _reset(self):
+        # 갱신용 상태 (락 안에서만 바꿈)
+        self._versions = {}        # word_id → updated_at
+        self._node_of_id = {}      # word_id → 노드
+        self._texts = []           # 노드 → word_text (지운 단어는 None)
+        self._tid = {}             # 텍스트 → 텍스트 번호 (word_text, synonyms 텍스트 모두)
+        self._node_of_tid = np.zeros(0, dtype=np.int64)  # 텍스트 번호 → 노드 (없으면 -1)
+        self._decl_src = np.zeros(0, dtype=np.int64)     # 선언: 이 노드의 synonyms에
+        self._decl_tid = np.zeros(0, dtype=np.int64)     #       이 텍스트가 있음
+
+    def _text_id(self, text):
+        tid = self._tid.get(text)
+        if tid is None:
+            tid = self._tid[text] = len(self._tid)
+        return tid
+
+    # --- 갱신 (동기, run_in_threadpool / 배치에서 호출) ---
+
+    def refresh(self):
+        with self._lock:
+            start = time.perf_counter()
+            with SessionLocal() as db:
+                versions = dict(db.execute(select(Words.word_id, Words.updated_at)).all())
+                changed = [word_id for word_id, updated_at in versions.items()
+                           if word_id not in self._versions or self._versions[word_id] != updated_at]
+                removed = self._versions.keys() - versions.keys()
+                rows = []
+                for i in range(0, len(changed), 1000):
+                    rows += db.execute(
+                        select(Words.word_id, Words.word_text, Words.synonyms, Words.updated_at)
+                        .where(Words.word_id.in_(changed[i:i + 1000]))
+                    ).all()
+            if rows or removed or self.loaded_at is None:
+                self._apply(rows, removed)
+                self.graph = self._build()
+            self.loaded_at = time.time()
+            self.refreshes += 1
+            self.last_changed = len(rows)
+            self.last_removed = len(removed)
+            self.last_refresh_ms = round((time.perf_counter() - start) * 1000, 1)
+            return self.graph
+
+    def rebuild(self):
+        # 전부 다시 읽음 (지운 단어의 빈 노드 번호 정리)
+        with self._lock:
+            self._reset()
+            self.loaded_at = None
+            self.rebuilds += 1
+        return self.refresh()
+
+    def _apply(self, rows, removed):
+        touched, assign = [], []
+        for word_id in removed:
+            node = self._node_of_id.pop(word_id)
+            del self._versions[word_id]
+            self._node_of_tid[self._tid[self._texts[node]]] = -1
+            self._texts[node] = None
+            touched.append(node)
+        new_src, new_tid = [], []
+        for word_id, word_text, synonyms, updated_at in rows:
+            node = self._node_of_id.get(word_id)
+            if node is None:
+                node = self._node_of_id[word_id] = len(self._texts)
+                self._texts.append(None)
+            elif self._texts[node] != word_text:
+                self._node_of_tid[self._tid[self._texts[node]]] = -1  # 이름이 바뀜
+            touched.append(node)
+            self._texts[node] = word_text
+            self._versions[word_id] = updated_at
+            assign.append((self._text_id(word_text), node))
+            for synonym in synonyms or ():
+                synonym = synonym.strip()
+                if synonym and synonym != word_text:
+                    new_src.append(node)
+                    new_tid.append(self._text_id(synonym))
+        # 새 텍스트 번호만큼 늘리고, 이름 → 노드 연결은 이름 해제를 모두 끝낸 뒤에 (두 단어가 이름을 맞바꾼 경우)
+        grown = np.full(len(self._tid), -1, dtype=np.int64)
+        grown[:len(self._node_of_tid)] = self._node_of_tid
+        self._node_of_tid = grown
+        for tid, node in assign:
+            self._node_of_tid[tid] = node
+        # 바뀐/지운 단어의 선언은 빼고 새로 읽은 것을 붙임
+        keep = ~np.isin(self._decl_src, np.array(touched, dtype=np.int64))
+        self._decl_src = np.concatenate([self._decl_src[keep], np.array(new_src, dtype=np.int64)])
+        self._decl_tid = np.concatenate([self._decl_tid[keep], np.array(new_tid, dtype=np.int64)])
+
+    def _build(self):
+        n = len(self._texts)
+        dst = self._node_of_tid[self._decl_tid] if len(self._decl_tid) else np.zeros(0, dtype=np.int64)
+        resolved = dst >= 0
+        src, dst = self._decl_src[resolved], dst[resolved]
+        # 무방향: 양쪽으로 넣고 중복 제거 (a→b, b→a 둘 다 선언돼 있어도 간선 하나)
+        # (출발, 도착)을 int64 하나(출발 × n + 도착)로 묶어 1차원 unique → 출발 순, 출발 안에서는 도착 순으로 정렬됨
+        # (np.unique는 numpy 2에서 해시 기반이라 느려서 정렬 후 인접 비교로)
+        keys = np.sort(np.concatenate([src * n + dst, dst * n + src]))
+        keys = keys[np.concatenate([[True], keys[1:] != keys[:-1]]) & (keys // n != keys % n)]
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(keys // n, minlength=n), out=indptr[1:])
+        node_of_text = {text: node for node, text in enumerate(self._texts) if text is not None}
+        return Graph(indptr, (keys % n).astype(np.int32), list(self._texts), node_of_text,
+                     dangling=int((~resolved).sum()))
+
+    def ensure_loaded(self):
+        if self.loaded_at is None:
+            self.refresh()
+        return self.graph
+
+    def stats(self):
+        return {
+            **self.graph.stats(),
+            "loaded_at": self.loaded_at,
+            "refreshes": self.refreshes,
+            "rebuilds": self.rebuilds,
+            "last_changed": self.last_changed,
+            "last_removed": self.last_removed,
+            "last_refresh_ms": self.last_refresh_ms,
+        }
+
+
+synonym_graph = SynonymGraph()
+
+
+async def refresh_periodically():
+    # 서버 시작 시 한 번 로드하고, 이후 바뀐 단어만 주기적으로 반영
+    while True:
+        try:
+            await run_in_threadpool(synonym_graph.refresh)
+        except Exception as e:
+            print(f"유의어 그래프 갱신 실패: {e}")
+        await asyncio.sleep(WORD_SYNONYM_REFRESH_SECONDS)
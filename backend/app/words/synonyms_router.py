@@ -0,0 +1,80 @@
+from typing import List, Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
+
+from app.words.synonym_graph import MAX_HOPS, synonym_graph
+
+# ✅ 유의어 그래프 조회 (app/words/synonym_graph.py)
+router = APIRouter()
+
+MAX_LIMIT = 500
+
+
+class SynonymLevel(BaseModel):
+    distance: int
+    words: List[str]
+
+
+class SynonymResult(BaseModel):
+    word: str
+    levels: List[SynonymLevel]  # 거리(hop)별 유의어
+
+
+class RelatedResult(BaseModel):
+    a: str
+    b: str
+    related: bool
+    distance: Optional[int] = None
+    path: Optional[List[str]] = None  # a → b 최단 경로
+    same_component: bool
+
+
+class ComponentResult(BaseModel):
+    word: str
+    size: int
+    words: List[str]
+
+
+async def loaded():
+    graph = synonym_graph.graph
+    if synonym_graph.loaded_at is None:
+        graph = await run_in_threadpool(synonym_graph.ensure_loaded)
+    return graph
+
+
+def node_of(graph, word):
+    node = graph.node(word)
+    if node is None:
+        raise HTTPException(status_code=404, detail=f"사전에 없는 단어입니다: {word}")
+    return node
+
+
+@router.get("/synonyms", response_model=SynonymResult)
+async def synonyms(word: str = Query(..., min_length=1), hops: int = Query(1, ge=1, le=MAX_HOPS),
+                   limit: int = Query(100, ge=1, le=MAX_LIMIT)):
+    graph = await loaded()
+    levels = graph.neighbours(node_of(graph, word), hops, limit)
+    return SynonymResult(word=word, levels=[
+        SynonymLevel(distance=distance, words=[graph.texts[n] for n in nodes])
+        for distance, nodes in enumerate(levels, start=1)
+    ])
+
+
+@router.get("/synonyms/related", response_model=RelatedResult)
+async def related(a: str = Query(..., min_length=1), b: str = Query(..., min_length=1),
+                  max_hops: int = Query(MAX_HOPS, ge=1, le=MAX_HOPS)):
+    graph = await loaded()
+    node_a, node_b = node_of(graph, a), node_of(graph, b)
+    path = graph.path(node_a, node_b, max_hops)
+    return RelatedResult(a=a, b=b, related=path is not None, distance=len(path) - 1 if path else None,
+                         path=[graph.texts[n] for n in path] if path else None,
+                         same_component=bool(graph.labels[node_a] == graph.labels[node_b]))
+
+
+@router.get("/synonyms/component", response_model=ComponentResult)
+async def component(word: str = Query(..., min_length=1), limit: int = Query(100, ge=1, le=MAX_LIMIT)):
+    graph = await loaded()
+    size, members = graph.component(node_of(graph, word), limit)
+    return ComponentResult(word=word, size=size, words=[graph.texts[n] for n in members])
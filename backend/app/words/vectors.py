@@ -0,0 +1,21 @@
+import numpy as np
+
+# 임베딩 공용 numpy 연산 (DB/앱 설정 없이 import 가능, 벤치마크에서도 사용)
+
+
+def normalize(vectors):
+    # 행별 L2 정규화, 길이 0인 행은 그대로 0
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+
+def top_k(scores, k):
+    # scores: (질의 수, 후보 수) → 질의별 상위 k개 (인덱스, 점수), 점수 내림차순
+    k = min(k, scores.shape[1])
+    if k <= 0:
+        return np.empty((scores.shape[0], 0), dtype=np.int64), np.empty((scores.shape[0], 0), dtype=np.float32)
+    idx = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    part = np.take_along_axis(scores, idx, axis=1)
+    order = np.argsort(-part, axis=1, kind="stable")
+    return np.take_along_axis(idx, order, axis=1), np.take_along_axis(part, order, axis=1)
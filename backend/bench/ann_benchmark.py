@@ -0,0 +1,76 @@
+# 단어 임베딩 ANN(IVF) 인덱스 recall@k / QPS vs 전수 검색
+# 사용법:
+#   python -m bench.ann_benchmark --sizes 10000,100000,300000 --dim 128 --nprobe 1,4,16,64
+#   python -m bench.ann_benchmark --from-db --sizes 50000,200000   # words.embedding 사용 (DATABASE_URL 필요)
+# 합성 데이터는 군집 구조가 있는 벡터 (실제 단어 임베딩과 비슷하게). 질의는 데이터 안의 벡터에 잡음을 섞어 만든다.
+# 크기별로 build 시간, nprobe별 recall@k / QPS, 전수 검색 QPS를 출력한다.
+import argparse
+import time
+
+import numpy as np
+
+from app.words.ann_index import IVFIndex, default_nlist
+from app.words.vectors import normalize, top_k
+
+
+def synthetic(n, dim, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(max(n // 200, 8), dim))
+    return normalize(centers[rng.integers(0, len(centers), n)] + 0.7 * rng.normal(size=(n, dim)))
+
+
+def from_db():
+    from app.words.embedding_index import embedding_index
+    return embedding_index.refresh().matrix
+
+
+def exact_search(data, queries, k):
+    idx = []
+    for start in range(0, len(queries), 64):
+        idx.append(top_k(queries[start:start + 64] @ data.T, k)[0])
+    return np.concatenate(idx)
+
+
+def run(sizes, dim, queries, k, nprobes, nlist, use_db):
+    source = from_db() if use_db else None
+    rng = np.random.default_rng(1)
+    print(f"{'단어 수':>9} {'nlist':>6} {'build(s)':>9} {'nprobe':>7} {'recall@' + str(k):>10} {'QPS':>9}")
+    for n in sizes:
+        if use_db:
+            if n > len(source):
+                print(f"{n:>9} (DB 임베딩 {len(source)}개뿐이라 건너뜀)")
+                continue
+            data = source[rng.choice(len(source), n, replace=False)]
+        else:
+            data = synthetic(n, dim)
+        q = normalize(data[rng.choice(n, queries, replace=False)] + 0.1 * rng.normal(size=(queries, data.shape[1])))
+
+        start = time.perf_counter()
+        truth = exact_search(data, q, k)
+        exact_qps = queries / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        index = IVFIndex.build(data, nlist=nlist or default_nlist(n))
+        build = time.perf_counter() - start
+
+        print(f"{n:>9} {index.nlist:>6} {build:>9.2f} {'exact':>7} {1.0:>10.3f} {exact_qps:>9.0f}")
+        for nprobe in nprobes:
+            start = time.perf_counter()
+            results = index.search(q, k, nprobe)
+            qps = queries / (time.perf_counter() - start)
+            recall = np.mean([len(set(labels) & set(expected)) / k for (labels, _), expected in zip(results, truth)])
+            print(f"{'':>9} {'':>6} {'':>9} {nprobe:>7} {recall:>10.3f} {qps:>9.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="10000,100000,300000")
+    parser.add_argument("--dim", type=int, default=128, help="합성 데이터 차원")
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--nprobe", default="1,4,16,64")
+    parser.add_argument("--nlist", type=int, default=0, help="0이면 4√n")
+    parser.add_argument("--from-db", action="store_true", help="words.embedding에서 표본 추출")
+    args = parser.parse_args()
+    run([int(x) for x in args.sizes.split(",")], args.dim, args.queries, args.k,
+        [int(x) for x in args.nprobe.split(",")], args.nlist, args.from_db)
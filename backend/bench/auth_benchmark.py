@@ -0,0 +1,60 @@
+# 인증 요청당 DB 왕복 수 / 지연 비교 (get_current_user 유저 캐시)
+# 사용법: SQL_PROFILE_ENABLED=true SQL_PROFILE_DEBUG=true 로 서버를 띄운 뒤 (X-SQL-Count 헤더 필요)
+#   python -m bench.auth_benchmark --email a@b.c --password pw --requests 2000 --concurrency 20
+# IDENTITY_CACHE_ENABLED=false 로 띄운 서버와 결과를 비교한다.
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+import httpx
+
+from bench.load_test import percentile
+
+PATH = "/login_user/profile-data"
+
+
+async def run(base_url, email, password, total, concurrency, internal_token):
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        resp = await client.post("/login_user/login", json={"email": email, "password": password})
+        resp.raise_for_status()  # access_token 쿠키가 client에 저장됨
+
+        latencies, queries = [], []
+
+        async def worker(n):
+            for _ in range(n):
+                start = time.perf_counter()
+                r = await client.get(PATH)
+                latencies.append(time.perf_counter() - start)
+                r.raise_for_status()
+                queries.append(int(r.headers.get("X-SQL-Count", 0)))
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(total // concurrency) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+        print(f"요청 수          : {len(latencies)} (동시 {concurrency})")
+        print(f"처리량           : {len(latencies) / elapsed:.1f} req/s")
+        print(f"p50 / p99        : {percentile(latencies, 50) * 1000:.1f} / {percentile(latencies, 99) * 1000:.1f} ms")
+        print(f"요청당 SQL 쿼리  : {statistics.mean(queries):.3f}")
+
+        headers = {"X-Internal-Token": internal_token} if internal_token else {}
+        stats = await client.get("/internal/identity-cache", headers=headers)
+        if stats.status_code == 200:
+            data = stats.json()
+            print(f"캐시 hit / miss  : {data['hits']} / {data['misses']} (hit rate {data['hit_rate']})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--email", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--internal-token", default=os.getenv("INTERNAL_API_TOKEN"),
+                        help="서버의 INTERNAL_API_TOKEN (없으면 내부 통계 출력 생략)")
+    args = parser.parse_args()
+    asyncio.run(run(args.base_url, args.email, args.password, args.requests, args.concurrency, args.internal_token))
@@ -0,0 +1,124 @@
+# 단어 자동완성 인덱스 (app/words/autocomplete.py) 빌드 시간 / 메모리 / 질의 지연
+# 사용법:
+#   python -m bench.autocomplete_benchmark --words 500000          # 합성 사전 (표준국어대사전 표제어 규모)
+#   python -m bench.autocomplete_benchmark --from-db               # words.word_text 사용 (DATABASE_URL 필요)
+# 질의 종류별 µs/질의 (p50, p99):
+#   prefix   : 단어 앞부분 + 치는 중인 음절 ('사랑' → '살')
+#   choseong : 단어 초성 앞부분 ('ㅅㄹ')
+#   fuzzy    : 자모 하나를 바꾼 오타 (접두어 결과가 없어서 편집 거리 1 검색까지 감)
+#   scan     : 비교용, 리스트 전체를 startswith로 훑는 방식 (LIKE 'x%' 인덱스 없이 한 것과 비슷)
+import argparse
+import random
+import time
+import tracemalloc
+import uuid
+
+from app.words.prefix_index import PrefixIndex
+from app.words.hangul import COMPOUND, JUNGSEONG, compose, decompose, to_choseong
+from bench.load_test import percentile
+
+# 자주 쓰는 음절 위주로 단어를 만듦 (완전 무작위 음절이면 접두어 구간이 너무 좁아짐)
+COMMON = ("가각간갈감강개거건걸검게격견결경계고곡공과관광교구국군굴궁권귀규균그극근글금기긴길김나남내너네노녹논"
+          "놀농뇌누눈느는늘능다단달담당대더덕도독동두둥드득들등디라락란람랑래량러레려력련렬령로록론료루류륙르를"
+          "리린림립마막만말망매머먹면명모목몸무문물미민밀바박반발방배백버번벌범법변별병보복본봉부북분불비빈빛사삭"
+          "산살삼상새색생서석선설섬성세소속손솔송수숙순술숲스슬습승시식신실심아악안알암압앙애야약양어억언얼엄업"
+          "여역연열염영예오옥온올와완왕외요욕용우운울웅원월위유육윤은을음응의이익인일임입자작잔장재저적전절점정제"
+          "조족존종좌주죽준중즉지직진질집차착찬참창채책처천철청체초촌총최추축춘출충취측치친칠침카코크타탄탈탐탑태"
+          "터토통퇴투특파판팔패편평폐포표품풍프피필하학한할함합항해핵행향허험혁현혈협형호혹혼홍화확환활황회효후훈휘흐흑흔흥희힘")
+
+
+SIMPLE_VOWELS = [j for j, vowel in enumerate(JUNGSEONG) if vowel not in COMPOUND]
+
+
+def synthetic(n, seed=0):
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < n:
+        length = rng.choices((1, 2, 3, 4, 5), weights=(2, 45, 30, 18, 5))[0]
+        words.add("".join(rng.choice(COMMON) for _ in range(length)))
+    return sorted(words)
+
+
+def from_db():
+    from sqlalchemy import select
+
+    from app.models import Words
+    from data.postgresDB import SessionLocal
+    with SessionLocal() as db:
+        return [text for (text,) in db.execute(select(Words.word_text)).all()]
+
+
+def typing(word, rng):
+    # 앞 음절 몇 개 + 마지막 음절은 치는 중 (받침 없이 / 초성만)
+    cut = rng.randint(1, len(word))
+    head, last = word[:cut - 1], word[cut - 1]
+    parts = decompose(last)
+    if parts and parts[2] and rng.random() < 0.5:
+        return head + compose(parts[0], parts[1])
+    return head + last
+
+
+def typo(word, rng):
+    # 한 음절의 홑모음을 다른 홑모음으로 (자모 기준 한 글자 바뀜)
+    syllables = [i for i, ch in enumerate(word) if decompose(ch) and decompose(ch)[1] in SIMPLE_VOWELS]
+    if not syllables:
+        return None
+    i = rng.choice(syllables)
+    cho, jung, jong = decompose(word[i])
+    return word[:i] + compose(cho, rng.choice([j for j in SIMPLE_VOWELS if j != jung]), jong) + word[i + 1:]
+
+
+def timed(fn, queries):
+    samples = []
+    for q in queries:
+        start = time.perf_counter()
+        fn(q)
+        samples.append((time.perf_counter() - start) * 1e6)
+    samples.sort()
+    return percentile(samples, 50), percentile(samples, 99)
+
+
+def run(texts, queries, limit):
+    rng = random.Random(1)
+    print(f"단어 {len(texts)}개")
+    versions = {word_id: (None, (word_id, text)) for word_id, text in ((uuid.uuid4(), text) for text in texts)}
+    start = time.perf_counter()
+    index = PrefixIndex.build(versions)
+    build = time.perf_counter() - start
+    # 메모리는 한 번 더 만들어서 따로 잼 (tracemalloc을 켜면 빌드가 몇 배 느려짐)
+    tracemalloc.start()
+    traced = PrefixIndex.build(versions)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del traced
+    print(f"빌드 {build:.2f}s, 인덱스 메모리 {memory / 2 ** 20:.1f}MB (단어 원문/UUID 제외)")
+
+    # 증분 갱신: 100개 바뀜
+    changed = rng.sample(list(versions), 100)
+    rows = [(word_id, versions[word_id][1][1] + "들", time.time()) for word_id in changed]
+    start = time.perf_counter()
+    index.apply(rows, set())
+    print(f"증분 갱신(100개) {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    sample = rng.sample(texts, queries)
+    cases = {
+        "prefix": (lambda q: index.complete(q, limit, fuzzy=False), [typing(w, rng) for w in sample]),
+        "choseong": (lambda q: index.complete(q, limit), [to_choseong(w)[:rng.randint(1, len(w))] for w in sample]),
+        "fuzzy": (lambda q: index.complete(q, limit), [q for q in (typo(w, rng) for w in sample if len(w) >= 2) if q]),
+        "scan": (lambda q: [t for t in texts if t.startswith(q)][:limit], [typing(w, rng) for w in sample[:max(queries // 20, 5)]]),
+    }
+    print(f"{'질의':>9} {'개수':>6} {'p50(µs)':>10} {'p99(µs)':>10} {'결과 평균':>9}")
+    for name, (fn, qs) in cases.items():
+        p50, p99 = timed(fn, qs)
+        hits = sum(len(index.complete(q, limit)[1]) for q in qs[:200]) / min(len(qs), 200)
+        print(f"{name:>9} {len(qs):>6} {p50:>10.1f} {p99:>10.1f} {hits:>9.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--words", type=int, default=500000, help="합성 사전 단어 수")
+    parser.add_argument("--from-db", action="store_true", help="words.word_text 사용")
+    parser.add_argument("--queries", type=int, default=5000)
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+    run(from_db() if args.from_db else synthetic(args.words), args.queries, args.limit)
@@ -0,0 +1,132 @@
+# 임베딩 로드 방식별 시작 시간 / 메모리(RSS, PSS) 비교
+# 사용법:
+#   python -m bench.embedding_store_benchmark --synthetic 200000 --dim 300 --workers 4
+#   python -m bench.embedding_store_benchmark --workers 4      # 실제 DB + WORD_EMBEDDING_STORE_DIR 저장소
+# 방식:
+#   db / lists : DB에서 FLOAT8[] 를 읽는 기존 방식 (synthetic이면 float64 파이썬 리스트 → numpy 변환으로 흉내)
+#   float32    : 저장소 mmap (python -m data.export_embeddings)
+#   int8       : 저장소 mmap, int8 양자화
+# 방식마다 워커 수만큼 프로세스를 동시에 띄워 로드 + 전수 검색 한 번(모든 페이지를 건드림) 후
+# 프로세스별 시작 시간, RSS(전용 Anon / 파일 매핑 File), PSS(공유 페이지를 나눠 센 실제 점유) 합계를 출력한다.
+import argparse
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+
+import numpy as np
+
+from app.words.embedding_store import StoreWriter
+from app.words.vectors import normalize
+
+
+def memory():
+    # /proc 기준 (리눅스)
+    status = dict(line.split(":", 1) for line in open("/proc/self/status"))
+    kb = lambda key: int(status.get(key, "0 kB").split()[0])
+    pss = 0
+    if os.path.exists("/proc/self/smaps_rollup"):
+        for line in open("/proc/self/smaps_rollup"):
+            if line.startswith("Pss:"):
+                pss = int(line.split()[1])
+    return {"rss_mb": kb("VmRSS") / 1024, "anon_mb": kb("RssAnon") / 1024, "file_mb": kb("RssFile") / 1024, "pss_mb": pss / 1024}
+
+
+def child(mode, store, n, dim, ready, go):
+    # 워커 한 개: 로드 → 전수 검색 한 번 → 다른 워커도 끝날 때까지 기다렸다가 메모리 측정
+    start = time.perf_counter()
+    if mode == "lists":
+        rng = np.random.default_rng(0)
+        rows = [rng.standard_normal(dim).tolist() for _ in range(n)]  # asyncpg가 돌려주는 list[float] 흉내
+        matrix, scales = normalize(np.array(rows, dtype=np.float32)), None
+        del rows
+    elif mode == "db":
+        from app.words.embedding_index import embedding_index
+        snapshot = embedding_index.refresh()
+        matrix, scales = snapshot.matrix, snapshot.scales
+    else:
+        from app.words.embedding_store import EmbeddingStore
+        s = EmbeddingStore(store)
+        matrix, scales = s.vectors, s.scales
+    load = time.perf_counter() - start
+    q = normalize(np.asarray(matrix[:1], dtype=np.float32))
+    for row in range(0, len(matrix), 16384):
+        scores = q @ np.asarray(matrix[row:row + 16384], dtype=np.float32).T
+        if scales is not None:
+            scores *= scales[row:row + 16384]
+    first_query = time.perf_counter() - start - load
+    ready.put(None)
+    go.wait()
+    return {"load_s": load, "first_query_s": first_query, **memory()}
+
+
+def _worker(args, out, ready, go):
+    out.put(child(*args, ready, go))
+
+
+def measure(mode, store, n, dim, workers):
+    ctx = multiprocessing.get_context("spawn")
+    out, ready, go = ctx.Queue(), ctx.Queue(), ctx.Event()
+    procs = [ctx.Process(target=_worker, args=((mode, store, n, dim), out, ready, go)) for _ in range(workers)]
+    for p in procs:
+        p.start()
+    for _ in procs:
+        ready.get()
+    go.set()  # 모두 로드를 마친 상태에서 메모리를 재도록 맞춤
+    results = [out.get() for _ in procs]
+    for p in procs:
+        p.join()
+    return results
+
+
+def write_synthetic(root, n, dim, dtype):
+    rng = np.random.default_rng(0)
+    writer = StoreWriter(root, f"bench_{dtype}", n, dim, dtype)
+    for start in range(0, n, 10000):
+        m = min(10000, n - start)
+        writer.write([uuid.uuid4() for _ in range(m)], normalize(rng.standard_normal((m, dim))))
+    writer.publish()
+    return os.path.realpath(os.path.join(root, f"bench_{dtype}"))
+
+
+def report(mode, results):
+    avg = lambda key: sum(r[key] for r in results) / len(results)
+    total = lambda key: sum(r[key] for r in results)
+    print(f"{mode:>8} | 로드 {avg('load_s'):6.2f}s | 첫 검색 {avg('first_query_s') * 1000:7.1f}ms | "
+          f"RSS/워커 {avg('rss_mb'):7.1f}MB (anon {avg('anon_mb'):7.1f}, file {avg('file_mb'):7.1f}) | "
+          f"PSS 합계 {total('pss_mb'):8.1f}MB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--synthetic", type=int, default=0, help="합성 단어 수 (0이면 실제 DB / 저장소 사용)")
+    parser.add_argument("--dim", type=int, default=300)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    print(f"워커 {args.workers}개 동시 실행")
+    if args.synthetic:
+        with tempfile.TemporaryDirectory() as root:
+            stores = {dtype: write_synthetic(root, args.synthetic, args.dim, dtype) for dtype in ("float32", "int8")}
+            print(f"단어 {args.synthetic} × {args.dim}차원 (합성)")
+            report("lists", measure("lists", None, args.synthetic, args.dim, args.workers))
+            for dtype, path in stores.items():
+                report(dtype, measure("mmap", path, args.synthetic, args.dim, args.workers))
+    else:
+        from app.words.embedding_store import current_path
+        path = current_path("words")
+        if path is None:
+            sys.exit("WORD_EMBEDDING_STORE_DIR 저장소가 없습니다. python -m data.export_embeddings 먼저 실행")
+        with open(os.path.join(path, "meta.json")) as f:
+            meta = json.load(f)
+        print(f"저장소 {os.path.basename(path)}: {meta['count']} × {meta['dim']} ({meta['dtype']})")
+        env_db = dict(os.environ, WORD_EMBEDDING_STORE_DIR="")
+        # DB 방식은 저장소 설정 없이 띄워야 하므로 환경변수를 비운 하위 프로세스에서 실행
+        subprocess.run([sys.executable, "-c",
+                        "import sys; from bench.embedding_store_benchmark import measure, report; "
+                        f"report('db', measure('db', None, 0, 0, {args.workers}))"], env=env_db, check=True)
+        report(meta["dtype"], measure("mmap", path, 0, 0, args.workers))
@@ -0,0 +1,137 @@
+# 게임 리더보드 (app/games/leaderboard.py, app/games/ranking.py) 반영 속도 / 메모리 / 순위 조회 지연
+# 사용법:
+#   python -m bench.leaderboard_benchmark --plays 3000000 --users 200000
+#   python -m bench.leaderboard_benchmark --plays 3000000 --sql     # 비교용 SQL(sqlite 메모리 DB)도 같이 잼
+# 합성 게임 기록(최근 14일, 게임 종류 3개)을 DB 없이 보드에 바로 반영 (서버의 sync 와 같은 경로)
+#   apply  : 보드 하나에 점수 반영 (게임 기록 하나는 일간/주간/전체 보드 3개에 반영됨)
+#   rank   : "내 순위" (펜윅 트리 누적합, O(log 점수 범위))
+#   top10 / top100@1000 : 상위 10명 / 1000등부터 100명
+#   scan   : 비교용, 같은 게임 기록을 numpy 배열에 두고 score > x 개수를 셈 (COUNT(*) WHERE score > x, 유저 중복 제거도 안 한 하한)
+#   sql    : 비교용, sqlite 에서 유저별 최고 점수로 순위 (GROUP BY user_id HAVING max(score) > x)
+import argparse
+import random
+import sqlite3
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from app.games.ranking import GAME_TYPES, Board, period_key
+from bench.load_test import percentile
+
+PERIODS = ("daily", "weekly", "all")
+
+
+def synthetic(plays, users, seed=0):
+    # (game_type, user_id, score, played_at) — 유저 활동량은 치우치게, 점수는 게임별 분포로
+    rng = np.random.default_rng(seed)
+    user_ids = (rng.zipf(1.3, plays) - 1) % users + 1
+    game = rng.integers(0, len(GAME_TYPES), plays)
+    # 끝말잇기: 턴 × 10 + 승리 보너스, 퀴즈: 맞힌 수 × 10
+    chain = rng.geometric(0.08, plays) * 10 + rng.choice([0, 20, 50, 100], plays, p=[0.55, 0.2, 0.15, 0.1])
+    quiz = rng.binomial(20, 0.6, plays) * 10
+    scores = np.where(game == 0, chain, quiz)
+    now = datetime.now()
+    seconds = np.sort(rng.integers(0, 14 * 86400, plays))[::-1]
+    times = [now - timedelta(seconds=int(s)) for s in seconds]
+    return list(zip([GAME_TYPES[g] for g in game.tolist()], user_ids.tolist(), scores.tolist(), times))
+
+
+def timed(fn, args):
+    samples = []
+    for a in args:
+        start = time.perf_counter()
+        fn(a)
+        samples.append((time.perf_counter() - start) * 1e6)
+    samples.sort()
+    return percentile(samples, 50), percentile(samples, 99)
+
+
+def apply(boards, rows):
+    # Leaderboards._apply 와 같은 갱신 (기간 정리 없이 모든 기간 보드를 둠)
+    keys_of = {}
+    for game_type, user_id, score, played_at in rows:
+        day = played_at.date()
+        keys = keys_of.get(day)
+        if keys is None:
+            keys = keys_of[day] = [(period, period_key(period, played_at)) for period in PERIODS]
+        for period, key in keys:
+            board = boards.get((game_type, period, key))
+            if board is None:
+                board = boards[(game_type, period, key)] = Board()
+            board.submit(user_id, score, played_at)
+
+
+def run(plays, users, queries, sql):
+    rng = random.Random(1)
+    start = time.perf_counter()
+    rows = synthetic(plays, users)
+    print(f"게임 기록 {len(rows)}개, 유저 {users}명 (생성 {time.perf_counter() - start:.1f}s)")
+
+    boards = {}
+    start = time.perf_counter()
+    apply(boards, rows)
+    elapsed = time.perf_counter() - start
+    entries = sum(len(board) for board in boards.values())
+    # 메모리는 앞부분 10%로 따로 만들어서 잼 (tracemalloc을 켜면 몇 배 느려짐)
+    tracemalloc.start()
+    traced = {}
+    apply(traced, rows[:len(rows) // 10])
+    per_entry = tracemalloc.get_traced_memory()[0] / sum(len(board) for board in traced.values())
+    tracemalloc.stop()
+    del traced
+    print(f"반영 {elapsed:.1f}s ({len(rows) / elapsed:,.0f}건/s, {elapsed / len(rows) * 1e6:.2f}µs/건), "
+          f"보드 {len(boards)}개 / 항목 {entries:,}개, 항목당 {per_entry:.0f}B (약 {per_entry * entries / 2 ** 20:.0f}MB)")
+
+    now = datetime.now()
+    board = boards[("word_chain", "all", "all")]
+    weekly = boards[("word_chain", "weekly", period_key("weekly", now))]
+    members = list(board.best)
+    weekly_members = list(weekly.best)
+    sample = [rng.choice(members) for _ in range(queries)]
+    fresh = [(rng.randrange(1, users + 1), rng.randrange(0, 400)) for _ in range(queries)]
+    cases = {
+        "apply": (lambda a: board.submit(a[0], a[1], now), fresh),
+        "rank": (board.rank, sample),
+        "rank(주간)": (weekly.rank, [rng.choice(weekly_members) for _ in range(queries)]),
+        "top10": (lambda _: board.top(10), range(queries)),
+        "top100@1000": (lambda _: board.top(100, 1000), range(queries)),
+    }
+
+    chain_scores = np.array([score for game_type, _, score, _ in rows if game_type == "word_chain"], dtype=np.int32)
+    thresholds = [board.best[user_id][0] for user_id in sample]
+    scan_n = max(queries // 20, 20)
+    cases["scan"] = (lambda x: int((chain_scores > x).sum()), thresholds[:scan_n])
+
+    if sql:
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE user_games (user_id INT, game_type TEXT, score INT)")
+        conn.executemany("INSERT INTO user_games VALUES (?, ?, ?)", ((u, g, s) for g, u, s, _ in rows))
+        conn.execute("CREATE INDEX ix_user_games ON user_games (game_type, user_id, score)")
+        rank_sql = ("SELECT count(*) FROM (SELECT user_id FROM user_games WHERE game_type = 'word_chain' "
+                    "GROUP BY user_id HAVING max(score) > ?)")
+        cases["sql"] = (lambda x: conn.execute(rank_sql, (x,)).fetchone(), thresholds[:max(queries // 200, 5)])
+
+    print(f"{'질의':>12} {'개수':>6} {'p50(µs)':>10} {'p99(µs)':>10}")
+    for name, (fn, args) in cases.items():
+        args = list(args)
+        p50, p99 = timed(fn, args)
+        print(f"{name:>12} {len(args):>6} {p50:>10.1f} {p99:>10.1f}")
+
+    # 순위 정확성: 무작위 유저의 순위를 직접 센 값과 비교
+    scores = np.array([score for score, _ in board.best.values()])
+    for user_id in sample[:50]:
+        rank, score = board.rank(user_id)
+        assert rank == int((scores > score).sum()) + 1
+    print("순위 검증 50건 ok")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--plays", type=int, default=3000000, help="합성 게임 기록 수")
+    parser.add_argument("--users", type=int, default=200000)
+    parser.add_argument("--queries", type=int, default=5000)
+    parser.add_argument("--sql", action="store_true", help="sqlite 비교 (기록을 넣는 데 시간이 더 걸림)")
+    args = parser.parse_args()
+    run(args.plays, args.users, args.queries, args.sql)
@@ -0,0 +1,59 @@
+# 목록 응답 크기/지연 비교 (전체 모드 vs ?view=summary)
+# 사용법: 응답 캐시를 끈 채로 서버를 띄운 뒤 (RESPONSE_CACHE_ENABLED=false)
+#   python -m bench.list_benchmark --base-url http://localhost:8000 --concurrency 20 --requests 1000
+# 같은 페이지를 두 모드로 번갈아 요청해서 응답 바이트 수, req/s, p50/p99를 출력한다.
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+from bench.load_test import percentile
+
+BOARDS = ["/community/parent/posts", "/community/reading/posts"]
+
+
+async def measure(client, path, concurrency, total):
+    latencies, sizes = [], []
+
+    async def worker(n):
+        for _ in range(n):
+            start = time.perf_counter()
+            resp = await client.get(path)
+            latencies.append(time.perf_counter() - start)
+            resp.raise_for_status()
+            sizes.append(len(resp.content))
+
+    start = time.perf_counter()
+    per_worker = total // concurrency
+    await asyncio.gather(*(worker(per_worker) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return {
+        "bytes": statistics.mean(sizes),
+        "rps": len(latencies) / elapsed,
+        "p50": percentile(latencies, 50) * 1000,
+        "p99": percentile(latencies, 99) * 1000,
+    }
+
+
+async def run(base_url, size, concurrency, total):
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        print(f"{'경로':<44}{'bytes':>10}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}")
+        for board in BOARDS:
+            for view in ("full", "summary"):
+                path = f"{board}?page=1&size={size}&view={view}"
+                await client.get(path)  # 워밍업 (커넥션 풀/쿼리 플랜)
+                result = await measure(client, path, concurrency, total)
+                print(f"{path:<44}{result['bytes']:>10.0f}{result['rps']:>10.1f}{result['p50']:>10.1f}{result['p99']:>10.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--size", type=int, default=50, help="한 페이지당 게시글 수")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(run(args.base_url, args.size, args.concurrency, args.requests))
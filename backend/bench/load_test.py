@@ -0,0 +1,69 @@
+# 동시 요청 부하 테스트
+# 사용법: 서버를 띄운 뒤
+#   python -m bench.load_test --base-url http://localhost:8000 --concurrency 50 --requests 2000
+# 동기 세션(baseline 커밋)과 비동기 세션 버전을 같은 옵션으로 돌려서 req/s, p50/p99를 비교한다.
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+DEFAULT_PATHS = [
+    "/community/parent/posts?page=1&size=10",
+    "/customer-support/list",
+]
+
+
+async def worker(client, paths, queue, latencies, errors):
+    while True:
+        try:
+            i = queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return
+        path = paths[i % len(paths)]
+        start = time.perf_counter()
+        try:
+            resp = await client.get(path)
+            if resp.status_code >= 500:
+                errors.append(resp.status_code)
+        except httpx.HTTPError as e:
+            errors.append(type(e).__name__)
+        latencies.append(time.perf_counter() - start)
+
+
+def percentile(values, p):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    k = min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))
+    return values[k]
+
+
+async def run(base_url, paths, concurrency, total):
+    queue = asyncio.Queue()
+    for i in range(total):
+        queue.put_nowait(i)
+    latencies, errors = [], []
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(client, paths, queue, latencies, errors) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    print(f"요청 수      : {total} (동시 {concurrency})")
+    print(f"소요 시간    : {elapsed:.2f}s")
+    print(f"처리량       : {total / elapsed:.1f} req/s")
+    print(f"평균 지연    : {statistics.mean(latencies) * 1000:.1f} ms")
+    print(f"p50 / p99    : {percentile(latencies, 50) * 1000:.1f} / {percentile(latencies, 99) * 1000:.1f} ms")
+    print(f"에러         : {len(errors)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--path", action="append", help="부하를 줄 GET 경로 (여러 번 지정 가능)")
+    args = parser.parse_args()
+    asyncio.run(run(args.base_url, args.path or DEFAULT_PATHS, args.concurrency, args.requests))
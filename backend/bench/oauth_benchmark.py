@@ -0,0 +1,78 @@
+# 소셜 로그인 전체 흐름 지연/성공률 (공용 HTTP 커넥션 풀 + OIDC 메타데이터 캐시)
+# 사용법: OAUTH_STUB_URL=http://localhost:8000/oauth-stub 로 서버를 띄운 뒤 (가짜 provider가 같은 서버에 등록됨)
+#   python -m bench.oauth_benchmark --provider google --logins 500 --concurrency 20
+# 로그인 1건 = /auth/{provider}/login → stub authorize → /auth/{provider}/callback (토큰 교환 + 유저 정보 조회)
+# --users 개수만큼의 stub 유저를 돌려 가며 사용. 첫 로그인은 신규 가입(additional-info로 리다이렉트)으로 처리된다.
+import argparse
+import asyncio
+import os
+import time
+from collections import Counter
+
+import httpx
+
+from bench.load_test import percentile
+
+
+async def login_once(base_url, limits, provider, user):
+    # 세션 쿠키(state/nonce)가 섞이지 않도록 로그인마다 쿠키 저장소를 따로 둠
+    async with httpx.AsyncClient(base_url=base_url, timeout=30, limits=limits) as client:
+        resp = await client.get(f"/auth/{provider}/login")
+        if resp.status_code != 302:
+            return f"login {resp.status_code}"
+        resp = await client.get(resp.headers["location"] + f"&stub_user={user}")
+        if resp.status_code != 302:
+            return f"authorize {resp.status_code}"
+        resp = await client.get(resp.headers["location"])
+        if resp.status_code != 307:
+            return f"callback {resp.status_code}"
+        location = resp.headers["location"]
+        if "additional-info" in location:
+            return "signup"
+        return "ok" if "access_token" in resp.cookies else "no cookie"
+
+
+async def run(base_url, provider, total, concurrency, users, internal_token):
+    limits = httpx.Limits(max_connections=concurrency)
+    queue = asyncio.Queue()
+    for i in range(total):
+        queue.put_nowait(i % users + 1)
+    results, latencies = Counter(), []
+
+    async def worker():
+        while not queue.empty():
+            user = queue.get_nowait()
+            start = time.perf_counter()
+            results[await login_once(base_url, limits, provider, user)] += 1
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    print(f"provider         : {provider}")
+    print(f"로그인 수        : {total} (동시 {concurrency}, 유저 {users}명)")
+    print(f"결과             : {dict(results)}")
+    print(f"처리량           : {total / elapsed:.1f} logins/s")
+    print(f"p50 / p99        : {percentile(latencies, 50) * 1000:.1f} / {percentile(latencies, 99) * 1000:.1f} ms")
+
+    headers = {"X-Internal-Token": internal_token} if internal_token else {}
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        stats = await client.get("/internal/oauth", headers=headers)
+        if stats.status_code == 200:
+            data = stats.json()
+            print(f"HTTP 풀          : {data['http_pool']}")
+            print(f"Google 메타데이터: {data['google_metadata']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--provider", choices=["google", "naver", "kakao"], default="google")
+    parser.add_argument("--logins", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--internal-token", default=os.getenv("INTERNAL_API_TOKEN"),
+                        help="서버의 INTERNAL_API_TOKEN (없으면 내부 통계 출력 생략)")
+    args = parser.parse_args()
+    asyncio.run(run(args.base_url, args.provider, args.logins, args.concurrency, args.users, args.internal_token))
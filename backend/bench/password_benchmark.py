@@ -0,0 +1,79 @@
+# 로그인 폭주 중 다른 API 지연 비교 (bcrypt 프로세스 풀)
+# 사용법: 로그인 가능한 계정을 하나 만들어 두고 서버를 띄운 뒤
+#   python -m bench.password_benchmark --email a@b.c --password pw --logins 400 --login-concurrency 50
+# PASSWORD_POOL_WORKERS=0 (스레드풀, 기존 방식)으로 띄운 서버와 결과를 비교한다.
+# 로그인 처리량/거절(503) 수와, 그동안 다른 API(--path)의 p50/p99 지연을 출력한다.
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from bench.load_test import percentile
+
+BACKGROUND_PATH = "/community/parent/posts?page=1&size=10&view=summary"
+
+
+async def login_burst(client, email, password, total, concurrency):
+    statuses, latencies = [], []
+    queue = asyncio.Queue()
+    for i in range(total):
+        queue.put_nowait(i)
+
+    async def worker():
+        while not queue.empty():
+            queue.get_nowait()
+            start = time.perf_counter()
+            resp = await client.post("/login_user/login", json={"email": email, "password": password})
+            latencies.append(time.perf_counter() - start)
+            statuses.append(resp.status_code)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return statuses, latencies, time.perf_counter() - start
+
+
+async def background(client, path, stop, latencies):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await client.get(path)
+        latencies.append(time.perf_counter() - start)
+
+
+async def run(base_url, email, password, logins, login_concurrency, background_concurrency, path):
+    limits = httpx.Limits(max_connections=login_concurrency + background_concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        # 로그인 없이 측정한 기준 지연
+        idle, stop = [], asyncio.Event()
+        tasks = [asyncio.create_task(background(client, path, stop, idle)) for _ in range(background_concurrency)]
+        await asyncio.sleep(3)
+        stop.set()
+        await asyncio.gather(*tasks)
+
+        busy, stop = [], asyncio.Event()
+        tasks = [asyncio.create_task(background(client, path, stop, busy)) for _ in range(background_concurrency)]
+        statuses, login_latencies, elapsed = await login_burst(client, email, password, logins, login_concurrency)
+        stop.set()
+        await asyncio.gather(*tasks)
+
+    ok = statuses.count(200)
+    print(f"로그인           : {len(statuses)}건, 성공 {ok}, 거절(503) {statuses.count(503)}, 기타 {len(statuses) - ok - statuses.count(503)}")
+    print(f"로그인 처리량    : {ok / elapsed:.1f} 성공/s")
+    print(f"로그인 p50 / p99 : {percentile(login_latencies, 50) * 1000:.1f} / {percentile(login_latencies, 99) * 1000:.1f} ms")
+    print(f"{path}")
+    print(f"  평소 p50 / p99      : {percentile(idle, 50) * 1000:.1f} / {percentile(idle, 99) * 1000:.1f} ms")
+    print(f"  로그인 중 p50 / p99 : {percentile(busy, 50) * 1000:.1f} / {percentile(busy, 99) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--email", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--logins", type=int, default=400)
+    parser.add_argument("--login-concurrency", type=int, default=50)
+    parser.add_argument("--background-concurrency", type=int, default=5)
+    parser.add_argument("--path", default=BACKGROUND_PATH, help="로그인 중 지연을 잴 GET 경로")
+    args = parser.parse_args()
+    asyncio.run(run(args.base_url, args.email, args.password, args.logins,
+                    args.login_concurrency, args.background_concurrency, args.path))
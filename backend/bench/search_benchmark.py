@@ -0,0 +1,131 @@
+# 검색 인덱스 벤치마크
+# 사용법: DATABASE_URL을 설정하고 dodam.sql(korean_terms / korean_tsquery 함수 포함)을 적용한 DB에서
+#   python -m bench.search_benchmark --rows 300000 --repeat 20
+# 임시 테이블(bench_search_posts)에 합성 게시글을 넣고, 같은 검색어로
+#   1) search_vector GIN 인덱스 검색 (/search와 같은 쿼리)
+#   2) 순차 스캔: 검색어 단어마다 ILIKE '%단어%' (AND), 전체 일치 건수까지 세서 상위 10건
+#      (LIMIT만 걸면 흔한 단어는 앞쪽 몇 행만 보고 끝나서 비교가 안 됨)
+# 의 지연 시간(중앙값/p95)을 비교한다. 흔한 단어 / 한 글자 / 드문 단어를 섞어서 잰다.
+# 순차 스캔이 찾은 글을 GIN 검색이 빠뜨리지 않는지도 검사한다 (빠진 건수가 있으면 실패).
+# 끝나면 테이블을 지운다 (--keep 으로 유지 가능).
+import argparse
+import random
+import statistics
+import time
+
+from sqlalchemy import text
+
+from data.postgresDB import engine
+
+TABLE = "bench_search_posts"
+
+WORDS = [
+    "아이", "육아", "독서", "토론", "그림책", "동화", "초등학생", "유치원", "어린이집", "숙제",
+    "수학", "영어", "받아쓰기", "한글", "놀이", "공부", "습관", "방학", "학원", "선생님",
+    "친구", "가족", "주말", "여행", "도서관", "추천", "고민", "질문", "후기", "준비물",
+    "간식", "잠자리", "이야기", "상상력", "표현", "감정", "대화", "칭찬", "규칙", "스마트폰",
+    "책가방", "꿈", "꿈나무",
+]
+RARE_WORDS = ["공룡화석", "우주정거장"]  # 단어 5000개 중 하나 꼴로만 나옴
+# 흔한 단어 / 한 글자(단어 앞·중간·끝) / 드문 단어
+QUERIES = ["그림책 추천", "받아쓰기", "도서관 주말", "잠자리 이야기", "스마트폰 규칙", "책", "꿈 이야기", "공룡화석"]
+
+SEARCH_SQL = text(f"""
+    SELECT id, title, ts_rank_cd(search_vector, q) AS rank
+    FROM {TABLE}, korean_tsquery(:q) AS q
+    WHERE search_vector @@ q
+    ORDER BY rank DESC, id DESC
+    LIMIT 10
+""")
+SCAN_SQL = text(f"""
+    SELECT id, title, count(*) OVER () AS total
+    FROM {TABLE}
+    WHERE (title || ' ' || content) ILIKE ALL (:patterns)
+    ORDER BY title ILIKE ALL (:patterns) DESC, id DESC
+    LIMIT 10
+""")
+# 순차 스캔 일치 건수 / GIN 일치 건수 / 순차 스캔에는 걸리는데 GIN 검색에서 빠진 건수
+CHECK_SQL = text(f"""
+    SELECT count(*) FILTER (WHERE scan), count(*) FILTER (WHERE gin), count(*) FILTER (WHERE scan AND NOT gin)
+    FROM (
+        SELECT (title || ' ' || content) ILIKE ALL (:patterns) AS scan, search_vector @@ korean_tsquery(:q) AS gin
+        FROM {TABLE}
+    ) AS t
+""")
+
+
+def sentence(rng, n):
+    return " ".join(rng.choice(RARE_WORDS) if rng.random() < 0.0002 else rng.choice(WORDS) for _ in range(n))
+
+
+def populate(conn, rows, batch=5000):
+    conn.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+    conn.execute(text(f"""
+        CREATE TABLE {TABLE} (
+            id bigserial PRIMARY KEY,
+            title varchar(255),
+            content text,
+            search_vector tsvector GENERATED ALWAYS AS (
+                setweight(to_tsvector('simple', korean_terms(title)), 'A') ||
+                setweight(to_tsvector('simple', korean_terms(content)), 'C')
+            ) STORED
+        )
+    """))
+    rng = random.Random(42)
+    insert = text(f"INSERT INTO {TABLE} (title, content) VALUES (:title, :content)")
+    for start in range(0, rows, batch):
+        conn.execute(insert, [
+            {"title": sentence(rng, 4), "content": sentence(rng, rng.randint(20, 60))}
+            for _ in range(min(batch, rows - start))
+        ])
+    conn.execute(text(f"CREATE INDEX ON {TABLE} USING gin (search_vector)"))
+    conn.execute(text(f"ANALYZE {TABLE}"))
+
+
+def measure(conn, statement, params, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        conn.execute(statement, params).fetchall()
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return statistics.median(timings), timings[int(0.95 * (len(timings) - 1))]
+
+
+def main(rows, repeat, keep):
+    with engine.connect() as conn:
+        print(f"{TABLE}에 {rows}건 생성 중...")
+        start = time.perf_counter()
+        populate(conn, rows)
+        conn.commit()
+        print(f"생성 + 인덱싱: {time.perf_counter() - start:.1f}s\n")
+
+        print(f"{'검색어':<16}{'일치 (스캔/GIN)':>16}{'GIN 중앙값/p95 (ms)':>24}{'순차 스캔 중앙값/p95 (ms)':>28}")
+        missed, extra = 0, False
+        for q in QUERIES:
+            patterns = [f"%{term}%" for term in q.split()]
+            scan_hits, gin_hits, missing = conn.execute(CHECK_SQL, {"q": q, "patterns": patterns}).one()
+            missed += missing
+            extra = extra or gin_hits > scan_hits
+            gin = measure(conn, SEARCH_SQL, {"q": q}, repeat)
+            # 인덱스 없이 전체 테이블 스캔
+            scan = measure(conn, SCAN_SQL, {"patterns": patterns}, repeat)
+            print(f"{q:<16}{f'{scan_hits}/{gin_hits}':>16}{gin[0]:>14.2f} / {gin[1]:<8.2f}{scan[0]:>16.2f} / {scan[1]:<8.2f}"
+                  + (f"  GIN 누락 {missing}건" if missing else ""))
+        if extra:
+            print("\nGIN 검색이 더 찾은 글은 bigram이 떨어져 있는 경우 (예: '이야기' 검색에 '이야 … 야기')")
+
+        if not keep:
+            conn.execute(text(f"DROP TABLE {TABLE}"))
+            conn.commit()
+    if missed:
+        raise SystemExit(f"GIN 검색이 순차 스캔 결과 {missed}건을 빠뜨림")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=300000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--keep", action="store_true", help="벤치마크 테이블을 지우지 않음")
+    args = parser.parse_args()
+    main(args.rows, args.repeat, args.keep)
@@ -16,6 +16,17 @@ CREATE TABLE IF NOT EXISTS users (
     key_parent VARCHAR(100) default null  --부모인증키
 );
 
+-- 소셜 로그인 계정 연결 (JOIN 가능: users)
+-- (provider, provider_user_id) 기본키 인덱스 한 번으로 로그인 유저를 찾음
+-- google: id_token sub, naver: 회원 id, kakao: 회원번호
+CREATE TABLE IF NOT EXISTS user_identities (
+    provider VARCHAR(20) NOT NULL CHECK (provider IN ('google','naver','kakao')),
+    provider_user_id VARCHAR(255) NOT NULL,
+    user_id INT NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    created_at TIMESTAMP DEFAULT NOW(),
+    PRIMARY KEY (provider, provider_user_id)
+    );
+
 --diary (JOIN 가능: users)
 CREATE TABLE IF NOT EXISTS diary(
     id SERIAL PRIMARY KEY,
@@ -59,7 +70,8 @@ CREATE TABLE IF NOT EXISTS reading_forum_posts (
     created_at TIMESTAMP DEFAULT NOW(),
     updated_at TIMESTAMP DEFAULT NOW(),
     book_title VARCHAR(255), -- 관련 도서
-    discussion_tags VARCHAR(100) -- 토론 주제 태그
+    discussion_tags VARCHAR(100), -- 토론 주제 태그
+    comment_count INT NOT NULL DEFAULT 0 -- 직계 댓글 수 (트리거로 유지)
 );
 
 -- 부모 커뮤니티 (JOIN 가능: users)
@@ -72,7 +84,8 @@ CREATE TABLE IF NOT EXISTS parent_forum_posts (
     created_at TIMESTAMP DEFAULT NOW(),
     updated_at TIMESTAMP DEFAULT NOW(),
     category VARCHAR(50), -- 예: 교육, 육아, 상담
-    is_important BOOLEAN DEFAULT FALSE -- 공지 여부
+    is_important BOOLEAN DEFAULT FALSE, -- 공지 여부
+    comment_count INT NOT NULL DEFAULT 0 -- 직계 댓글 수 (트리거로 유지)
 );
 
 -- 테스트 (JOIN 가능: users)
@@ -95,6 +108,27 @@ CREATE TABLE IF NOT EXISTS user_games (
     score INT                         -- 유저 점수
 );
 
+-- 게임 리더보드 스냅샷 (app/games/leaderboard.py, JOIN 가능: users)
+-- 보드(게임 종류 × 기간)별 유저 최고 점수, 서버가 메모리 보드에서 바뀐 유저만 주기적으로 upsert
+-- period_key: daily '2026-10-18', weekly '2026-W42', all 'all'
+CREATE TABLE IF NOT EXISTS leaderboard_entries (
+    game_type VARCHAR(50) NOT NULL,
+    period VARCHAR(10) NOT NULL CHECK (period IN ('daily','weekly','all')),
+    period_key VARCHAR(10) NOT NULL,
+    user_id INT NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    score INT NOT NULL,
+    achieved_at TIMESTAMP,            -- 최고 점수를 낸 게임의 played_at
+    PRIMARY KEY (game_type, period, period_key, user_id)
+    );
+
+-- 스냅샷마다 한 줄: last_game_id 까지의 user_games 가 leaderboard_entries 에 반영됨 (서버 시작 시 이후만 읽음)
+CREATE TABLE IF NOT EXISTS leaderboard_snapshots (
+    id SERIAL PRIMARY KEY,
+    last_game_id INT NOT NULL,
+    entries INT NOT NULL DEFAULT 0,   -- 이번에 upsert 한 항목 수
+    saved_at TIMESTAMP DEFAULT NOW()
+    );
+
 -- 구독권 (JOIN 가능: users)
 CREATE TABLE IF NOT EXISTS subscriptions (
     id SERIAL PRIMARY KEY,
@@ -124,7 +158,24 @@ CREATE TABLE IF NOT EXISTS customer_support (
     content TEXT,
     status VARCHAR(20) CHECK (status IN ('open','in_progress','resolved','closed')),
     created_at TIMESTAMP DEFAULT NOW(),
-    updated_at TIMESTAMP DEFAULT NOW()
+    updated_at TIMESTAMP DEFAULT NOW(),
+    resolved_at TIMESTAMP -- resolved/closed가 된 시각 (트리거로 유지)
+    );
+
+-- 고객센터 대시보드 집계 (트리거로 유지, 보정은 python -m data.reconcile_support_stats)
+-- 질문(최상위 글)을 작성일 / 현재 상태 / 카테고리별로 센 값
+CREATE TABLE IF NOT EXISTS customer_support_stats (
+    day DATE NOT NULL,
+    status VARCHAR(20) NOT NULL,
+    category VARCHAR(50) NOT NULL DEFAULT '', -- 카테고리 없음은 ''
+    tickets INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, status, category)
+    );
+
+-- 해결까지 걸린 시간 히스토그램 (중앙값 계산용, 구간은 support_resolve_bucket 참고)
+CREATE TABLE IF NOT EXISTS customer_support_resolve_hist (
+    bucket SMALLINT PRIMARY KEY,
+    tickets INT NOT NULL DEFAULT 0
     );
 
 -- words (JOIN 가능: user_word_usage)
@@ -133,7 +184,8 @@ CREATE TABLE IF NOT EXISTS words (
     word_text TEXT NOT NULL UNIQUE,
     definition TEXT,
     synonyms TEXT[],
-    embedding FLOAT8[]
+    embedding FLOAT8[],
+    updated_at TIMESTAMP DEFAULT NOW() -- 임베딩 인덱스 증분 갱신용 (트리거로 유지)
     );
 
 -- outputs (JOIN 가능: users)
@@ -152,4 +204,206 @@ CREATE TABLE IF NOT EXISTS user_word_usage (
     word_id UUID REFERENCES words(word_id) ON DELETE CASCADE,
     frequency INT,
     user_embedding FLOAT8[]
-);
\ No newline at end of file
+);
+
+-- 인덱스
+-- 커뮤니티 목록 커서 페이지네이션: 최상위 글만 (created_at, id) 순으로 탐색
+CREATE INDEX IF NOT EXISTS ix_parent_forum_posts_top_created_id
+    ON parent_forum_posts (created_at, id) WHERE parent_id IS NULL;
+CREATE INDEX IF NOT EXISTS ix_reading_forum_posts_top_created_id
+    ON reading_forum_posts (created_at, id) WHERE parent_id IS NULL;
+
+-- 댓글 조회/카운트 재계산용
+CREATE INDEX IF NOT EXISTS ix_parent_forum_posts_parent_id
+    ON parent_forum_posts (parent_id) WHERE parent_id IS NOT NULL;
+CREATE INDEX IF NOT EXISTS ix_reading_forum_posts_parent_id
+    ON reading_forum_posts (parent_id) WHERE parent_id IS NOT NULL;
+
+-- 고객센터 질문 목록: 전체 / 처리 대기(open, in_progress) 큐 / 작성자별, 답변 조회
+CREATE INDEX IF NOT EXISTS ix_customer_support_top_created_id
+    ON customer_support (created_at, id) WHERE parent_id IS NULL;
+CREATE INDEX IF NOT EXISTS ix_customer_support_active_created_id
+    ON customer_support (created_at, id) WHERE parent_id IS NULL AND status IN ('open', 'in_progress');
+CREATE INDEX IF NOT EXISTS ix_customer_support_user_created_id
+    ON customer_support (user_id, created_at, id) WHERE parent_id IS NULL;
+CREATE INDEX IF NOT EXISTS ix_customer_support_parent_id
+    ON customer_support (parent_id) WHERE parent_id IS NOT NULL;
+
+-- 회원 탈퇴 시 ON DELETE CASCADE / 유저별 연결 계정 조회용
+CREATE INDEX IF NOT EXISTS ix_user_identities_user_id ON user_identities (user_id);
+
+-- 회원 탈퇴 시 ON DELETE CASCADE 용
+CREATE INDEX IF NOT EXISTS ix_leaderboard_entries_user_id ON leaderboard_entries (user_id);
+
+
+-- 마이그레이션 (기존 DB에 여러 번 실행해도 안전)
+ALTER TABLE parent_forum_posts ADD COLUMN IF NOT EXISTS comment_count INT NOT NULL DEFAULT 0;
+ALTER TABLE reading_forum_posts ADD COLUMN IF NOT EXISTS comment_count INT NOT NULL DEFAULT 0;
+ALTER TABLE customer_support ADD COLUMN IF NOT EXISTS resolved_at TIMESTAMP;
+ALTER TABLE words ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP DEFAULT NOW();
+-- 기존 카카오 회원 연결: 예전에는 name = 'kakao_{회원번호}' 로 찾았음
+-- google/naver 회원은 provider id가 저장돼 있지 않아서 다음 로그인 때 이메일(unique 인덱스)로 찾아 연결됨
+INSERT INTO user_identities (provider, provider_user_id, user_id)
+SELECT 'kakao', substring(name FROM 7), id
+FROM users
+WHERE oauth = 'kakao' AND name ~ '^kakao_[0-9]+$'
+ON CONFLICT DO NOTHING;
+
+
+-- 검색
+-- 한국어는 형태소 분석 없이도 잘 맞도록 단어를 2글자(bigram) 단위로 쪼개고, 단어의 마지막 글자도 따로 넣어 tsvector로 색인
+-- 예) '독서토론' → '독서 서토 토론 론', '책을' → '책을 을'
+-- 한 글자 검색어('책')는 '책:*' 접두어로 찾음 → 단어 중간/앞은 bigram('책을'), 끝은 마지막 글자('그림책' → '책')로 걸림
+CREATE OR REPLACE FUNCTION korean_terms(src text) RETURNS text
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT coalesce(string_agg(
+        CASE WHEN i < char_length(t.w) THEN substr(t.w, i, 2) ELSE right(t.w, 1) END, ' ' ORDER BY t.n, i), '')
+    FROM regexp_split_to_table(lower(coalesce(src, '')), '[^[:alnum:]가-힣ㄱ-ㅎㅏ-ㅣ]+') WITH ORDINALITY AS t(w, n)
+    CROSS JOIN LATERAL generate_series(1, char_length(t.w)) AS i
+    WHERE t.w <> ''
+$$;
+
+-- 검색어 → tsquery: 두 글자 이상은 bigram, 한 글자는 접두어 검색, 전부 AND
+-- 예) '꿈 이야기' → '꿈':* & '이야' & '야기'
+CREATE OR REPLACE FUNCTION korean_tsquery(src text) RETURNS tsquery
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT to_tsquery('simple', coalesce(string_agg(
+        CASE WHEN char_length(t.w) = 1 THEN quote_literal(t.w) || ':*' ELSE quote_literal(substr(t.w, i, 2)) END,
+        ' & ' ORDER BY t.n, i), ''))
+    FROM regexp_split_to_table(lower(coalesce(src, '')), '[^[:alnum:]가-힣ㄱ-ㅎㅏ-ㅣ]+') WITH ORDINALITY AS t(w, n)
+    CROSS JOIN LATERAL generate_series(1, greatest(char_length(t.w) - 1, 1)) AS i
+    WHERE t.w <> ''
+$$;
+
+-- 쓰기 시점에 DB가 계산하는 검색 컬럼 (제목 A, 카테고리/도서명·태그 B, 본문 C 가중치)
+ALTER TABLE parent_forum_posts ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', korean_terms(title)), 'A') ||
+        setweight(to_tsvector('simple', korean_terms(category)), 'B') ||
+        setweight(to_tsvector('simple', korean_terms(content)), 'C')
+    ) STORED;
+ALTER TABLE reading_forum_posts ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', korean_terms(title)), 'A') ||
+        setweight(to_tsvector('simple', korean_terms(coalesce(book_title, '') || ' ' || coalesce(discussion_tags, ''))), 'B') ||
+        setweight(to_tsvector('simple', korean_terms(content)), 'C')
+    ) STORED;
+CREATE INDEX IF NOT EXISTS ix_parent_forum_posts_search
+    ON parent_forum_posts USING gin (search_vector) WHERE parent_id IS NULL;
+CREATE INDEX IF NOT EXISTS ix_reading_forum_posts_search
+    ON reading_forum_posts USING gin (search_vector) WHERE parent_id IS NULL;
+
+
+-- 트리거
+-- comment_count 유지: 댓글 INSERT/DELETE(FK ON DELETE CASCADE로 지워지는 경우 포함)와 parent_id 변경 시 부모글 카운트 갱신
+-- 기존 데이터 보정은 python -m data.reconcile_comment_count
+CREATE OR REPLACE FUNCTION forum_comment_count_trg() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.parent_id IS NOT NULL THEN
+        EXECUTE format('UPDATE %I SET comment_count = comment_count + 1 WHERE id = $1', TG_TABLE_NAME) USING NEW.parent_id;
+    END IF;
+    IF TG_OP IN ('DELETE', 'UPDATE') AND OLD.parent_id IS NOT NULL THEN
+        EXECUTE format('UPDATE %I SET comment_count = comment_count - 1 WHERE id = $1', TG_TABLE_NAME) USING OLD.parent_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS parent_forum_posts_comment_count ON parent_forum_posts;
+CREATE TRIGGER parent_forum_posts_comment_count
+    AFTER INSERT OR DELETE ON parent_forum_posts
+    FOR EACH ROW EXECUTE FUNCTION forum_comment_count_trg();
+DROP TRIGGER IF EXISTS parent_forum_posts_comment_move ON parent_forum_posts;
+CREATE TRIGGER parent_forum_posts_comment_move
+    AFTER UPDATE OF parent_id ON parent_forum_posts
+    FOR EACH ROW WHEN (OLD.parent_id IS DISTINCT FROM NEW.parent_id)
+    EXECUTE FUNCTION forum_comment_count_trg();
+
+DROP TRIGGER IF EXISTS reading_forum_posts_comment_count ON reading_forum_posts;
+CREATE TRIGGER reading_forum_posts_comment_count
+    AFTER INSERT OR DELETE ON reading_forum_posts
+    FOR EACH ROW EXECUTE FUNCTION forum_comment_count_trg();
+DROP TRIGGER IF EXISTS reading_forum_posts_comment_move ON reading_forum_posts;
+CREATE TRIGGER reading_forum_posts_comment_move
+    AFTER UPDATE OF parent_id ON reading_forum_posts
+    FOR EACH ROW WHEN (OLD.parent_id IS DISTINCT FROM NEW.parent_id)
+    EXECUTE FUNCTION forum_comment_count_trg();
+
+-- 고객센터 대시보드 집계 유지
+-- 해결 시간 구간: 1분 미만은 0, 이후 1/4 옥타브(약 19%) 간격 → 구간 b의 하한은 60 * 2^(b/4) 초
+CREATE OR REPLACE FUNCTION support_resolve_bucket(seconds double precision) RETURNS smallint
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT floor(4 * ln(greatest(seconds, 60) / 60.0) / ln(2))::smallint
+$$;
+
+-- resolved/closed로 바뀌는 시점 기록 (resolved → closed는 처음 해결 시각 유지, 다시 열리면 지움)
+CREATE OR REPLACE FUNCTION customer_support_resolved_at_trg() RETURNS trigger AS $$
+BEGIN
+    IF NEW.status IN ('resolved', 'closed') THEN
+        NEW.resolved_at := coalesce(NEW.resolved_at, now());
+    ELSE
+        NEW.resolved_at := NULL;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 질문 한 건을 집계에 더하거나(+1) 뺌(-1)
+CREATE OR REPLACE FUNCTION customer_support_stats_bump(t customer_support, delta int) RETURNS void AS $$
+BEGIN
+    IF t.parent_id IS NOT NULL THEN
+        RETURN;
+    END IF;
+    INSERT INTO customer_support_stats AS s (day, status, category, tickets)
+    VALUES (coalesce(t.created_at, now())::date, coalesce(t.status, 'open'), coalesce(t.category, ''), delta)
+    ON CONFLICT (day, status, category) DO UPDATE SET tickets = s.tickets + EXCLUDED.tickets;
+    IF t.resolved_at IS NOT NULL THEN
+        INSERT INTO customer_support_resolve_hist AS h (bucket, tickets)
+        VALUES (support_resolve_bucket(extract(epoch FROM t.resolved_at - t.created_at)), delta)
+        ON CONFLICT (bucket) DO UPDATE SET tickets = h.tickets + EXCLUDED.tickets;
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION customer_support_stats_trg() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('DELETE', 'UPDATE') THEN
+        PERFORM customer_support_stats_bump(OLD, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM customer_support_stats_bump(NEW, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS customer_support_resolved_at ON customer_support;
+CREATE TRIGGER customer_support_resolved_at
+    BEFORE INSERT OR UPDATE OF status ON customer_support
+    FOR EACH ROW EXECUTE FUNCTION customer_support_resolved_at_trg();
+DROP TRIGGER IF EXISTS customer_support_stats ON customer_support;
+CREATE TRIGGER customer_support_stats
+    AFTER INSERT OR DELETE ON customer_support
+    FOR EACH ROW EXECUTE FUNCTION customer_support_stats_trg();
+DROP TRIGGER IF EXISTS customer_support_stats_move ON customer_support;
+CREATE TRIGGER customer_support_stats_move
+    AFTER UPDATE OF status, category, parent_id, created_at ON customer_support
+    FOR EACH ROW WHEN (
+        OLD.status IS DISTINCT FROM NEW.status OR OLD.category IS DISTINCT FROM NEW.category
+        OR OLD.parent_id IS DISTINCT FROM NEW.parent_id OR OLD.created_at IS DISTINCT FROM NEW.created_at
+    )
+    EXECUTE FUNCTION customer_support_stats_trg();
+
+-- 단어 수정 시각 유지 (서버의 임베딩 인덱스가 바뀐 단어만 다시 읽음, app/words/embedding_index.py)
+CREATE OR REPLACE FUNCTION words_touch_trg() RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS words_touch ON words;
+CREATE TRIGGER words_touch
+    BEFORE UPDATE ON words
+    FOR EACH ROW WHEN (OLD.* IS DISTINCT FROM NEW.*)
+    EXECUTE FUNCTION words_touch_trg();
@@ -0,0 +1,75 @@
+# 임베딩 파일 저장소 export (app/words/embedding_store.py)
+# 사용법: python -m data.export_embeddings --dir /srv/dodam/embeddings [--quantize int8]
+# words.embedding 을 정규화된 float32(또는 int8) 파일로 쓰고 새 버전으로 공개한다.
+# 서버는 WORD_EMBEDDING_STORE_DIR 로 같은 디렉터리를 가리키면 WORD_INDEX_REFRESH_SECONDS 마다 새 버전으로 넘어감.
+# 단어가 WORD_ANN_MIN_WORDS 이상이면 ANN(IVF) 인덱스도 여기서 한 번 만들어 같이 저장 (워커는 k-means 없이 mmap)
+import argparse
+import os
+import time
+from collections import Counter
+
+import numpy as np
+from sqlalchemy import any_, func, literal, select
+
+from app.models import Words
+from app.words.ann_index import IVFIndex
+from app.words.embedding_index import WORD_ANN_MIN_WORDS, WORD_ANN_NLIST
+from app.words.embedding_store import WORD_EMBEDDING_STORE_DIR, StoreWriter, dequantize
+from app.words.vectors import normalize
+from data.postgresDB import engine
+
+CHUNK = 10000
+
+
+def export_words(root, dtype="float32", ann=None, keep=2):
+    start = time.perf_counter()
+    # 0 벡터는 정규화해도 0이라 검색에 쓸 수 없음 (DB 모드의 embedding_index 와 같은 집합만 내보냄)
+    has_vector = Words.embedding.is_not(None) & (literal(0.0) != any_(Words.embedding))
+    # 행 수 세기와 읽기를 같은 스냅숏에서 (그 사이 단어가 추가/변경돼도 행 수가 맞도록)
+    with engine.connect().execution_options(isolation_level="REPEATABLE READ") as conn:
+        # 가장 많은 차원만 내보냄 (다른 차원은 검색할 수 없으므로 제외)
+        dims = Counter(dict(conn.execute(
+            select(func.cardinality(Words.embedding), func.count()).where(has_vector)
+            .group_by(func.cardinality(Words.embedding))
+        ).all()))
+        dims.pop(0, None)
+        dims.pop(None, None)
+        if not dims:
+            print("words: 임베딩 없음, 건너뜀")
+            return None
+        dim, count = dims.most_common(1)[0]
+
+        query = (select(Words.word_id, Words.embedding, Words.word_text)
+                 .where(has_vector, func.cardinality(Words.embedding) == dim).order_by(Words.word_id))
+        writer = StoreWriter(root, "words", count, dim, dtype)
+        try:
+            # 서버 측 커서로 나눠 읽어서 바로 파일에 씀
+            for rows in conn.execution_options(stream_results=True, yield_per=CHUNK).execute(query).partitions():
+                vectors = normalize(np.array([row[1] for row in rows], dtype=np.float32))
+                writer.write([row[0] for row in rows], vectors, texts=[row[2] for row in rows])
+
+            built_ann = ann if ann is not None else count >= WORD_ANN_MIN_WORDS
+            if built_ann:
+                matrix = dequantize(writer.vectors, writer.scales)
+                writer.write_ann(IVFIndex.build(normalize(matrix), nlist=WORD_ANN_NLIST or None))
+            version = writer.publish(keep=keep, source="words", skipped=sum(dims.values()) - count, ann=bool(built_ann))
+        except BaseException:
+            writer.abort()
+            raise
+
+    size = sum(os.path.getsize(os.path.join(writer.path, f)) for f in os.listdir(writer.path))
+    print(f"words: {count}행 × {dim}차원 ({dtype}) → {version} "
+          f"({size / 2 ** 20:.1f}MB, {time.perf_counter() - start:.1f}s, 차원이 달라 제외 {sum(dims.values()) - count})")
+    return version
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dir", default=WORD_EMBEDDING_STORE_DIR, help="저장 디렉터리 (기본 WORD_EMBEDDING_STORE_DIR)")
+    parser.add_argument("--quantize", choices=["float32", "int8"], default="float32")
+    parser.add_argument("--ann", choices=["auto", "yes", "no"], default="auto", help="words ANN 인덱스 (auto: WORD_ANN_MIN_WORDS 기준)")
+    parser.add_argument("--keep", type=int, default=2, help="남겨 둘 이전 버전 수 (현재 포함)")
+    args = parser.parse_args()
+    if not args.dir:
+        parser.error("--dir 또는 WORD_EMBEDDING_STORE_DIR 이 필요합니다.")
+    os.makedirs(args.dir, exist_ok=True)
+    export_words(args.dir, dtype=args.quantize, ann=None if args.ann == "auto" else args.ann == "yes", keep=args.keep)
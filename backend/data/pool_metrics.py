@@ -0,0 +1,134 @@
+# 커넥션 풀 상태 계측
+# - 체크아웃 대기시간 히스토그램, 사용중/overflow 커넥션 수, 타임아웃 횟수
+# - 풀 이벤트(connect/checkout/checkin/invalidate)와 _do_get 타이밍으로 수집
+import threading
+import time
+
+from sqlalchemy import event, exc
+
+# 체크아웃 대기시간 버킷 경계 (ms), 마지막 버킷은 +Inf
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+# 엔진 이름 → PoolMetrics
+POOL_METRICS = {}
+
+
+class PoolMetrics:
+    def __init__(self, name):
+        self.name = name
+        self._lock = threading.Lock()
+        self.wait_buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        self.wait_count = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.timeouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.in_use = 0
+        self.in_use_peak = 0
+        self.pool = None
+
+    def observe_wait(self, seconds):
+        ms = seconds * 1000
+        idx = len(WAIT_BUCKETS_MS)
+        for i, bound in enumerate(WAIT_BUCKETS_MS):
+            if ms <= bound:
+                idx = i
+                break
+        with self._lock:
+            self.wait_buckets[idx] += 1
+            self.wait_count += 1
+            self.wait_total += seconds
+            self.wait_max = max(self.wait_max, seconds)
+
+    def observe_timeout(self, seconds):
+        with self._lock:
+            self.timeouts += 1
+            self.wait_max = max(self.wait_max, seconds)
+
+    def on_connect(self, dbapi_conn, record):
+        with self._lock:
+            self.connects += 1
+
+    def on_checkout(self, dbapi_conn, record, proxy):
+        with self._lock:
+            self.in_use += 1
+            self.in_use_peak = max(self.in_use_peak, self.in_use)
+
+    def on_checkin(self, dbapi_conn, record):
+        with self._lock:
+            self.in_use = max(0, self.in_use - 1)
+
+    def on_invalidate(self, dbapi_conn, record, exception):
+        with self._lock:
+            self.invalidations += 1
+
+    def snapshot(self):
+        pool = self.pool
+        with self._lock:
+            histogram = {f"le_{bound}ms": count for bound, count in zip(WAIT_BUCKETS_MS, self.wait_buckets)}
+            histogram["le_inf"] = self.wait_buckets[-1]
+            data = {
+                "checkout_wait": {
+                    "count": self.wait_count,
+                    "avg_ms": round(self.wait_total / self.wait_count * 1000, 3) if self.wait_count else 0.0,
+                    "max_ms": round(self.wait_max * 1000, 3),
+                    "histogram": histogram,
+                },
+                "timeouts": self.timeouts,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "in_use": self.in_use,
+                "in_use_peak": self.in_use_peak,
+            }
+        if pool is not None and hasattr(pool, "overflow"):
+            data.update(
+                pool_size=pool.size(),
+                checked_out=pool.checkedout(),
+                checked_in=pool.checkedin(),
+                # QueuePool.overflow()는 -pool_size 에서 시작하므로 0 미만이면 overflow 없음
+                overflow=max(0, pool.overflow()),
+                max_overflow=pool._max_overflow,
+                timeout=pool.timeout(),
+            )
+        return data
+
+
+class _TimedGetMixin:
+    # 커넥션을 얻기까지 걸린 시간(대기 포함)을 잰다. 풀이 가득 차면 여기서 블록된다.
+    metrics = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.observe_timeout(time.perf_counter() - start)
+            raise
+        self.metrics.observe_wait(time.perf_counter() - start)
+        return conn
+
+
+def instrumented_poolclass(base, metrics):
+    # dispose() 시 pool.recreate()는 self.__class__를 쓰므로 metrics가 유지된다
+    return type(f"Instrumented{base.__name__}", (_TimedGetMixin, base), {"metrics": metrics})
+
+
+def register(name):
+    metrics = POOL_METRICS.get(name)
+    if metrics is None:
+        metrics = POOL_METRICS[name] = PoolMetrics(name)
+    return metrics
+
+
+def attach(engine, metrics):
+    # AsyncEngine이면 내부 sync_engine에 이벤트를 단다
+    sync_engine = getattr(engine, "sync_engine", engine)
+    metrics.pool = sync_engine.pool
+    event.listen(sync_engine, "connect", metrics.on_connect)
+    event.listen(sync_engine, "checkout", metrics.on_checkout)
+    event.listen(sync_engine, "checkin", metrics.on_checkin)
+    event.listen(sync_engine, "invalidate", metrics.on_invalidate)
+    # dispose()로 풀이 새로 만들어지면 snapshot이 새 풀을 보도록 갱신
+    event.listen(sync_engine, "engine_disposed", lambda eng: setattr(metrics, "pool", eng.pool))
+    return engine
@@ -1,13 +1,109 @@
 import os
+import time
 from dotenv import load_dotenv
 load_dotenv()  # .env 파일 자동 로드
 
+from fastapi import Request
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from data import pool_metrics, sql_profiler
 
 DATABASE_URL = os.getenv("DATABASE_URL")  # 환경변수로 관리 추천
+# 비동기 드라이버(asyncpg) URL, 따로 지정하지 않으면 DATABASE_URL에서 드라이버만 바꿔서 사용
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or make_url(DATABASE_URL).set(drivername="postgresql+asyncpg")
+# 읽기 전용 복제본, 설정하지 않으면 primary를 그대로 사용
+REPLICA_DATABASE_URL = os.getenv("REPLICA_DATABASE_URL")
+ASYNC_REPLICA_DATABASE_URL = os.getenv("ASYNC_REPLICA_DATABASE_URL") or (
+    make_url(REPLICA_DATABASE_URL).set(drivername="postgresql+asyncpg") if REPLICA_DATABASE_URL else None
+)
+# 쓰기 직후 이 시간(초) 동안은 같은 클라이언트의 읽기를 primary로 보냄 (복제 지연 대비)
+READ_YOUR_WRITES_SECONDS = int(os.getenv("DB_READ_YOUR_WRITES_SECONDS", "5"))
+PRIMARY_STICKY_COOKIE = "db_primary_until"
+
+# ✅ 커넥션 풀 설정 (워커 수 × (POOL_SIZE + MAX_OVERFLOW) 가 DB max_connections 를 넘지 않게)
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))   # 커넥션 대기 최대 시간(초)
+POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))   # 이 시간(초)보다 오래된 커넥션은 재연결
+POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+
+
+def pool_options(poolclass):
+    return dict(
+        poolclass=poolclass,
+        pool_size=POOL_SIZE,
+        max_overflow=MAX_OVERFLOW,
+        pool_timeout=POOL_TIMEOUT,
+        pool_recycle=POOL_RECYCLE,
+        pool_pre_ping=POOL_PRE_PING,
+    )
 
-engine = create_engine(DATABASE_URL)
+
+# 동기 엔진: 백필/배치 스크립트용
+sync_metrics = pool_metrics.register("sync")
+engine = pool_metrics.attach(
+    create_engine(DATABASE_URL, **pool_options(pool_metrics.instrumented_poolclass(QueuePool, sync_metrics))),
+    sync_metrics,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-Base = declarative_base()
\ No newline at end of file
+
+# ✅ 비동기 엔진: 라우터는 전부 이쪽을 사용 (이벤트 루프를 막지 않음)
+primary_metrics = pool_metrics.register("primary")
+async_engine = pool_metrics.attach(
+    create_async_engine(ASYNC_DATABASE_URL, **pool_options(pool_metrics.instrumented_poolclass(AsyncAdaptedQueuePool, primary_metrics))),
+    primary_metrics,
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
+# ✅ 읽기 복제본 엔진: GET 전용 핸들러가 사용
+if ASYNC_REPLICA_DATABASE_URL:
+    replica_metrics = pool_metrics.register("replica")
+    replica_engine = pool_metrics.attach(
+        create_async_engine(ASYNC_REPLICA_DATABASE_URL, **pool_options(pool_metrics.instrumented_poolclass(AsyncAdaptedQueuePool, replica_metrics))),
+        replica_metrics,
+    )
+    ReplicaSessionLocal = async_sessionmaker(replica_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+else:
+    replica_engine = async_engine
+    ReplicaSessionLocal = AsyncSessionLocal
+
+if sql_profiler.SQL_PROFILE_ENABLED:
+    for _engine in {engine, async_engine, replica_engine}:
+        sql_profiler.attach(_engine)
+Base = declarative_base()
+
+
+async def get_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def is_primary_sticky(request: Request):
+    try:
+        return float(request.cookies.get(PRIMARY_STICKY_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+def mark_primary_sticky(response):
+    # 쓰기 요청이 성공하면 호출, 잠시 동안 이 클라이언트의 읽기는 primary에서 처리
+    response.set_cookie(
+        PRIMARY_STICKY_COOKIE,
+        str(time.time() + READ_YOUR_WRITES_SECONDS),
+        max_age=READ_YOUR_WRITES_SECONDS,
+        httponly=True,
+        samesite="lax",
+    )
+
+
+async def get_read_db(request: Request):
+    # 읽기 전용 세션: 복제본으로 보내되, 방금 쓰기를 한 클라이언트는 primary로 (read-your-writes)
+    session_factory = AsyncSessionLocal if is_primary_sticky(request) else ReplicaSessionLocal
+    async with session_factory() as db:
+        yield db
@@ -0,0 +1,46 @@
+# comment_count 백필/보정 (한 번 실행하는 배치)
+# 사용법: python -m data.reconcile_comment_count [--dry-run]
+# 트리거 도입 전 데이터나, 트리거 없이 들어간 데이터의 comment_count를 실제 직계 댓글 수로 맞춘다.
+import argparse
+
+from sqlalchemy import text
+
+from data.postgresDB import engine
+
+TABLES = ("parent_forum_posts", "reading_forum_posts")
+
+# 실제 댓글 수와 다른 행만 갱신
+RECONCILE_SQL = """
+UPDATE {table} AS p
+SET comment_count = c.actual
+FROM (
+    SELECT p2.id, COUNT(ch.id) AS actual
+    FROM {table} AS p2
+    LEFT JOIN {table} AS ch ON ch.parent_id = p2.id
+    GROUP BY p2.id
+) AS c
+WHERE p.id = c.id AND p.comment_count IS DISTINCT FROM c.actual
+"""
+
+
+def reconcile(dry_run=False):
+    fixed = {}
+    with engine.connect() as conn:
+        for table in TABLES:
+            # 보정 중에 댓글이 추가/삭제되어 카운트가 어긋나지 않도록 테이블 쓰기를 잠깐 막음
+            conn.execute(text(f"LOCK TABLE {table} IN SHARE ROW EXCLUSIVE MODE"))
+            result = conn.execute(text(RECONCILE_SQL.format(table=table)))
+            fixed[table] = result.rowcount
+        if dry_run:
+            conn.rollback()
+        else:
+            conn.commit()
+    return fixed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dry-run", action="store_true", help="몇 건이 틀렸는지만 확인하고 롤백")
+    args = parser.parse_args()
+    for table, count in reconcile(args.dry_run).items():
+        print(f"{table}: {count}건 {'불일치' if args.dry_run else '보정'}")
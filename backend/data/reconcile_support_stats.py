@@ -0,0 +1,76 @@
+# 고객센터 대시보드 집계 백필/보정
+# 사용법: python -m data.reconcile_support_stats [--dry-run]
+# customer_support_stats / customer_support_resolve_hist 를 원본 질문 데이터로 다시 계산한다.
+# 서버에서 SUPPORT_STATS_RECONCILE_SECONDS 를 설정하면 주기적으로도 실행됨 (app/customer_center/dashboard.py)
+import argparse
+
+from sqlalchemy import text
+
+from data.postgresDB import engine
+
+# 여러 워커/크론이 동시에 돌려도 한 곳에서만 보정하도록 하는 advisory lock 키
+LOCK_KEY = 5401
+
+# 트리거 도입 전에 해결된 질문은 해결 시각을 모르므로 마지막 수정 시각으로 대신함
+BACKFILL_RESOLVED_AT_SQL = """
+UPDATE customer_support SET resolved_at = updated_at
+WHERE parent_id IS NULL AND status IN ('resolved', 'closed') AND resolved_at IS NULL
+"""
+
+ACTUAL_STATS_SQL = """
+SELECT coalesce(created_at, now())::date AS day, coalesce(status, 'open') AS status,
+       coalesce(category, '') AS category, count(*) AS tickets
+FROM customer_support WHERE parent_id IS NULL
+GROUP BY 1, 2, 3
+"""
+
+ACTUAL_HIST_SQL = """
+SELECT support_resolve_bucket(extract(epoch FROM resolved_at - created_at)) AS bucket, count(*) AS tickets
+FROM customer_support WHERE parent_id IS NULL AND resolved_at IS NOT NULL
+GROUP BY 1
+"""
+
+# 저장된 집계와 실제 값이 다른 행 수 (0건 행은 없는 것과 같게 취급)
+MISMATCH_SQL = """
+SELECT count(*) FROM ({actual}) AS a
+FULL JOIN (SELECT * FROM {table} WHERE tickets <> 0) AS s USING ({keys})
+WHERE a.tickets IS DISTINCT FROM s.tickets
+"""
+
+TARGETS = (
+    ("customer_support_stats", "day, status, category", ACTUAL_STATS_SQL),
+    ("customer_support_resolve_hist", "bucket", ACTUAL_HIST_SQL),
+)
+
+
+def reconcile(dry_run=False):
+    fixed = {}
+    with engine.connect() as conn:
+        if not conn.execute(text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": LOCK_KEY}).scalar():
+            conn.rollback()
+            return None  # 다른 곳에서 보정 중
+        # 보정 중에 질문이 추가/변경되어 집계가 어긋나지 않도록 쓰기를 잠깐 막음
+        conn.execute(text("LOCK TABLE customer_support IN SHARE ROW EXCLUSIVE MODE"))
+        fixed["resolved_at"] = conn.execute(text(BACKFILL_RESOLVED_AT_SQL)).rowcount
+        for table, keys, actual in TARGETS:
+            fixed[table] = conn.execute(text(MISMATCH_SQL.format(actual=actual, table=table, keys=keys))).scalar()
+            if fixed[table]:
+                conn.execute(text(f"DELETE FROM {table}"))
+                conn.execute(text(f"INSERT INTO {table} ({keys}, tickets) SELECT {keys}, tickets FROM ({actual}) AS a"))
+        if dry_run:
+            conn.rollback()
+        else:
+            conn.commit()
+    return fixed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dry-run", action="store_true", help="몇 건이 틀렸는지만 확인하고 롤백")
+    args = parser.parse_args()
+    result = reconcile(args.dry_run)
+    if result is None:
+        print("다른 프로세스가 보정 중입니다.")
+    else:
+        for table, count in result.items():
+            print(f"{table}: {count}건 {'불일치' if args.dry_run else '보정'}")
@@ -0,0 +1,145 @@
+# 요청 단위 SQL 프로파일러
+# - before/after_cursor_execute 이벤트로 쿼리 수, SQL 총 시간, 반복되는 쿼리 모양(statement)을 기록
+# - 같은 모양의 쿼리가 한 요청에서 N_PLUS_ONE_THRESHOLD번 이상 나오면 N+1 의심으로 표시
+# - 라우트별로 누적해서 /internal/sql/profile 에서 확인
+import os
+import re
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+
+from sqlalchemy import event
+
+# 요청마다 이벤트 훅/미들웨어 비용이 붙으므로 기본은 꺼 둠 (개발/부하 테스트 때 SQL_PROFILE_ENABLED=true)
+SQL_PROFILE_ENABLED = os.getenv("SQL_PROFILE_ENABLED", "false").lower() == "true"
+# 디버그 모드에서는 응답 헤더(X-SQL-*)로도 내려줌
+SQL_PROFILE_DEBUG = os.getenv("SQL_PROFILE_DEBUG", "false").lower() == "true"
+N_PLUS_ONE_THRESHOLD = int(os.getenv("SQL_N_PLUS_ONE_THRESHOLD", "5"))
+
+_current = ContextVar("sql_profile", default=None)
+_WHITESPACE = re.compile(r"\s+")
+# IN (...) 목록 길이가 달라도 같은 모양으로 취급
+_IN_LIST = re.compile(r"IN \([^)]*\)", re.IGNORECASE)
+
+
+def statement_shape(statement):
+    return _IN_LIST.sub("IN (...)", _WHITESPACE.sub(" ", statement).strip())
+
+
+class RequestProfile:
+    __slots__ = ("query_count", "sql_time", "shapes")
+
+    def __init__(self):
+        self.query_count = 0
+        self.sql_time = 0.0
+        self.shapes = Counter()
+
+    def record(self, statement, elapsed):
+        self.query_count += 1
+        self.sql_time += elapsed
+        self.shapes[statement_shape(statement)] += 1
+
+    def n_plus_one(self):
+        return {shape: count for shape, count in self.shapes.items() if count >= N_PLUS_ONE_THRESHOLD}
+
+
+class RouteStats:
+    __slots__ = ("requests", "queries", "sql_time", "max_queries", "n_plus_one_requests", "suspects")
+
+    def __init__(self):
+        self.requests = 0
+        self.queries = 0
+        self.sql_time = 0.0
+        self.max_queries = 0
+        self.n_plus_one_requests = 0
+        self.suspects = Counter()
+
+
+class ProfileReport:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.routes = {}
+
+    def add(self, route, profile):
+        suspects = profile.n_plus_one()
+        with self._lock:
+            stats = self.routes.get(route)
+            if stats is None:
+                stats = self.routes[route] = RouteStats()
+            stats.requests += 1
+            stats.queries += profile.query_count
+            stats.sql_time += profile.sql_time
+            stats.max_queries = max(stats.max_queries, profile.query_count)
+            if suspects:
+                stats.n_plus_one_requests += 1
+                stats.suspects.update(suspects)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                route: {
+                    "requests": s.requests,
+                    "avg_queries": round(s.queries / s.requests, 2),
+                    "max_queries": s.max_queries,
+                    "avg_sql_ms": round(s.sql_time / s.requests * 1000, 3),
+                    "total_sql_ms": round(s.sql_time * 1000, 3),
+                    "n_plus_one_requests": s.n_plus_one_requests,
+                    "n_plus_one_suspects": [
+                        {"statement": shape, "executions": count} for shape, count in s.suspects.most_common(5)
+                    ],
+                }
+                for route, s in sorted(self.routes.items(), key=lambda item: -item[1].sql_time)
+            }
+
+    def reset(self):
+        with self._lock:
+            self.routes.clear()
+
+
+report = ProfileReport()
+
+
+def start():
+    profile = RequestProfile()
+    return profile, _current.set(profile)
+
+
+def finish(token):
+    _current.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("sql_profile_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["sql_profile_start"].pop()
+    profile = _current.get()
+    if profile is not None:
+        profile.record(statement, time.perf_counter() - started)
+
+
+def _handle_error(exception_context):
+    # 실행 중 에러가 나면 after_cursor_execute가 호출되지 않으므로 시작 시각을 정리
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("sql_profile_start"):
+        conn.info["sql_profile_start"].pop()
+
+
+def attach(engine):
+    # AsyncEngine이면 내부 sync_engine에 이벤트를 단다
+    sync_engine = getattr(engine, "sync_engine", engine)
+    if not event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(sync_engine, "handle_error", _handle_error)
+    return engine
+
+
+def set_debug_headers(response, profile):
+    response.headers["X-SQL-Count"] = str(profile.query_count)
+    response.headers["X-SQL-Time-ms"] = f"{profile.sql_time * 1000:.3f}"
+    suspects = profile.n_plus_one()
+    if suspects:
+        response.headers["X-SQL-N-Plus-One"] = str(max(suspects.values()))